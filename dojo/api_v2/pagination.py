@@ -0,0 +1,27 @@
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+
+    """
+    Pages through the results ordered by id, by fetching the results after the last id of
+    the previous page instead of skipping an offset. The total number of results is not counted.
+    """
+
+    ordering = "id"
+    page_size_query_param = "limit"
+
+
+class CursorPaginationMixin:
+
+    """
+    Lets clients opt in to cursor pagination of the list with `?pagination=cursor`, which
+    stays fast for the last pages of large lists. By default, limit/offset pagination is used
+    """
+
+    @property
+    def paginator(self):
+        query_params = getattr(getattr(self, "request", None), "query_params", {})
+        if not hasattr(self, "_paginator") and self.pagination_class is not None and query_params.get("pagination") == "cursor":
+            self._paginator = IdCursorPagination()
+        return super().paginator
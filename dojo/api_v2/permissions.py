@@ -694,9 +694,10 @@ class UserHasTestImportPermission(permissions.BasePermission):
         )
 
     def has_object_permission(self, request, view, obj):
+        # asynchronous import jobs only have an engagement until the new test has been created
         return check_object_permission(
             request,
-            obj.test,
+            obj.test or obj.engagement,
             Permissions.Test_View,
             Permissions.Test_Edit,
             Permissions.Test_Delete,
@@ -1486,7 +1486,24 @@ class TestImportSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Test_Import
-        fields = "__all__"
+        exclude = ("scan_file",)
+
+
+class ImportJobProgressSerializer(serializers.Serializer):
+    parsed = serializers.IntegerField(required=False, help_text="Number of findings read from the report")
+    matched = serializers.IntegerField(required=False, help_text="Number of findings matched to existing findings of the test by a reimport")
+    created = serializers.IntegerField(required=False)
+    closed = serializers.IntegerField(required=False)
+    reactivated = serializers.IntegerField(required=False)
+    untouched = serializers.IntegerField(required=False)
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    progress = ImportJobProgressSerializer(read_only=True, allow_null=True)
+
+    class Meta:
+        model = Test_Import
+        fields = ("id", "type", "status", "progress", "error", "test", "engagement", "created", "modified")
 
 
 class RiskAcceptanceSerializer(serializers.ModelSerializer):
@@ -1698,6 +1715,13 @@ class FindingSerializer(serializers.ModelSerializer):
             "inherited_tags",
         )
 
+    def get_fields(self):
+        fields = super().get_fields()
+        # only the fields selected with ?fields= are returned
+        if requested_fields := self.context.get("fields"):
+            fields = {name: field for name, field in fields.items() if name in requested_fields}
+        return fields
+
     @extend_schema_field(serializers.DateTimeField())
     def get_jira_creation(self, obj):
         return jira_helper.get_jira_creation(obj)
@@ -2159,6 +2183,13 @@ class CommonImportScanSerializer(serializers.Serializer):
         help_text="If set to True, the tags will be applied to the endpoints",
         required=False,
     )
+    async_import = serializers.BooleanField(
+        help_text="If set to True, the report is imported in the background. The response is returned right away "
+        "with the id of an import job, which reports the progress of the import at /api/v2/import-jobs/{id}/",
+        required=False,
+        default=False,
+    )
+    import_job_id = serializers.IntegerField(read_only=True)
 
     def get_importer(
         self,
@@ -2205,9 +2236,37 @@ class CommonImportScanSerializer(serializers.Serializer):
         except ValueError as ve:
             raise Exception(ve)
 
+    def start_import_job(
+        self,
+        data: dict,
+        context: dict,
+        import_type: str,
+    ) -> None:
+        """
+        Stores the uploaded report on a new import job and processes it in the background.
+        The progress of the import is recorded on the import job, so only its id is returned
+        """
+        from dojo.tasks import process_import_job
+        test = context.get("test")
+        # the report is read from the import job in the background
+        context.pop("file", None)
+        import_job = Test_Import.objects.create(
+            test=test,
+            engagement=test.engagement if test else context.get("engagement"),
+            type=import_type,
+            status=Test_Import.STATUS_PENDING,
+            progress={},
+            scan_file=context.pop("scan", None),
+        )
+        process_import_job(import_job.id, context)
+        data["import_job_id"] = import_job.id
+
     def validate(self, data: dict) -> dict:
         scan_type = data.get("scan_type")
         file = data.get("file")
+        if data.get("async_import") and not file:
+            msg = "Uploading a Report File is required for an asynchronous import"
+            raise serializers.ValidationError(msg)
         if not file and requires_file(scan_type):
             msg = f"Uploading a Report File is required for {scan_type}"
             raise serializers.ValidationError(msg)
@@ -2359,8 +2418,11 @@ class ImportScanSerializer(CommonImportScanSerializer):
         context = self.set_context(data)
         # set the jira option again as it was overridden
         context["push_to_jira"] = push_to_jira
-        # Import the scan with all of the supplied data
-        self.process_scan(data, context)
+        # Import the scan with all of the supplied data, in the background if requested
+        if data.get("async_import"):
+            self.start_import_job(data, context, Test_Import.IMPORT_TYPE)
+        else:
+            self.process_scan(data, context)
 
 
 class ReImportScanSerializer(CommonImportScanSerializer):
@@ -2508,8 +2570,31 @@ class ReImportScanSerializer(CommonImportScanSerializer):
         # Process the auto create context inputs
         auto_create_manager = AutoCreateContextManager()
         self.process_auto_create_create_context(auto_create_manager, context)
-        # Import the scan with all of the supplied data
-        self.process_scan(auto_create_manager, data, context)
+        # Import the scan with all of the supplied data, in the background if requested
+        if data.get("async_import"):
+            self.start_reimport_job(auto_create_manager, data, context)
+        else:
+            self.process_scan(auto_create_manager, data, context)
+
+    def start_reimport_job(
+        self,
+        auto_create_manager: AutoCreateContextManager,
+        data: dict,
+        context: dict,
+    ) -> None:
+        """
+        Determines the test to reimport into, or the engagement to create the test in, before
+        the report is processed in the background in the same way as in process_scan
+        """
+        if context.get("test"):
+            self.start_import_job(data, context, Test_Import.REIMPORT_TYPE)
+        elif context.get("auto_create_context"):
+            logger.debug("reimport for non-existing test, using import to create new test")
+            context["engagement"] = auto_create_manager.get_or_create_engagement(**context)
+            self.start_import_job(data, context, Test_Import.IMPORT_TYPE)
+        else:
+            msg = "A test could not be found!"
+            raise NotFound(msg)
 
 
 class EndpointMetaImporterSerializer(serializers.Serializer):
@@ -1,4 +1,5 @@
 import base64
+import contextlib
 import logging
 import mimetypes
 from datetime import datetime
@@ -9,7 +10,7 @@ from crum import get_current_user
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from django.contrib.auth.models import Permission
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import IntegrityError
 from django.http import FileResponse, Http404, HttpResponse
 from django.shortcuts import get_object_or_404
@@ -40,6 +41,7 @@ from dojo.api_v2 import (
     prefetch,
     serializers,
 )
+from dojo.api_v2.pagination import CursorPaginationMixin
 from dojo.authorization.roles_permissions import Permissions
 from dojo.cred.queries import get_authorized_cred_mappings
 from dojo.endpoint.queries import (
@@ -54,6 +56,7 @@ from dojo.filters import (
     ApiCredentialsFilter,
     ApiDojoMetaFilter,
     ApiEndpointFilter,
+    ApiEndpointStatusFilter,
     ApiEngagementFilter,
     ApiFindingFilter,
     ApiProductFilter,
@@ -305,6 +308,7 @@ class GlobalRoleViewSet(
 # @extend_schema_view(**schema_with_prefetch())
 # Nested models with prefetch make the response schema too long for Swagger UI
 class EndPointViewSet(
+    CursorPaginationMixin,
     PrefetchDojoModelViewSet,
 ):
     serializer_class = serializers.EndpointSerializer
@@ -362,20 +366,13 @@ class EndPointViewSet(
 # @extend_schema_view(**schema_with_prefetch())
 # Nested models with prefetch make the response schema too long for Swagger UI
 class EndpointStatusViewSet(
+    CursorPaginationMixin,
     PrefetchDojoModelViewSet,
 ):
     serializer_class = serializers.EndpointStatusSerializer
     queryset = Endpoint_Status.objects.none()
     filter_backends = (DjangoFilterBackend,)
-    filterset_fields = [
-        "mitigated",
-        "false_positive",
-        "out_of_scope",
-        "risk_accepted",
-        "mitigated_by",
-        "finding",
-        "endpoint",
-    ]
+    filterset_class = ApiEndpointStatusFilter
 
     permission_classes = (
         IsAuthenticated,
@@ -392,6 +389,7 @@ class EndpointStatusViewSet(
 # @extend_schema_view(**schema_with_prefetch())
 # Nested models with prefetch make the response schema too long for Swagger UI
 class EngagementViewSet(
+    CursorPaginationMixin,
     PrefetchDojoModelViewSet,
     ra_api.AcceptedRisksMixin,
 ):
@@ -830,6 +828,13 @@ class FindingTemplatesViewSet(
                 required=False,
                 description="List of fields for which to prefetch model instances and add those to the response",
             ),
+            OpenApiParameter(
+                "fields",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                required=False,
+                description="Comma separated list of the fields to return, e.g. id,title,severity. Only the data needed for these fields is loaded",
+            ),
         ],
     ),
     retrieve=extend_schema(
@@ -849,10 +854,18 @@ class FindingTemplatesViewSet(
                 required=False,
                 description="List of fields for which to prefetch model instances and add those to the response",
             ),
+            OpenApiParameter(
+                "fields",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                required=False,
+                description="Comma separated list of the fields to return, e.g. id,title,severity. Only the data needed for these fields is loaded",
+            ),
         ],
     ),
 )
 class FindingViewSet(
+    CursorPaginationMixin,
     prefetch.PrefetchListMixin,
     prefetch.PrefetchRetrieveMixin,
     mixins.UpdateModelMixin,
@@ -882,10 +895,46 @@ class FindingViewSet(
 
         serializer.save(push_to_jira=push_to_jira)
 
+    # the relations read by the fields of the serializer, only these are prefetched when
+    # the fields are selected with ?fields=
+    field_prefetches = {
+        "endpoints": ["endpoints"],
+        "reviewers": ["reviewers"],
+        "found_by": ["found_by"],
+        "notes": ["notes"],
+        "accepted_risks": ["risk_acceptance_set"],
+        "tags": ["tags"],
+        "jira_creation": ["jira_issue"],
+        "jira_change": ["jira_issue"],
+        "finding_groups": ["finding_group_set"],
+        "files": ["files"],
+        "request_response": ["burprawrequestresponse_set"],
+        "finding_meta": ["finding_meta"],
+        "vulnerability_ids": ["vulnerability_id_set"],
+        "related_fields": [
+            "jira_issue",
+            "test__test_type",
+            "test__engagement",
+            "test__environment",
+            "test__engagement__product",
+            "test__engagement__product__prod_type",
+        ],
+    }
+    # the columns read by the fields of the serializer that are not columns themselves
+    field_columns = {
+        "age": ["date", "mitigated"],
+        "sla_days_remaining": ["sla_expiration_date", "mitigated"],
+        "related_fields": ["test"],
+    }
+
     def get_queryset(self):
         findings = get_authorized_findings(
             Permissions.Finding_View,
-        ).prefetch_related(
+        )
+        if (fields := self.get_requested_fields()) is not None:
+            return self.select_requested_fields(findings, fields).distinct()
+
+        findings = findings.prefetch_related(
             "endpoints",
             "reviewers",
             "found_by",
@@ -908,6 +957,41 @@ class FindingViewSet(
 
         return findings.distinct()
 
+    def get_requested_fields(self):
+        """Returns the fields selected with ?fields= when listing or retrieving findings, None when all fields are requested"""
+        if not self.request or self.action not in {"list", "retrieve"} or not self.request.query_params.get("fields"):
+            return None
+        fields = [field.strip() for field in self.request.query_params["fields"].split(",") if field.strip()]
+        if unknown_fields := set(fields) - set(serializers.FindingSerializer().fields):
+            msg = f"Unknown fields: {', '.join(sorted(unknown_fields))}"
+            raise ValidationError(msg)
+        return fields
+
+    def select_requested_fields(self, findings, fields):
+        """Only loads the columns and prefetches the relations the requested fields need"""
+        prefetches = set()
+        columns = {"id"}
+        all_columns = False
+        for field in fields:
+            prefetches.update(self.field_prefetches.get(field, []))
+            columns.update(self.field_columns.get(field, []))
+            with contextlib.suppress(FieldDoesNotExist):
+                model_field = Finding._meta.get_field(field)
+                if model_field.concrete and not model_field.many_to_many:
+                    columns.add(field)
+                    continue
+            if field not in self.field_prefetches and field not in self.field_columns:
+                # the field is computed from columns that are not known here, e.g. display_status
+                all_columns = True
+        if not all_columns:
+            findings = findings.only(*columns)
+        return findings.prefetch_related(*sorted(prefetches))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_requested_fields()
+        return context
+
     def get_serializer_class(self):
         if self.request and self.request.method == "POST":
             return serializers.FindingCreateSerializer
@@ -2038,6 +2122,7 @@ class DevelopmentEnvironmentViewSet(
 # @extend_schema_view(**schema_with_prefetch())
 # Nested models with prefetch make the response schema too long for Swagger UI
 class TestsViewSet(
+    CursorPaginationMixin,
     PrefetchDojoModelViewSet,
     ra_api.AcceptedRisksMixin,
 ):
@@ -2298,6 +2383,29 @@ class TestImportViewSet(
         )
 
 
+# Authorization: object-based
+class ImportJobViewSet(
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+
+    """
+    Reports the status and progress of an import or reimport. Reports uploaded with
+    `async_import=true` are imported in the background, the import job of such an upload
+    is pending or running until the import has completed or failed.
+    """
+
+    serializer_class = serializers.ImportJobSerializer
+    queryset = Test_Import.objects.none()
+    permission_classes = (
+        IsAuthenticated,
+        permissions.UserHasTestImportPermission,
+    )
+
+    def get_queryset(self):
+        return get_authorized_test_imports(Permissions.Test_View)
+
+
 # Authorization: configurations
 @extend_schema_view(**schema_with_prefetch())
 class ToolConfigurationsViewSet(
@@ -2445,8 +2553,19 @@ class UserProfileView(GenericAPIView):
         return Response(serializer.data)
 
 
+class AsyncImportMixin:
+
+    """Answers with 202 instead of 201 when the report is imported in the background by an import job"""
+
+    def create(self, request, *args, **kwargs):
+        response = super().create(request, *args, **kwargs)
+        if response.data.get("import_job_id") is not None:
+            response.status_code = status.HTTP_202_ACCEPTED
+        return response
+
+
 # Authorization: authenticated users, DjangoModelPermissions
-class ImportScanView(mixins.CreateModelMixin, viewsets.GenericViewSet):
+class ImportScanView(AsyncImportMixin, mixins.CreateModelMixin, viewsets.GenericViewSet):
 
     """
     Imports a scan report into an engagement or product.
@@ -2586,7 +2705,7 @@ class ImportLanguagesView(mixins.CreateModelMixin, viewsets.GenericViewSet):
 
 
 # Authorization: object-based
-class ReImportScanView(mixins.CreateModelMixin, viewsets.GenericViewSet):
+class ReImportScanView(AsyncImportMixin, mixins.CreateModelMixin, viewsets.GenericViewSet):
 
     """
     Reimports a scan report into an existing test.
@@ -72,6 +72,7 @@ class DojoAppConfig(AppConfig):
         # Load any signals here that will be ready for runtime
         # Importing the signals file is good enough if using the reciever decorator
         import dojo.announcement.signals
+        import dojo.authorization.signals
         import dojo.benchmark.signals
         import dojo.cred.signals
         import dojo.endpoint.signals
@@ -82,6 +83,7 @@ class DojoAppConfig(AppConfig):
         import dojo.product_type.signals
         import dojo.risk_acceptance.signals
         import dojo.sla_config.helpers
+        import dojo.system_settings.signals
         import dojo.tags_signals
         import dojo.test.signals
         import dojo.tool_product.signals  # noqa: F401
@@ -1,4 +1,9 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
+from django.db.models import Q
 
 from dojo.authorization.roles_permissions import (
     Permissions,
@@ -282,6 +287,45 @@ def role_has_global_permission(role, permission):
     return role_has_permission(role, permission)
 
 
+AUTHORIZED_PRODUCT_IDS_VERSION_KEY = "authorized_product_ids_version"
+
+
+def get_authorized_product_ids(permission, user):
+    """
+    Returns the ids of the products the user has the permission for through a product or product
+    type membership, either as a user or via a group. Without AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT
+    the ids are returned as a subquery, otherwise they are returned as a list that is cached until
+    a membership changes.
+    """
+    roles = get_roles_for_permission(permission)
+    product_ids = Product.objects.filter(
+        Q(prod_type__in=Product_Type_Member.objects.filter(user=user, role__in=roles).values("product_type"))
+        | Q(id__in=Product_Member.objects.filter(user=user, role__in=roles).values("product"))
+        | Q(prod_type__in=Product_Type_Group.objects.filter(group__users=user, role__in=roles).values("product_type"))
+        | Q(id__in=Product_Group.objects.filter(group__users=user, role__in=roles).values("product")),
+    ).values_list("id", flat=True)
+
+    if settings.AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT <= 0:
+        return product_ids
+
+    version = cache.get(AUTHORIZED_PRODUCT_IDS_VERSION_KEY)
+    if version is None:
+        cache.add(AUTHORIZED_PRODUCT_IDS_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(AUTHORIZED_PRODUCT_IDS_VERSION_KEY)
+    key = f"authorized_product_ids_{version}_{user.id}_{int(permission)}"
+    cached_product_ids = cache.get(key)
+    if cached_product_ids is None:
+        cached_product_ids = list(product_ids)
+        cache.set(key, cached_product_ids, timeout=settings.AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT)
+    return cached_product_ids
+
+
+def invalidate_authorized_product_ids():
+    """Invalidates the cached authorized product ids of all users"""
+    if settings.AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT > 0:
+        cache.set(AUTHORIZED_PRODUCT_IDS_VERSION_KEY, uuid4().hex, timeout=None)
+
+
 class NoAuthorizationImplementedError(Exception):
     def __init__(self, message):
         self.message = message
@@ -0,0 +1,42 @@
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from dojo.authorization.authorization import invalidate_authorized_product_ids
+from dojo.models import (
+    Dojo_Group,
+    Dojo_Group_Member,
+    Product,
+    Product_Group,
+    Product_Member,
+    Product_Type_Group,
+    Product_Type_Member,
+)
+
+
+@receiver(post_save, sender=Product_Member)
+@receiver(post_delete, sender=Product_Member)
+@receiver(post_save, sender=Product_Type_Member)
+@receiver(post_delete, sender=Product_Type_Member)
+@receiver(post_save, sender=Product_Group)
+@receiver(post_delete, sender=Product_Group)
+@receiver(post_save, sender=Product_Type_Group)
+@receiver(post_delete, sender=Product_Type_Group)
+@receiver(post_save, sender=Dojo_Group_Member)
+@receiver(post_delete, sender=Dojo_Group_Member)
+@receiver(m2m_changed, sender=Dojo_Group.users.through)
+def authorization_membership_changed(sender, instance, **kwargs):
+    invalidate_authorized_product_ids()
+
+
+@receiver(post_init, sender=Product)
+def authorization_product_loaded(sender, instance, **kwargs):
+    # read from __dict__, as accessing a deferred field would query the database
+    instance._authorized_prod_type_id = instance.__dict__.get("prod_type_id")
+
+
+@receiver(post_save, sender=Product)
+def authorization_product_saved(sender, instance, created, **kwargs):
+    # the members of the product type are authorized for the products of the product type
+    if created or instance.__dict__.get("prod_type_id") != instance._authorized_prod_type_id:
+        invalidate_authorized_product_ids()
+    instance._authorized_prod_type_id = instance.__dict__.get("prod_type_id")
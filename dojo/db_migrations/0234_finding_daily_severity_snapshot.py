@@ -0,0 +1,31 @@
+# Generated by Django 5.1.8 on 2026-10-18 20:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dojo', '0233_remove_test_actual_time_remove_test_estimated_time'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Finding_Daily_Severity_Snapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(editable=False)),
+                ('severity', models.CharField(choices=[('Info', 'Info'), ('Low', 'Low'), ('Medium', 'Medium'), ('High', 'High'), ('Critical', 'Critical')], editable=False, max_length=200)),
+                ('opened', models.PositiveIntegerField(default=0, editable=False)),
+                ('closed', models.PositiveIntegerField(default=0, editable=False)),
+                ('risk_accepted', models.PositiveIntegerField(default=0, editable=False)),
+                ('active', models.PositiveIntegerField(default=0, editable=False)),
+                ('product', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, to='dojo.product')),
+            ],
+            options={
+                'ordering': ('product', 'date', 'severity'),
+                'unique_together': {('product', 'date', 'severity')},
+            },
+        ),
+    ]
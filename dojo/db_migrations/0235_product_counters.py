@@ -0,0 +1,26 @@
+# Generated by Django 5.1.8 on 2026-10-18 20:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dojo', '0234_finding_daily_severity_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product_Counters',
+            fields=[
+                ('product', models.OneToOneField(editable=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='dojo.product')),
+                ('engagement_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('open_findings_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('endpoints_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('endpoint_hosts_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('stale', models.BooleanField(default=True, editable=False)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.8 on 2026-10-18 21:13
+
+import django.db.models.deletion
+import dojo.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dojo', '0235_product_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='test_import',
+            name='engagement',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Engagement the report of an asynchronous import job is imported into.', null=True, on_delete=django.db.models.deletion.CASCADE, to='dojo.engagement'),
+        ),
+        migrations.AddField(
+            model_name='test_import',
+            name='error',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='test_import',
+            name='progress',
+            field=models.JSONField(editable=False, help_text='Number of findings parsed, matched, created and closed so far.', null=True),
+        ),
+        migrations.AddField(
+            model_name='test_import',
+            name='scan_file',
+            field=models.FileField(blank=True, editable=False, help_text='Uploaded report of an asynchronous import job, removed once it has been processed.', null=True, upload_to=dojo.models.UniqueUploadNameProvider('import_jobs', keep_basename=True)),
+        ),
+        migrations.AddField(
+            model_name='test_import',
+            name='status',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Running', 'Running'), ('Completed', 'Completed'), ('Failed', 'Failed')], default='Completed', editable=False, max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='test_import',
+            name='test',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, to='dojo.test'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.8 on 2026-10-18 22:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dojo', '0236_test_import_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product_counters',
+            name='snapshots_stale',
+            field=models.BooleanField(default=True, editable=False),
+        ),
+    ]
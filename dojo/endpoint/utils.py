@@ -54,6 +54,35 @@ def endpoint_filter(**kwargs):
     return qs
 
 
+def _endpoint_key(protocol, userinfo, host, port, path, query, fragment):
+    if protocol is not None:
+        protocol = protocol.lower()
+    if host is not None:
+        host = host.lower()
+    # the default port of the protocol is the same as no port at all
+    if port is not None and protocol in SCHEME_PORT_MAP and SCHEME_PORT_MAP[protocol] == port:
+        port = None
+    return (protocol, userinfo, host, port, path, query, fragment)
+
+
+def endpoint_key(endpoint):
+    """
+    Returns a key for a saved endpoint that is equal to the endpoint_filter_key of
+    the values endpoint_filter would match this endpoint with
+    """
+    return _endpoint_key(
+        endpoint.protocol, endpoint.userinfo, endpoint.host, endpoint.port, endpoint.path, endpoint.query, endpoint.fragment,
+    )
+
+
+def endpoint_filter_key(**kwargs):
+    """
+    Returns a key for the endpoints that endpoint_filter(**kwargs) matches, ignoring the product.
+    Like in endpoint_filter, empty values only match endpoints without that value
+    """
+    return _endpoint_key(*(kwargs.get(field) or None for field in ("protocol", "userinfo", "host", "port", "path", "query", "fragment")))
+
+
 def endpoint_get_or_create(**kwargs):
     with transaction.atomic():
         qs = endpoint_filter(**kwargs)
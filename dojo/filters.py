@@ -1242,6 +1242,7 @@ class ApiEngagementFilter(DojoFilter):
                                                 help_text="Comma separated list of exact tags not present on product",
                                                 exclude="True")
     has_tags = BooleanFilter(field_name="tags", lookup_expr="isnull", exclude=True, label="Has tags")
+    updated_after = DateTimeFilter(field_name="updated", lookup_expr="gt", help_text="Engagements updated after the given date and time")
 
     o = OrderingFilter(
         # tuple-mapping retains order
@@ -1513,6 +1514,8 @@ class ApiFindingFilter(DojoFilter):
     mitigated_on = DateTimeFilter(field_name="mitigated", lookup_expr="exact", method="filter_mitigated_on")
     mitigated_before = DateTimeFilter(field_name="mitigated", lookup_expr="lt")
     mitigated_after = DateTimeFilter(field_name="mitigated", lookup_expr="gt", label="Mitigated After", method="filter_mitigated_after")
+    last_status_update_after = DateTimeFilter(field_name="last_status_update", lookup_expr="gt",
+                                              help_text="Findings created or changed in status after the given date and time")
     # NumberInFilter
     cwe = NumberInFilter(field_name="cwe", lookup_expr="in")
     defect_review_requested_by = NumberInFilter(field_name="defect_review_requested_by", lookup_expr="in")
@@ -2789,6 +2792,15 @@ class ApiEndpointFilter(DojoFilter):
         fields = ["id", "protocol", "userinfo", "host", "port", "path", "query", "fragment", "product"]
 
 
+class ApiEndpointStatusFilter(DojoFilter):
+    last_modified_after = DateTimeFilter(field_name="last_modified", lookup_expr="gt",
+                                         help_text="Endpoint statuses changed after the given date and time")
+
+    class Meta:
+        model = Endpoint_Status
+        fields = ["mitigated", "false_positive", "out_of_scope", "risk_accepted", "mitigated_by", "finding", "endpoint"]
+
+
 class ApiRiskAcceptanceFilter(DojoFilter):
     o = OrderingFilter(
         # tuple-mapping retains order
@@ -2956,6 +2968,7 @@ class ApiTestFilter(DojoFilter):
                                                                   help_text="Comma separated list of exact tags not present on product",
                                                                   exclude="True")
     has_tags = BooleanFilter(field_name="tags", lookup_expr="isnull", exclude=True, label="Has tags")
+    updated_after = DateTimeFilter(field_name="updated", lookup_expr="gt", help_text="Tests updated after the given date and time")
 
     o = OrderingFilter(
         # tuple-mapping retains order
@@ -402,6 +402,74 @@ def post_process_finding_save(finding, dedupe_option=True, rules_option=True, pr
             jira_helper.push_to_jira(finding.finding_group)
 
 
+@dojo_async_task
+@app.task
+def post_process_findings_batch(finding_ids, *args, dedupe_option=True, rules_option=True, product_grading_option=True,
+             issue_updater_option=True, push_to_jira=False, user=None, **kwargs):
+    """
+    Same as post_process_finding_save, but for a batch of findings. The findings are deduplicated
+    with one dedupe_batch per test, the system settings are only loaded once and product grading is
+    only done once per product.
+    """
+    if not finding_ids:
+        logger.warning("post_process_findings_batch called without findings, skipping post processing")
+        return
+
+    system_settings = System_Settings.objects.get()
+    findings = list(
+        Finding.objects.filter(id__in=finding_ids)
+        .select_related("test", "test__engagement", "test__engagement__product", "test__test_type")
+        .order_by("id"),
+    )
+
+    # STEP 1 run all status changing tasks sequentially to avoid race conditions
+    if dedupe_option:
+        if system_settings.enable_deduplication:
+            from dojo.utils import dedupe_batch
+            # deduplicate in the foreground, the findings must be deduplicated before they are pushed to jira
+            for test_id in {finding.test_id for finding in findings}:
+                dedupe_batch(test_id, finding_ids=[finding.id for finding in findings if finding.test_id == test_id], sync=True)
+            # refresh the findings marked as duplicate
+            findings = list(
+                Finding.objects.filter(id__in=finding_ids)
+                .select_related("test", "test__engagement", "test__engagement__product", "test__test_type")
+                .order_by("id"),
+            )
+        else:
+            deduplicationLogger.debug("skipping dedupe because it's disabled in system settings")
+
+    if system_settings.false_positive_history:
+        # Only perform false positive history if deduplication is disabled
+        if system_settings.enable_deduplication:
+            deduplicationLogger.warning("skipping false positive history because deduplication is also enabled")
+        else:
+            from dojo.utils import do_false_positive_history
+            for finding in findings:
+                do_false_positive_history(finding, *args, **kwargs)
+
+    # STEP 2 run all non-status changing tasks as celery tasks in the background
+    if issue_updater_option:
+        from dojo.tools import tool_issue_updater
+        for finding in findings:
+            tool_issue_updater.async_tool_issue_update(finding)
+
+    if product_grading_option:
+        if system_settings.enable_product_grade:
+            from dojo.utils import calculate_grade
+            for product in {finding.test.engagement.product for finding in findings}:
+                calculate_grade(product)
+        else:
+            deduplicationLogger.debug("skipping product grading because it's disabled in system settings")
+
+    if push_to_jira:
+        for finding in findings:
+            logger.debug("pushing finding %s to jira from post_process_findings_batch", finding.pk)
+            if finding.has_jira_issue or not finding.finding_group:
+                jira_helper.push_to_jira(finding)
+            elif finding.finding_group:
+                jira_helper.push_to_jira(finding.finding_group)
+
+
 @receiver(pre_delete, sender=Finding)
 def finding_pre_delete(sender, instance, **kwargs):
     logger.debug("finding pre_delete: %d", instance.id)
@@ -1,8 +1,7 @@
 from crum import get_current_user
-from django.db.models import Exists, OuterRef, Q
 
-from dojo.authorization.authorization import get_roles_for_permission, user_has_global_permission
-from dojo.models import Finding_Group, Product_Group, Product_Member, Product_Type_Group, Product_Type_Member
+from dojo.authorization.authorization import get_authorized_product_ids, user_has_global_permission
+from dojo.models import Finding_Group
 
 
 def get_authorized_finding_groups(permission, queryset=None, user=None):
@@ -21,30 +20,4 @@ def get_authorized_finding_groups(permission, queryset=None, user=None):
     if user_has_global_permission(user, permission):
         return finding_groups
 
-    roles = get_roles_for_permission(permission)
-    authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("test__engagement__product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("test__engagement__product_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("test__engagement__product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("test__engagement__product_id"),
-        group__users=user,
-        role__in=roles)
-    finding_groups = finding_groups.annotate(
-        test__engagement__product__prod_type__member=Exists(authorized_product_type_roles),
-        test__engagement__product__member=Exists(authorized_product_roles),
-        test__engagement__product__prod_type__authorized_group=Exists(authorized_product_type_groups),
-        test__engagement__product__authorized_group=Exists(authorized_product_groups))
-    return finding_groups.filter(
-        Q(test__engagement__product__prod_type__member=True)
-        | Q(test__engagement__product__member=True)
-        | Q(test__engagement__product__prod_type__authorized_group=True)
-        | Q(test__engagement__product__authorized_group=True))
+    return finding_groups.filter(test__engagement__product__in=get_authorized_product_ids(permission, user))
@@ -1,5 +1,8 @@
 import base64
+import copy
 import logging
+from collections.abc import Iterable, Iterator
+from itertools import islice
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -7,6 +10,7 @@ from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
 from django.db import IntegrityError
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.timezone import make_aware
 
 import dojo.finding.helper as finding_helper
@@ -22,8 +26,11 @@ from dojo.models import (
     SEVERITIES,
     BurpRawRequestResponse,
     Endpoint,
+    Endpoint_Status,
     FileUpload,
     Finding,
+    Finding_Group,
+    Notes,
     Test,
     Test_Import,
     Test_Import_Finding_Action,
@@ -31,9 +38,10 @@ from dojo.models import (
     Vulnerability_Id,
 )
 from dojo.notifications.helper import create_notification
+from dojo.product.helpers import mark_product_counters_stale, update_product_finding_daily_severity_snapshots
 from dojo.tools.factory import get_parser
 from dojo.tools.parser_test import ParserTest
-from dojo.utils import max_safe
+from dojo.utils import bulk_create_update_log_entries, max_safe, update_finding_search_index_entries
 
 logger = logging.getLogger(__name__)
 
@@ -45,11 +53,15 @@ class Parser:
     and is purely for the sake of type hinting
     """
 
-    def get_findings(scan_type: str, test: Test) -> list[Finding]:
+    def get_findings(scan_type: str, test: Test) -> Iterable[Finding]:
         """
         Stub function to make the hinting happier. The actual class
         is loosely obligated to have this function defined.
 
+        Parsers may return a list of findings, or an iterator (e.g. a generator)
+        yielding them one at a time so that large reports are never fully
+        held in memory. The importers consume both in chunks.
+
         TODO This should be enforced in the future, but here is not the place
         TODO once this enforced, this stub class should be removed
         """
@@ -102,7 +114,7 @@ class BaseImporter(ImporterOptions):
 
     def process_findings(
         self,
-        parsed_findings: list[Finding],
+        parsed_findings: Iterable[Finding],
         **kwargs: dict,
     ) -> list[Finding]:
         """
@@ -150,11 +162,12 @@ class BaseImporter(ImporterOptions):
         self,
         scan: TemporaryUploadedFile,
         parser: Parser,
-    ) -> list[Finding]:
+    ) -> Iterable[Finding]:
         """
         Parse the scan report submitted with the parser class and generate some findings
-        that are not saved to the database yet. This step is crucial in determining if
-        there are any errors in the parser before creating any new resources
+        that are not saved to the database yet. Parsers returning an iterator only read
+        the report while the findings are imported, so their errors are raised by
+        chunk_findings, after the findings of the earlier chunks were saved
         """
         # Ensure that a test is present when calling this method as there are cases where
         # the test will be created by this function in a child class
@@ -232,7 +245,7 @@ class BaseImporter(ImporterOptions):
         self,
         scan: TemporaryUploadedFile,
         parser: Parser,
-    ) -> list[Finding]:
+    ) -> Iterable[Finding]:
         """
         Determine how to parse the findings based on the presence of the
         `get_tests` function on the parser object
@@ -243,9 +256,34 @@ class BaseImporter(ImporterOptions):
             return self.parse_findings_dynamic_test_type(scan, parser)
         return self.parse_findings_static_test_type(scan, parser)
 
+    def chunk_findings(
+        self,
+        parsed_findings: Iterable[Finding] | None,
+        chunk_size: int | None = None,
+    ) -> Iterator[list[Finding]]:
+        """
+        Split the findings returned by the parser in lists of at most `chunk_size`
+        (IMPORT_CHUNK_SIZE by default) findings. Parsers returning an iterator are
+        only consumed one chunk at a time, so any error raised while the report is
+        read is converted into a ValidationError just like in parse_findings_static_test_type.
+        The importer then deletes the test it created, and the reimporter reads the whole
+        report before changing any finding
+        """
+        chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        iterator = iter(parsed_findings or [])
+        while True:
+            try:
+                chunk = list(islice(iterator, chunk_size))
+            except ValueError as e:
+                logger.warning(e)
+                raise ValidationError(e)
+            if not chunk:
+                return
+            yield chunk
+
     def sync_process_findings(
         self,
-        parsed_findings: list[Finding],
+        parsed_findings: Iterable[Finding],
         **kwargs: dict,
     ) -> tuple[list[Finding], list[Finding], list[Finding], list[Finding]]:
         """
@@ -256,7 +294,7 @@ class BaseImporter(ImporterOptions):
 
     def determine_process_method(
         self,
-        parsed_findings: list[Finding],
+        parsed_findings: Iterable[Finding],
         **kwargs: dict,
     ) -> list[Finding]:
         return self.sync_process_findings(
@@ -364,16 +402,26 @@ class BaseImporter(ImporterOptions):
         # Add the list of endpoints that were added exclusively at import time
         if len(self.endpoints_to_add) > 0:
             import_settings["endpoints"] = [str(endpoint) for endpoint in self.endpoints_to_add]
-        # Create the test import object
-        test_import = Test_Import.objects.create(
-            test=self.test,
-            import_settings=import_settings,
-            version=self.version,
-            branch_tag=self.branch_tag,
-            build_id=self.build_id,
-            commit_hash=self.commit_hash,
-            type=self.import_type,
-        )
+        # Create the test import object, or complete the one of the asynchronous import job
+        if self.import_job is not None:
+            test_import = self.import_job
+            test_import.test = self.test
+            test_import.import_settings = import_settings
+            test_import.version = self.version
+            test_import.branch_tag = self.branch_tag
+            test_import.build_id = self.build_id
+            test_import.commit_hash = self.commit_hash
+            test_import.save()
+        else:
+            test_import = Test_Import.objects.create(
+                test=self.test,
+                import_settings=import_settings,
+                version=self.version,
+                branch_tag=self.branch_tag,
+                build_id=self.build_id,
+                commit_hash=self.commit_hash,
+                type=self.import_type,
+            )
 
         # Create a history record for each finding
         for finding in closed_findings:
@@ -502,6 +550,34 @@ class BaseImporter(ImporterOptions):
         self.test.percent_complete = percentage_value
         self.test.save()
 
+    def update_import_job_progress(
+        self,
+        **counts: dict,
+    ):
+        """
+        Records the number of findings processed so far on the asynchronous import job,
+        so that it can be polled through the API. Does nothing for imports in the request
+        """
+        if self.import_job is None:
+            return
+        self.import_job.progress = {**(self.import_job.progress or {}), **counts}
+        self.import_job.save(update_fields=["progress", "modified"])
+
+    def update_finding_daily_severity_snapshots(self):
+        """
+        Recompute the daily severity snapshots of the product, as the import may have
+        opened or closed findings on any day in the window shown by the burndown chart
+        """
+        update_product_finding_daily_severity_snapshots(self.test.engagement.product.id)
+
+    def mark_product_counters_stale(self):
+        """
+        Findings and endpoint statuses that are created or updated in bulk do not send the
+        signals that mark the product counters as stale, so this is done once per import and
+        after closing findings in bulk
+        """
+        mark_product_counters_stale(product_id=self.test.engagement.product.id)
+
     def get_or_create_test_type(
         self,
         test_type_name: str,
@@ -745,23 +821,74 @@ class BaseImporter(ImporterOptions):
         this finding will also be synced with some ticket tracking system as well
         as groups
         """
-        finding.active = False
-        finding.is_mitigated = True
-        if not finding.mitigated:
-            finding.mitigated = self.scan_date
-        finding.mitigated_by = self.user
-        finding.notes.create(
-            author=self.user,
-            entry=note_message,
+        self.mitigate_findings([finding], note_message, finding_groups_enabled=finding_groups_enabled)
+
+    def mitigate_findings(
+        self,
+        findings: list[Finding],
+        note_message: str,
+        *,
+        finding_groups_enabled: bool,
+    ) -> list[Finding]:
+        """
+        Bulk version of mitigate_finding for closing many findings at once. The
+        findings are updated with a single bulk update instead of a save per finding,
+        the notes are created in bulk and the endpoint statuses of all findings are
+        mitigated together. The post processing (ticket tracking systems, grading)
+        is done once for all findings afterwards
+        """
+        if not findings:
+            return findings
+        # bulk_update doesn't trigger the auditlog or the status signals, so take
+        # a copy of the findings to record the changes ourselves
+        old_findings = [copy.copy(finding) for finding in findings]
+        now = timezone.now()
+        for finding in findings:
+            finding.active = False
+            finding.is_mitigated = True
+            if not finding.mitigated:
+                finding.mitigated = self.scan_date
+            finding.mitigated_by = self.user
+            # normally set by finding_helper.update_finding_status when saving
+            finding.last_status_update = now
+        # write all fields like save() would, the findings supplied by the reimporter were loaded
+        # before the report was processed and the values they hold are the ones that should be kept
+        Finding.objects.bulk_update(
+            findings,
+            [field.name for field in Finding._meta.concrete_fields if not field.primary_key],
+            batch_size=settings.IMPORT_BULK_CREATE_BATCH_SIZE,
+        )
+        bulk_create_update_log_entries(old_findings, findings, actor=self.user)
+        # Leave a note on every finding
+        notes = Notes.objects.bulk_create(
+            [Notes(author=self.user, entry=note_message) for _ in findings],
+            batch_size=settings.IMPORT_BULK_CREATE_BATCH_SIZE,
         )
+        Finding.notes.through.objects.bulk_create(
+            [Finding.notes.through(finding_id=finding.id, notes_id=note.id) for finding, note in zip(findings, notes, strict=True)],
+            batch_size=settings.IMPORT_BULK_CREATE_BATCH_SIZE,
+        )
+        finding_ids = [finding.id for finding in findings]
+        update_finding_search_index_entries(finding_ids)
         # Mitigate the endpoint statuses
-        self.endpoint_manager.mitigate_endpoint_status(finding.status_finding.all(), self.user, kwuser=self.user, sync=True)
-        # to avoid pushing a finding group multiple times, we push those outside of the loop
-        if finding_groups_enabled and finding.finding_group:
-            # don't try to dedupe findings that we are closing
-            finding.save(dedupe_option=False)
-        else:
-            finding.save(dedupe_option=False, push_to_jira=self.push_to_jira)
+        self.endpoint_manager.chunk_endpoints_and_mitigate(
+            Endpoint_Status.objects.filter(finding_id__in=finding_ids, mitigated=False),
+            self.user,
+        )
+        # to avoid pushing a finding group multiple times, those are pushed by the caller
+        grouped_finding_ids = set()
+        if finding_groups_enabled:
+            grouped_finding_ids = set(
+                Finding_Group.findings.through.objects.filter(finding_id__in=finding_ids).values_list("finding_id", flat=True),
+            )
+        # don't try to dedupe findings that we are closing
+        if ungrouped_finding_ids := [finding_id for finding_id in finding_ids if finding_id not in grouped_finding_ids]:
+            finding_helper.post_process_findings_batch(ungrouped_finding_ids, dedupe_option=False, push_to_jira=self.push_to_jira)
+        if grouped_finding_ids:
+            finding_helper.post_process_findings_batch(list(grouped_finding_ids), dedupe_option=False)
+        # the closed findings are no longer counted as open findings
+        self.mark_product_counters_stale()
+        return findings
 
     def notify_scan_added(
         self,
@@ -1,21 +1,32 @@
+import base64
 import logging
+from collections.abc import Iterable
 
+from django.conf import settings
 from django.core.files.uploadedfile import TemporaryUploadedFile
 from django.core.serializers import serialize
 from django.db.models.query_utils import Q
+from django.db.models.signals import post_save
 from django.urls import reverse
+from watson import search as watson
 
 import dojo.finding.helper as finding_helper
 import dojo.jira_link.helper as jira_helper
 from dojo.importers.base_importer import BaseImporter, Parser
 from dojo.importers.options import ImporterOptions
 from dojo.models import (
+    BurpRawRequestResponse,
+    Endpoint_Status,
     Engagement,
     Finding,
+    System_Settings,
     Test,
     Test_Import,
+    Vulnerability_Id,
 )
 from dojo.notifications.helper import create_notification
+from dojo.product.helpers import product_counters_deferred
+from dojo.utils import apply_cwe_to_template
 
 logger = logging.getLogger(__name__)
 deduplicationLogger = logging.getLogger("dojo.specific-loggers.deduplication")
@@ -79,8 +90,14 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
             api_scan_configuration=self.api_scan_configuration,
             tags=self.tags,
         )
+        # the test is recorded on the asynchronous import job right away, so a job failing
+        # later on still points to the test and the findings it created
+        if self.import_job is not None:
+            self.import_job.test = self.test
+            self.import_job.save(update_fields=["test", "modified"])
         return self.test
 
+    @product_counters_deferred()
     def process_scan(
         self,
         scan: TemporaryUploadedFile,
@@ -103,11 +120,26 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
         self.verify_tool_configuration_from_engagement()
         # Fetch the parser based upon the string version of the scan type
         parser = self.get_parser()
-        # Get the findings from the parser based on what methods the parser supplies
-        # This could either mean traditional file parsing, or API pull parsing
-        parsed_findings = self.parse_findings(scan, parser)
-        # process the findings in the foreground or background
-        new_findings = self.determine_process_method(parsed_findings, **kwargs)
+        test_created = self.test is None
+        try:
+            # the objects saved by a failed import are not added to the search index, like watson
+            # does for requests raising an exception
+            with watson.update_index():
+                # Get the findings from the parser based on what methods the parser supplies
+                # This could either mean traditional file parsing, or API pull parsing
+                parsed_findings = self.parse_findings(scan, parser)
+                # process the findings in the foreground or background
+                new_findings = self.determine_process_method(parsed_findings, **kwargs)
+        except Exception:
+            # parsers returning an iterator can fail after the findings of the first chunks
+            # were saved, so the test created by this import is removed again
+            if test_created and self.test is not None and self.test.pk:
+                if self.import_job is not None:
+                    # the import job would be deleted along with its test
+                    self.import_job.test = None
+                    self.import_job.save(update_fields=["test", "modified"])
+                self.test.delete()
+            raise
         # Close any old findings in the processed list if the the user specified for that
         # to occur in the form that is then passed to the kwargs
         closed_findings = self.close_old_findings(self.test.finding_set.all(), **kwargs)
@@ -146,12 +178,16 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
         # Update the test progress to reflect that the import has completed
         logger.debug("IMPORT_SCAN: Updating Test progress")
         self.update_test_progress()
+        # Bring the burndown and metrics charts of the product up to date
+        # the counters are marked as stale first, as that marks the snapshots as stale as well
+        self.mark_product_counters_stale()
+        self.update_finding_daily_severity_snapshots()
         logger.debug("IMPORT_SCAN: Done")
         return self.test, 0, len(new_findings), len(closed_findings), 0, 0, test_import_history
 
     def process_findings(
         self,
-        parsed_findings: list[Finding],
+        parsed_findings: Iterable[Finding],
         **kwargs: dict,
     ) -> list[Finding]:
         """
@@ -161,39 +197,42 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
         the finding may be appended to a new or existing group based upon user selection
         at import time
         """
+        if settings.IMPORT_BULK_CREATE:
+            return self.bulk_process_findings(parsed_findings, **kwargs)
+
         new_findings = []
-        logger.debug("starting import of %i parsed findings.", len(parsed_findings) if parsed_findings else 0)
         group_names_to_findings_dict = {}
+        parsed_count = 0
+        # the findings are consumed in chunks so that parsers returning an iterator never
+        # have the whole report in memory, and the post processing is done once per chunk
+        for parsed_findings_chunk in self.chunk_findings(parsed_findings):
+            logger.debug("starting import of a chunk of %i parsed findings.", len(parsed_findings_chunk))
+            new_findings.extend(self.process_findings_chunk(parsed_findings_chunk, group_names_to_findings_dict))
+            parsed_count += len(parsed_findings_chunk)
+            self.update_import_job_progress(parsed=parsed_count, created=len(new_findings))
+        logger.debug("imported %i findings.", len(new_findings))
+        self.process_groups_for_all_findings(group_names_to_findings_dict, **kwargs)
 
+        sync = kwargs.get("sync", True)
+        if not sync:
+            return [serialize("json", [finding]) for finding in new_findings]
+        return new_findings
+
+    def process_findings_chunk(
+        self,
+        parsed_findings: list[Finding],
+        group_names_to_findings_dict: dict,
+    ) -> list[Finding]:
+        """
+        Saves a chunk of the findings parsed from the scan report, and then runs the
+        post processing (deduplication, product grading, jira, ...) for the whole chunk
+        """
+        new_findings = []
         for non_clean_unsaved_finding in parsed_findings:
-            # make sure the severity is something is digestible
-            unsaved_finding = self.sanitize_severity(non_clean_unsaved_finding)
-            # Filter on minimum severity if applicable
-            if Finding.SEVERITIES[unsaved_finding.severity] > Finding.SEVERITIES[self.minimum_severity]:
-                # finding's severity is below the configured threshold : ignoring the finding
+            unsaved_finding = self.prepare_unsaved_finding(non_clean_unsaved_finding)
+            # finding's severity is below the configured threshold : ignoring the finding
+            if unsaved_finding is None:
                 continue
-
-            # Some parsers provide "mitigated" field but do not set timezone (because they are probably not available in the report)
-            # Finding.mitigated is DateTimeField and it requires timezone
-            if unsaved_finding.mitigated and not unsaved_finding.mitigated.tzinfo:
-                unsaved_finding.mitigated = unsaved_finding.mitigated.replace(tzinfo=self.now.tzinfo)
-            # Set some explicit fields on the finding
-            unsaved_finding.test = self.test
-            unsaved_finding.reporter = self.user
-            unsaved_finding.last_reviewed_by = self.user
-            unsaved_finding.last_reviewed = self.now
-            logger.debug("process_parsed_findings: active from report: %s, verified from report: %s", unsaved_finding.active, unsaved_finding.verified)
-            # indicates an override. Otherwise, do not change the value of unsaved_finding.active
-            if self.active is not None:
-                unsaved_finding.active = self.active
-            # indicates an override. Otherwise, do not change the value of verified
-            if self.verified is not None:
-                unsaved_finding.verified = self.verified
-            # scan_date was provided, override value from parser
-            if self.scan_date_override:
-                unsaved_finding.date = self.scan_date.date()
-            if self.service is not None:
-                unsaved_finding.service = self.service
             unsaved_finding.save(dedupe_option=False)
             finding = unsaved_finding
             # Determine how the finding should be grouped
@@ -214,12 +253,227 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
             finding = self.process_vulnerability_ids(finding)
             # Categorize this finding as a new one
             new_findings.append(finding)
+            # the hash code is computed now, but the post processing is done for all findings at once after the loop
+            finding.set_hash_code(True)
+            finding.save(dedupe_option=False, product_grading_option=False, issue_updater_option=False)
+
+        if new_findings:
             # to avoid pushing a finding group multiple times, we push those outside of the loop
-            if self.findings_groups_enabled and self.group_by:
-                finding.save()
-            else:
-                finding.save(push_to_jira=self.push_to_jira)
+            finding_helper.post_process_findings_batch(
+                [finding.id for finding in new_findings],
+                push_to_jira=self.push_to_jira and not (self.findings_groups_enabled and self.group_by),
+            )
+        return new_findings
 
+    def prepare_unsaved_finding(
+        self,
+        non_clean_unsaved_finding: Finding,
+    ) -> Finding | None:
+        """
+        Applies the import options to a finding parsed from the report. Returns None
+        when the finding is below the minimum severity and must not be imported
+        """
+        # make sure the severity is something is digestible
+        unsaved_finding = self.sanitize_severity(non_clean_unsaved_finding)
+        # Filter on minimum severity if applicable
+        if Finding.SEVERITIES[unsaved_finding.severity] > Finding.SEVERITIES[self.minimum_severity]:
+            return None
+        # Some parsers provide "mitigated" field but do not set timezone (because they are probably not available in the report)
+        # Finding.mitigated is DateTimeField and it requires timezone
+        if unsaved_finding.mitigated and not unsaved_finding.mitigated.tzinfo:
+            unsaved_finding.mitigated = unsaved_finding.mitigated.replace(tzinfo=self.now.tzinfo)
+        # Set some explicit fields on the finding
+        unsaved_finding.test = self.test
+        unsaved_finding.reporter = self.user
+        unsaved_finding.last_reviewed_by = self.user
+        unsaved_finding.last_reviewed = self.now
+        logger.debug("process_parsed_findings: active from report: %s, verified from report: %s", unsaved_finding.active, unsaved_finding.verified)
+        # indicates an override. Otherwise, do not change the value of unsaved_finding.active
+        if self.active is not None:
+            unsaved_finding.active = self.active
+        # indicates an override. Otherwise, do not change the value of verified
+        if self.verified is not None:
+            unsaved_finding.verified = self.verified
+        # scan_date was provided, override value from parser
+        if self.scan_date_override:
+            unsaved_finding.date = self.scan_date.date()
+        if self.service is not None:
+            unsaved_finding.service = self.service
+        return unsaved_finding
+
+    def bulk_process_findings(
+        self,
+        parsed_findings: Iterable[Finding],
+        **kwargs: dict,
+    ) -> list[Finding]:
+        """
+        Same as process_findings, but the findings are inserted in batches of
+        IMPORT_BULK_CREATE_BATCH_SIZE using bulk_create. The related objects are
+        created in bulk as well, and the post processing of the findings
+        (deduplication, product grading, jira, ...) is done once per batch
+        """
+        new_findings = []
+        group_names_to_findings_dict = {}
+        parsed_count = 0
+        for parsed_findings_chunk in self.chunk_findings(parsed_findings, settings.IMPORT_BULK_CREATE_BATCH_SIZE):
+            logger.debug("starting bulk import of a chunk of %i parsed findings.", len(parsed_findings_chunk))
+            batch = []
+            for non_clean_unsaved_finding in parsed_findings_chunk:
+                unsaved_finding = self.prepare_unsaved_finding(non_clean_unsaved_finding)
+                # finding's severity is below the configured threshold : ignoring the finding
+                if unsaved_finding is not None:
+                    batch.append(unsaved_finding)
+            if batch:
+                new_findings.extend(self.bulk_create_findings(batch, group_names_to_findings_dict))
+            parsed_count += len(parsed_findings_chunk)
+            self.update_import_job_progress(parsed=parsed_count, created=len(new_findings))
+        logger.debug("bulk imported %i findings.", len(new_findings))
+
+        self.process_groups_for_all_findings(group_names_to_findings_dict, **kwargs)
+
+        sync = kwargs.get("sync", True)
+        if not sync:
+            return [serialize("json", [finding]) for finding in new_findings]
+        return new_findings
+
+    def bulk_create_findings(
+        self,
+        findings: list[Finding],
+        group_names_to_findings_dict: dict,
+    ) -> list[Finding]:
+        """
+        Insert a batch of findings along with their found_by, vulnerability ids, endpoint
+        statuses and request/response pairs with one bulk_create per model, and then fire
+        the post processing once for the whole batch
+        """
+        system_settings = System_Settings.objects.get()
+        for finding in findings:
+            self.prepare_finding_for_bulk_create(finding, system_settings)
+
+        # bulk_create does not send the post_save signal, so it is sent manually below to keep the
+        # audit log, the tag inheritance and the search index up to date. The search index context
+        # collects the objects to index and writes all the entries at once at the end of the block
+        with watson.update_index():
+            Finding.objects.bulk_create(findings)
+            found_by_model = Finding.found_by.through
+            found_by_model.objects.bulk_create([
+                found_by_model(finding_id=finding.id, test_type_id=self.test.test_type_id)
+                for finding in findings
+            ])
+            vulnerability_ids = Vulnerability_Id.objects.bulk_create([
+                Vulnerability_Id(finding=finding, vulnerability_id=vulnerability_id)
+                for finding in findings
+                for vulnerability_id in finding.unsaved_vulnerability_ids or []
+            ])
+            self.bulk_create_endpoint_statuses(findings)
+            self.bulk_create_request_response_pairs(findings)
+            for finding in findings:
+                # Determine how the finding should be grouped
+                self.process_finding_groups(finding, group_names_to_findings_dict)
+                # Process any tags, these are saved by the post_save signal
+                if finding.unsaved_tags:
+                    finding.tags = finding.unsaved_tags
+                # Process any files
+                self.process_files(finding)
+                post_save.send(sender=Finding, instance=finding, created=True, update_fields=None, raw=False, using=finding._state.db)
+            for vulnerability_id in vulnerability_ids:
+                post_save.send(sender=Vulnerability_Id, instance=vulnerability_id, created=True, update_fields=None, raw=False, using=vulnerability_id._state.db)
+
+        # to avoid pushing a finding group multiple times, we push those outside of the loop
+        finding_helper.post_process_findings_batch(
+            [finding.id for finding in findings],
+            push_to_jira=self.push_to_jira and not (self.findings_groups_enabled and self.group_by),
+        )
+        return findings
+
+    def prepare_finding_for_bulk_create(
+        self,
+        finding: Finding,
+        system_settings: System_Settings,
+    ) -> None:
+        """
+        Does everything in memory that would otherwise happen while saving a new finding
+        twice (before and after adding the endpoints and vulnerability ids), so that
+        the finding can be inserted with bulk_create
+        """
+        finding.normalize_fields()
+        if finding.file_path is not None:
+            finding.static_finding = True
+            if len(finding.unsaved_endpoints) == 0:
+                finding.dynamic_finding = False
+        # Gather the endpoints of the report and of the form, as those are the endpoints of the finding once saved
+        self.endpoint_manager.clean_unsaved_endpoints(finding.unsaved_endpoints)
+        finding.unsaved_endpoints += [
+            endpoint for endpoint in self.endpoints_to_add if endpoint not in finding.unsaved_endpoints
+        ]
+        # Synchronize the cve field with the vulnerability ids the same way as process_vulnerability_ids does
+        if finding.unsaved_vulnerability_ids and finding.cve:
+            finding.unsaved_vulnerability_ids.insert(0, finding.cve)
+        elif not finding.unsaved_vulnerability_ids and finding.cve:
+            finding.unsaved_vulnerability_ids = [finding.cve]
+        if finding.unsaved_vulnerability_ids:
+            finding.unsaved_vulnerability_ids = list(dict.fromkeys(finding.unsaved_vulnerability_ids))
+            finding.cve = finding.unsaved_vulnerability_ids[0]
+        # The endpoints and vulnerability ids are available in memory, so the hash code can be computed now
+        finding.set_hash_code(True)
+        if system_settings.enable_template_match:
+            apply_cwe_to_template(finding)
+        finding_helper.update_finding_status(finding, self.user, changed_fields={"id": (None, None)})
+        finding.set_sla_expiration_date(system_settings=system_settings)
+
+    def bulk_create_endpoint_statuses(
+        self,
+        findings: list[Finding],
+    ) -> None:
+        """Resolve the endpoints of a batch of findings and link them with one bulk_create"""
+        product = self.test.engagement.product
+        # resolve the endpoints of all findings at once, so the lookups per finding below don't need any query
+        self.endpoint_manager.get_or_create_endpoints(
+            [endpoint for finding in findings for endpoint in finding.unsaved_endpoints],
+            product,
+        )
+        endpoint_statuses = []
+        for finding in findings:
+            saved_endpoints = self.endpoint_manager.get_or_create_endpoints(finding.unsaved_endpoints, product)
+            endpoint_statuses.extend(
+                Endpoint_Status(finding=finding, endpoint=saved_endpoint, date=finding.date)
+                for saved_endpoint in {saved_endpoint.id: saved_endpoint for saved_endpoint in saved_endpoints}.values()
+            )
+        Endpoint_Status.objects.bulk_create(endpoint_statuses)
+
+    def bulk_create_request_response_pairs(
+        self,
+        findings: list[Finding],
+    ) -> None:
+        """Same as process_request_response_pairs, for a batch of findings with one bulk_create"""
+        burp_rrs = []
+        for finding in findings:
+            burp_rrs.extend(
+                BurpRawRequestResponse(
+                    finding=finding,
+                    burpRequestBase64=base64.b64encode(req_resp["req"].encode("utf-8")),
+                    burpResponseBase64=base64.b64encode(req_resp["resp"].encode("utf-8")))
+                for req_resp in getattr(finding, "unsaved_req_resp", []))
+            unsaved_request = getattr(finding, "unsaved_request", None)
+            unsaved_response = getattr(finding, "unsaved_response", None)
+            if unsaved_request is not None and unsaved_response is not None:
+                burp_rrs.append(BurpRawRequestResponse(
+                    finding=finding,
+                    burpRequestBase64=base64.b64encode(unsaved_request.encode()),
+                    burpResponseBase64=base64.b64encode(unsaved_response.encode())))
+        for burp_rr in burp_rrs:
+            burp_rr.clean()
+        BurpRawRequestResponse.objects.bulk_create(burp_rrs)
+
+    def process_groups_for_all_findings(
+        self,
+        group_names_to_findings_dict: dict,
+        **kwargs: dict,
+    ) -> None:
+        """
+        Add findings to a group that may or may not exist, based upon the users
+        selection at import time
+        """
         for (group_name, findings) in group_names_to_findings_dict.items():
             finding_helper.add_findings_to_auto_group(
                 group_name,
@@ -234,11 +488,6 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
                 else:
                     jira_helper.push_to_jira(findings[0])
 
-        sync = kwargs.get("sync", True)
-        if not sync:
-            return [serialize("json", [finding]) for finding in new_findings]
-        return new_findings
-
     def close_old_findings(
         self,
         findings: list[Finding],
@@ -303,15 +552,14 @@ class DefaultImporter(BaseImporter, DefaultImporterOptions):
         else:
             old_findings = old_findings.filter(Q(service__isnull=True) | Q(service__exact=""))
         # Update the status of the findings and any endpoints
-        for old_finding in old_findings:
-            self.mitigate_finding(
-                old_finding,
-                (
-                    "This finding has been automatically closed "
-                    "as it is not present anymore in recent scans."
-                ),
-                finding_groups_enabled=self.findings_groups_enabled,
-            )
+        old_findings = self.mitigate_findings(
+            list(old_findings),
+            (
+                "This finding has been automatically closed "
+                "as it is not present anymore in recent scans."
+            ),
+            finding_groups_enabled=self.findings_groups_enabled,
+        )
         # push finding groups to jira since we only only want to push whole groups
         if self.findings_groups_enabled and self.push_to_jira:
             for finding_group in {finding.finding_group for finding in old_findings if finding.finding_group is not None}:
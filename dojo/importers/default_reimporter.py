@@ -1,5 +1,9 @@
+import copy
 import logging
+from collections import defaultdict
+from collections.abc import Iterable
 
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import TemporaryUploadedFile
 from django.core.serializers import serialize
 from django.db.models.query_utils import Q
@@ -15,6 +19,7 @@ from dojo.models import (
     Test,
     Test_Import,
 )
+from dojo.product.helpers import product_counters_deferred
 
 logger = logging.getLogger(__name__)
 deduplicationLogger = logging.getLogger("dojo.specific-loggers.deduplication")
@@ -66,6 +71,7 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
             **kwargs,
         )
 
+    @product_counters_deferred()
     def process_scan(
         self,
         scan: TemporaryUploadedFile,
@@ -138,6 +144,10 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
         # Update the test progress to reflect that the import has completed
         logger.debug("REIMPORT_SCAN: Updating Test progress")
         self.update_test_progress()
+        # Bring the burndown and metrics charts of the product up to date
+        # the counters are marked as stale first, as that marks the snapshots as stale as well
+        self.mark_product_counters_stale()
+        self.update_finding_daily_severity_snapshots()
         logger.debug("REIMPORT_SCAN: Done")
         return (
             self.test,
@@ -151,7 +161,7 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
 
     def process_findings(
         self,
-        parsed_findings: list[Finding],
+        parsed_findings: Iterable[Finding],
         **kwargs: dict,
     ) -> tuple[list[Finding], list[Finding], list[Finding], list[Finding]]:
         """
@@ -163,15 +173,47 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
         """
         self.deduplication_algorithm = self.determine_deduplication_algorithm()
         self.original_items = list(self.test.finding_set.all())
+        self.build_candidate_index(self.original_items)
         self.new_items = []
         self.reactivated_items = []
         self.unchanged_items = []
         self.group_names_to_findings_dict = {}
+        self.matched_count = 0
+        parsed_count = 0
 
-        logger.debug(f"starting reimport of {len(parsed_findings) if parsed_findings else 0} items.")
         logger.debug("STEP 1: looping over findings from the reimported report and trying to match them to existing findings")
         deduplicationLogger.debug(f"Algorithm used for matching new findings to existing findings: {self.deduplication_algorithm}")
+        # the findings are consumed in chunks so that parsers returning an iterator never
+        # have the whole report in memory, and the post processing is done once per chunk
+        for parsed_findings_chunk in self.chunk_findings(parsed_findings):
+            logger.debug(f"starting reimport of a chunk of {len(parsed_findings_chunk)} items.")
+            self.process_findings_chunk(parsed_findings_chunk)
+            parsed_count += len(parsed_findings_chunk)
+            self.update_import_job_progress(parsed=parsed_count, matched=self.matched_count, created=len(self.new_items))
+
+        self.to_mitigate = (set(self.original_items) - set(self.reactivated_items) - set(self.unchanged_items))
+        # due to #3958 we can have duplicates inside the same report
+        # this could mean that a new finding is created and right after
+        # that it is detected as the 'matched existing finding' for a
+        # following finding in the same report
+        # this means untouched can have this finding inside it,
+        # while it is in fact a new finding. So we subtract new_items
+        self.untouched = set(self.unchanged_items) - set(self.to_mitigate) - set(self.new_items) - set(self.reactivated_items)
+        # Process groups
+        self.process_groups_for_all_findings(**kwargs)
+        # Process the results and return them back
+        return self.process_results(**kwargs)
 
+    def process_findings_chunk(
+        self,
+        parsed_findings: list[Finding],
+    ) -> None:
+        """
+        Matches a chunk of the findings parsed from the scan report to the existing
+        findings of the test, saves them, and then runs the post processing
+        (deduplication, product grading, jira, ...) for the whole chunk
+        """
+        findings_to_post_process = []
         for non_clean_unsaved_finding in parsed_findings:
             # make sure the severity is something is digestible
             unsaved_finding = self.sanitize_severity(non_clean_unsaved_finding)
@@ -199,6 +241,7 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
             deduplicationLogger.debug(f"found {len(matched_findings)} findings matching with current new finding")
             # Determine how to proceed based on whether matches were found or not
             if matched_findings:
+                self.matched_count += 1
                 existing_finding = matched_findings[0]
                 finding, force_continue = self.process_matched_finding(
                     unsaved_finding,
@@ -220,6 +263,8 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
                     )
             else:
                 finding = self.process_finding_that_was_not_matched(unsaved_finding)
+                # Make the new finding available for matching with the rest of the report (see #3958)
+                self.add_finding_to_candidate_index(finding)
             # This condition __appears__ to always be true, but am afraid to remove it
             if finding:
                 # Process the rest of the items on the finding
@@ -228,24 +273,17 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
                     unsaved_finding,
                 )
                 # finding = new finding or existing finding still in the upload report
-                # to avoid pushing a finding group multiple times, we push those outside of the loop
-                if self.findings_groups_enabled and self.group_by:
-                    finding.save()
-                else:
-                    finding.save(push_to_jira=self.push_to_jira)
-
-        self.to_mitigate = (set(self.original_items) - set(self.reactivated_items) - set(self.unchanged_items))
-        # due to #3958 we can have duplicates inside the same report
-        # this could mean that a new finding is created and right after
-        # that it is detected as the 'matched existing finding' for a
-        # following finding in the same report
-        # this means untouched can have this finding inside it,
-        # while it is in fact a new finding. So we subtract new_items
-        self.untouched = set(self.unchanged_items) - set(self.to_mitigate) - set(self.new_items) - set(self.reactivated_items)
-        # Process groups
-        self.process_groups_for_all_findings(**kwargs)
-        # Process the results and return them back
-        return self.process_results(**kwargs)
+                # the hash code is computed now, but the post processing is done for all findings at once after the loop
+                finding.set_hash_code(True)
+                finding.save(dedupe_option=False, product_grading_option=False, issue_updater_option=False)
+                findings_to_post_process.append(finding)
+
+        if findings_to_post_process:
+            # to avoid pushing a finding group multiple times, we push those outside of the loop
+            finding_helper.post_process_findings_batch(
+                [finding.id for finding in findings_to_post_process],
+                push_to_jira=self.push_to_jira and not (self.findings_groups_enabled and self.group_by),
+            )
 
     def close_old_findings(
         self,
@@ -260,26 +298,31 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
         if self.close_old_findings_toggle is False:
             return []
         logger.debug("REIMPORT_SCAN: Closing findings no longer present in scan report")
-        # Determine if pushing to jira or if the finding groups are enabled
-        mitigated_findings = []
+        # Get any status changes that could have occurred earlier in the process
+        # for special statuses only.
+        # An example of such is a finding being reported as false positive, and
+        # reimport makes this change in the database. However, the findings here
+        # are calculated based from the original values before the reimport, so
+        # any updates made during reimport are discarded without first getting the
+        # state of the finding as it stands at this moment
+        special_statuses = {
+            finding_id: (false_p, risk_accepted, out_of_scope)
+            for finding_id, false_p, risk_accepted, out_of_scope in Finding.objects.filter(
+                id__in=[finding.id for finding in findings],
+            ).values_list("id", "false_p", "risk_accepted", "out_of_scope")
+        }
+        findings_to_mitigate = []
         for finding in findings:
-            # Get any status changes that could have occurred earlier in the process
-            # for special statuses only.
-            # An example of such is a finding being reported as false positive, and
-            # reimport makes this change in the database. However, the findings here
-            # are calculated based from the original values before the reimport, so
-            # any updates made during reimport are discarded without first getting the
-            # state of the finding as it stands at this moment
-            finding.refresh_from_db(fields=["false_p", "risk_accepted", "out_of_scope"])
+            finding.false_p, finding.risk_accepted, finding.out_of_scope = special_statuses[finding.id]
             # Ensure the finding is not already closed
             if not finding.mitigated or not finding.is_mitigated:
                 logger.debug("mitigating finding: %i:%s", finding.id, finding)
-                self.mitigate_finding(
-                    finding,
-                    f"Mitigated by {self.test.test_type} re-upload.",
-                    finding_groups_enabled=self.findings_groups_enabled,
-                )
-                mitigated_findings.append(finding)
+                findings_to_mitigate.append(finding)
+        mitigated_findings = self.mitigate_findings(
+            findings_to_mitigate,
+            f"Mitigated by {self.test.test_type} re-upload.",
+            finding_groups_enabled=self.findings_groups_enabled,
+        )
         # push finding groups to jira since we only only want to push whole groups
         if self.findings_groups_enabled and self.push_to_jira:
             for finding_group in {finding.finding_group for finding in findings if finding.finding_group is not None}:
@@ -298,7 +341,14 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
         """
         logger.debug("REIMPORT_SCAN: Parse findings")
         # Use the parent method for the rest of this
-        return super().parse_findings_static_test_type(scan, parser)
+        parsed_findings = super().parse_findings_static_test_type(scan, parser)
+        # the changes to the findings of an existing test can not be undone when a parser returning an
+        # iterator fails halfway, so the whole report is read before any finding is changed
+        try:
+            return list(parsed_findings or [])
+        except ValueError as e:
+            logger.warning(e)
+            raise ValidationError(e)
 
     def parse_findings_dynamic_test_type(
         self,
@@ -313,6 +363,48 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
         logger.debug("REIMPORT_SCAN parser v2: Create parse findings")
         return super().parse_findings_dynamic_test_type(scan, parser)
 
+    def build_candidate_index(
+        self,
+        findings: list[Finding],
+    ) -> None:
+        """
+        Index the findings of the test by the attributes used by the deduplication
+        algorithms so that each finding from the report can be matched without
+        querying the database
+        """
+        self.candidates_by_hash_code = defaultdict(list)
+        self.candidates_by_unique_id_from_tool = defaultdict(list)
+        self.candidates_by_title_and_severity = defaultdict(list)
+        for finding in sorted(findings, key=lambda finding: finding.id):
+            # the matched findings are updated by the reimport, while close_old_findings needs
+            # the state of the findings from before the reimport
+            self.add_finding_to_candidate_index(copy.copy(finding))
+
+    def add_finding_to_candidate_index(
+        self,
+        finding: Finding,
+    ) -> None:
+        """
+        Register a finding in the candidate index. Findings must be added in ascending
+        id order to preserve the ordering of the matches
+        """
+        if finding.hash_code is not None:
+            self.candidates_by_hash_code[finding.hash_code].append(finding)
+        if finding.unique_id_from_tool is not None:
+            self.candidates_by_unique_id_from_tool[str(finding.unique_id_from_tool)].append(finding)
+        self.candidates_by_title_and_severity[
+            self.get_title_and_severity_key(finding.title, finding.severity, finding.numerical_severity)
+        ].append(finding)
+
+    def get_title_and_severity_key(
+        self,
+        title: str,
+        severity: str,
+        numerical_severity: str,
+    ) -> tuple[str, str, str]:
+        """Key used by the legacy algorithm, mirroring a `title__iexact` + severity lookup"""
+        return ((title or "").upper(), severity, numerical_severity)
+
     def match_new_finding_to_existing_finding(
         self,
         unsaved_finding: Finding,
@@ -322,34 +414,35 @@ class DefaultReImporter(BaseImporter, DefaultReImporterOptions):
         # See utils.py deduplicate_* functions
         deduplicationLogger.debug("return findings bases on algorithm: %s", self.deduplication_algorithm)
         if self.deduplication_algorithm == "hash_code":
-            return Finding.objects.filter(
-                test=self.test,
-                hash_code=unsaved_finding.hash_code,
-            ).exclude(hash_code=None).order_by("id")
+            if unsaved_finding.hash_code is None:
+                return []
+            return list(self.candidates_by_hash_code.get(unsaved_finding.hash_code, []))
         if self.deduplication_algorithm == "unique_id_from_tool":
-            return Finding.objects.filter(
-                test=self.test,
-                unique_id_from_tool=unsaved_finding.unique_id_from_tool,
-            ).exclude(unique_id_from_tool=None).order_by("id")
+            if unsaved_finding.unique_id_from_tool is None:
+                return []
+            return list(self.candidates_by_unique_id_from_tool.get(str(unsaved_finding.unique_id_from_tool), []))
         if self.deduplication_algorithm == "unique_id_from_tool_or_hash_code":
-            query = Finding.objects.filter(
-                Q(test=self.test),
-                (Q(hash_code__isnull=False) & Q(hash_code=unsaved_finding.hash_code))
-                | (Q(unique_id_from_tool__isnull=False) & Q(unique_id_from_tool=unsaved_finding.unique_id_from_tool)),
-            ).order_by("id")
-            deduplicationLogger.debug(query.query)
-            return query
+            matches = {}
+            if unsaved_finding.hash_code is not None:
+                for finding in self.candidates_by_hash_code.get(unsaved_finding.hash_code, []):
+                    matches[finding.id] = finding
+            if unsaved_finding.unique_id_from_tool is not None:
+                for finding in self.candidates_by_unique_id_from_tool.get(str(unsaved_finding.unique_id_from_tool), []):
+                    matches[finding.id] = finding
+            return [matches[finding_id] for finding_id in sorted(matches)]
         if self.deduplication_algorithm == "legacy":
             # This is the legacy reimport behavior. Although it's pretty flawed and doesn't match the legacy algorithm for deduplication,
             # this is left as is for simplicity.
             # Re-writing the legacy deduplication here would be complicated and counter-productive.
             # If you have use cases going through this section, you're advised to create a deduplication configuration for your parser
             logger.warning("Legacy reimport. In case of issue, you're advised to create a deduplication configuration in order not to go through this section")
-            return Finding.objects.filter(
-                    title__iexact=unsaved_finding.title,
-                    test=self.test,
-                    severity=unsaved_finding.severity,
-                    numerical_severity=Finding.get_numerical_severity(unsaved_finding.severity)).order_by("id")
+            # the numerical severity of the parsed findings is only set when they are saved
+            key = self.get_title_and_severity_key(
+                unsaved_finding.title,
+                unsaved_finding.severity,
+                Finding.get_numerical_severity(unsaved_finding.severity),
+            )
+            return list(self.candidates_by_title_and_severity.get(key, []))
         logger.error(f'Internal error: unexpected deduplication_algorithm: "{self.deduplication_algorithm}"')
         return None
 
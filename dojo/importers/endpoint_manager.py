@@ -1,23 +1,34 @@
 import logging
+from collections.abc import Iterable
 
-from django.core.exceptions import MultipleObjectsReturned, ValidationError
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.db.models.signals import post_save
 from django.urls import reverse
 from django.utils import timezone
+from watson import search as watson
 
 from dojo.celery import app
 from dojo.decorators import dojo_async_task
-from dojo.endpoint.utils import endpoint_get_or_create
+from dojo.endpoint.utils import endpoint_filter_key, endpoint_key
 from dojo.models import (
     Dojo_User,
     Endpoint,
     Endpoint_Status,
     Finding,
+    Product,
 )
 
 logger = logging.getLogger(__name__)
 
 
 class EndpointManager:
+    def __init__(self):
+        # The saved endpoints per product id, keyed by endpoint_key. Endpoints are
+        # only looked up once per import, and then served from here
+        self.endpoint_cache = {}
+
     @dojo_async_task
     @app.task()
     def add_endpoints_to_unsaved_finding(
@@ -29,10 +40,60 @@ class EndpointManager:
         """Creates Endpoint objects for a single finding and creates the link via the endpoint status"""
         logger.debug(f"IMPORT_SCAN: Adding {len(endpoints)} endpoints to finding: {finding}")
         self.clean_unsaved_endpoints(endpoints)
-        for endpoint in endpoints:
-            ep = None
-            try:
-                ep, _ = endpoint_get_or_create(
+        saved_endpoints = self.get_or_create_endpoints(endpoints, finding.test.engagement.product)
+        # the unique constraint skips endpoints that are already linked to the finding
+        Endpoint_Status.objects.bulk_create(
+            [
+                Endpoint_Status(finding=finding, endpoint=endpoint, date=finding.date)
+                for endpoint in {endpoint.id: endpoint for endpoint in saved_endpoints}.values()
+            ],
+            ignore_conflicts=True,
+        )
+        logger.debug(f"IMPORT_SCAN: {len(endpoints)} imported")
+        return
+
+    def get_or_create_endpoint(
+        self,
+        endpoint: Endpoint,
+        product: Product,
+    ) -> Endpoint:
+        """Returns the saved endpoint of the product that matches the supplied unsaved endpoint"""
+        return self.get_or_create_endpoints([endpoint], product)[0]
+
+    def get_or_create_endpoints(
+        self,
+        endpoints: list[Endpoint],
+        product: Product,
+    ) -> list[Endpoint]:
+        """
+        Returns the saved endpoints of the product that match the supplied unsaved endpoints,
+        in the same order. Endpoints are matched the same way as endpoint_get_or_create does,
+        but all endpoints that were not seen before in this import are fetched with a single
+        query, and the missing ones are created with bulk_create
+        """
+        product_endpoints = self.endpoint_cache.setdefault(product.id, {})
+        keys = [
+            endpoint_filter_key(
+                protocol=endpoint.protocol,
+                userinfo=endpoint.userinfo,
+                host=endpoint.host,
+                port=endpoint.port,
+                path=endpoint.path,
+                query=endpoint.query,
+                fragment=endpoint.fragment,
+            )
+            for endpoint in endpoints
+        ]
+        unresolved_endpoints = {
+            key: endpoint for key, endpoint in zip(keys, endpoints, strict=True) if key not in product_endpoints
+        }
+        if unresolved_endpoints:
+            self.fetch_endpoints(unresolved_endpoints.keys(), product)
+            missing_endpoints = {
+                key: endpoint for key, endpoint in unresolved_endpoints.items() if key not in product_endpoints
+            }
+            new_endpoints = Endpoint.objects.bulk_create([
+                Endpoint(
                     protocol=endpoint.protocol,
                     userinfo=endpoint.userinfo,
                     host=endpoint.host,
@@ -40,20 +101,50 @@ class EndpointManager:
                     path=endpoint.path,
                     query=endpoint.query,
                     fragment=endpoint.fragment,
-                    product=finding.test.engagement.product)
-            except (MultipleObjectsReturned):
-                msg = (
-                    f"Endpoints in your database are broken. "
-                    f"Please access {reverse('endpoint_migrate')} and migrate them to new format or remove them."
+                    product=product,
                 )
-                raise Exception(msg)
+                for endpoint in missing_endpoints.values()
+            ])
+            # bulk_create does not send the post_save signal that keeps the audit log, the tag
+            # inheritance and the search index up to date, so it is sent manually
+            with watson.update_index():
+                for key, new_endpoint in zip(missing_endpoints, new_endpoints, strict=True):
+                    product_endpoints[key] = new_endpoint
+                    post_save.send(sender=Endpoint, instance=new_endpoint, created=True, update_fields=None, raw=False, using=new_endpoint._state.db)
+        return [product_endpoints[key] for key in keys]
 
-            Endpoint_Status.objects.get_or_create(
-                finding=finding,
-                endpoint=ep,
-                defaults={"date": finding.date})
-        logger.debug(f"IMPORT_SCAN: {len(endpoints)} imported")
-        return
+    def fetch_endpoints(
+        self,
+        keys: Iterable[tuple],
+        product: Product,
+    ) -> None:
+        """Adds the saved endpoints of the product matching any of the keys to the cache"""
+        product_endpoints = self.endpoint_cache.setdefault(product.id, {})
+        keys = set(keys)
+        hosts = {key[2] for key in keys}
+        host_filter = Q(host_lower__in=[host for host in hosts if host is not None])
+        if None in hosts:
+            host_filter |= Q(host__isnull=True)
+        saved_endpoints = (
+            Endpoint.objects.filter(product=product)
+            .annotate(host_lower=Lower("host"))
+            .filter(host_filter)
+            .order_by("id")
+        )
+        fetched_keys = set()
+        for saved_endpoint in saved_endpoints:
+            key = endpoint_key(saved_endpoint)
+            if key not in keys:
+                continue
+            if key in fetched_keys:
+                logger.warning(
+                    f"Endpoints in your database are broken. "
+                    f"Please access {reverse('endpoint_migrate')} and migrate them to new format or remove them.",
+                )
+                continue
+            # Like endpoint_get_or_create, the oldest endpoint is used if there are duplicates
+            fetched_keys.add(key)
+            product_endpoints[key] = saved_endpoint
 
     @dojo_async_task
     @app.task()
@@ -65,6 +156,7 @@ class EndpointManager:
     ) -> None:
         """Mitigates all endpoint status objects that are supplied"""
         now = timezone.now()
+        endpoint_status_to_mitigate = []
         for endpoint_status in endpoint_status_list:
             # Only mitigate endpoints that are actually active
             if endpoint_status.mitigated is False:
@@ -72,7 +164,13 @@ class EndpointManager:
                 endpoint_status.last_modified = now
                 endpoint_status.mitigated_by = user
                 endpoint_status.mitigated = True
-                endpoint_status.save()
+                endpoint_status_to_mitigate.append(endpoint_status)
+        # Endpoint_Status has no save() logic or signals, so a single bulk update is equivalent
+        Endpoint_Status.objects.bulk_update(
+            endpoint_status_to_mitigate,
+            ["mitigated_time", "last_modified", "mitigated_by", "mitigated"],
+            batch_size=1000,
+        )
         return
 
     @dojo_async_task
@@ -62,6 +62,7 @@ class ImporterOptions:
         self.engagement: Engagement | None = self.validate_engagement(*args, **kwargs)
         self.environment: Development_Environment | None = self.validate_environment(*args, **kwargs)
         self.group_by: str = self.validate_group_by(*args, **kwargs)
+        self.import_job: Test_Import | None = self.validate_import_job(*args, **kwargs)
         self.import_type: str = self.validate_import_type(*args, **kwargs)
         self.lead: Dojo_User | None = self.validate_lead(*args, **kwargs)
         self.minimum_severity: str = self.validate_minimum_severity(*args, **kwargs)
@@ -415,6 +416,19 @@ class ImporterOptions:
             **kwargs,
         )
 
+    def validate_import_job(
+        self,
+        *args: list,
+        **kwargs: dict,
+    ) -> Test_Import | None:
+        return self.validate(
+            "import_job",
+            expected_types=[Test_Import],
+            required=False,
+            default=None,
+            **kwargs,
+        )
+
     def validate_import_type(
         self,
         *args: list,
@@ -0,0 +1,264 @@
+import json
+import logging
+import resource
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from crum import impersonate
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from dojo import __version__
+from dojo.decorators import dojo_async_task_counter
+from dojo.importers.default_importer import DefaultImporter
+from dojo.importers.default_reimporter import DefaultReImporter
+from dojo.models import Development_Environment, Dojo_User, Engagement, Finding, Product, Product_Type, UserContactInfo
+
+logger = logging.getLogger(__name__)
+
+SEVERITIES = ["Critical", "High", "Medium", "Low", "Info"]
+# the number of distinct hosts the generated endpoints are spread over, like the hosts of a real product
+ENDPOINT_HOSTS = 50
+
+
+def generate_generic_report(finding_numbers, endpoints_per_finding):
+    findings = []
+    for number in finding_numbers:
+        finding = {
+            "title": f"Benchmark finding {number}",
+            "description": f"Description of benchmark finding {number}",
+            "severity": SEVERITIES[number % len(SEVERITIES)],
+            "date": "2025-01-01",
+            "cwe": 79,
+            "unique_id_from_tool": f"benchmark-{number}",
+            "vulnerability_ids": [f"CVE-2025-{number:06d}"],
+        }
+        if endpoints_per_finding:
+            finding["endpoints"] = [
+                f"https://host{(number + index) % ENDPOINT_HOSTS}.example.com/path/{index}"
+                for index in range(endpoints_per_finding)
+            ]
+        findings.append(finding)
+    return ".json", json.dumps({"findings": findings})
+
+
+def generate_zap_report(finding_numbers, endpoints_per_finding):
+    alert_items = []
+    for number in finding_numbers:
+        instances = "".join(
+            f"<instance><uri>https://host{(number + index) % ENDPOINT_HOSTS}.example.com/path/{index}</uri>"
+            f"<method>GET</method><param>param{index}</param><evidence>evidence</evidence></instance>"
+            for index in range(endpoints_per_finding)
+        )
+        alert_items.append(
+            f"<alertitem><pluginid>{number}</pluginid><alert>{escape(f'Benchmark alert {number}')}</alert>"
+            f"<name>Benchmark alert {number}</name><riskcode>{number % 4}</riskcode><confidence>2</confidence>"
+            f"<desc>Description of benchmark alert {number}</desc><instances>{instances}</instances>"
+            f"<count>{endpoints_per_finding}</count><solution>Solution</solution><reference>Reference</reference>"
+            f"<cweid>79</cweid><wascid>8</wascid><sourceid>3</sourceid></alertitem>",
+        )
+    return ".xml", (
+        '<?xml version="1.0"?><OWASPZAPReport version="2.9.0" generated="Wed, 1 Jan 2025 00:00:00">'
+        f'<site name="https://host0.example.com" host="host0.example.com" port="443" ssl="true"><alerts>{"".join(alert_items)}</alerts></site>'
+        "</OWASPZAPReport>"
+    )
+
+
+def generate_trivy_report(finding_numbers, endpoints_per_finding):
+    # dependency scanners report packages, so there are no endpoints
+    vulnerabilities = [
+        {
+            "VulnerabilityID": f"CVE-2025-{number:06d}",
+            "PkgName": f"package{number % 500}",
+            "InstalledVersion": "1.0.0",
+            "FixedVersion": "1.0.1",
+            "Description": f"Description of benchmark vulnerability {number}",
+            "Severity": SEVERITIES[number % 4].upper(),
+            "CweIDs": ["CWE-79"],
+            "References": [f"https://example.com/CVE-2025-{number:06d}"],
+        }
+        for number in finding_numbers
+    ]
+    return ".json", json.dumps([{"Target": "benchmark (debian 12)", "Type": "debian", "Vulnerabilities": vulnerabilities}])
+
+
+REPORT_GENERATORS = {
+    "Generic Findings Import": generate_generic_report,
+    "Trivy Scan": generate_trivy_report,
+    "ZAP Scan": generate_zap_report,
+}
+SCAN_TYPES_WITHOUT_ENDPOINTS = {"Trivy Scan"}
+
+
+class Measurement:
+
+    """Records the wall time, the number of database queries and the number of celery tasks of a block of code"""
+
+    def __init__(self):
+        self.queries = 0
+
+    def count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def measure(self):
+        dojo_async_task_counter.start()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(self.count_query):
+                yield self
+        finally:
+            self.wall_time = time.perf_counter() - start
+            dojo_async_task_counter.stop()
+            self.async_tasks = dojo_async_task_counter.get()
+            # the peak memory usage of the process so far, in kilobytes on Linux
+            self.peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def as_dict(self):
+        return {
+            "wall_time_seconds": round(self.wall_time, 3),
+            "queries": self.queries,
+            "async_tasks": self.async_tasks,
+            "peak_rss_mb": round(self.peak_rss / 1024, 1),
+        }
+
+
+class Command(BaseCommand):
+
+    help = (
+        "EXPERIMENTAL: May be changed/deprecated/removed without prior notice. "
+        "Measures the performance of importing and reimporting generated reports of the given sizes. "
+        "For every scan type, size and with and without endpoints, a report is imported, reimported "
+        "unchanged and reimported with 10% of the findings replaced by new ones. The wall time, number of "
+        "database queries, peak memory usage of the process and number of celery tasks of each step "
+        "are written to a JSON file. Run it against a database that is not used otherwise."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1000], help="Number of findings in the generated reports, defaults to 1000")
+        parser.add_argument("--scan-types", nargs="+", choices=sorted(REPORT_GENERATORS), default=sorted(REPORT_GENERATORS), help="Scan types to generate reports for, defaults to all")
+        parser.add_argument("--endpoints", choices=["with", "without", "both"], default="both", help="Generate reports with endpoints, without endpoints or both, defaults to both")
+        parser.add_argument("--endpoints-per-finding", type=int, default=3, help="Number of endpoints per finding in reports with endpoints, defaults to 3")
+        parser.add_argument("--output", default="import_benchmark.json", help="JSON file to write the results to, defaults to import_benchmark.json")
+        parser.add_argument(
+            "--async",
+            dest="run_async",
+            action="store_true",
+            default=False,
+            help="Send the background tasks to celery instead of running them in the foreground. Their duration is not measured then.",
+        )
+        parser.add_argument("--keep-data", action="store_true", default=False, help="Keep the products, product type and user created by the benchmark")
+
+    def get_benchmark_user(self, *, run_async):
+        user, _ = Dojo_User.objects.get_or_create(username="import_benchmark", defaults={"is_superuser": True})
+        contact_info, _ = UserContactInfo.objects.get_or_create(user=user)
+        contact_info.block_execution = not run_async
+        contact_info.save()
+        return user
+
+    def remove_benchmark_user_and_product_type(self, user):
+        # products kept by earlier runs with --keep-data still use them
+        Product_Type.objects.filter(name="Import benchmark", prod_type__isnull=True).delete()
+        if not Finding.objects.filter(reporter=user).exists():
+            user.delete()
+
+    def write_report(self, directory, scan_type, finding_numbers, endpoints_per_finding):
+        suffix, content = REPORT_GENERATORS[scan_type](finding_numbers, endpoints_per_finding)
+        path = Path(directory) / f"report_{finding_numbers.start}_{finding_numbers.stop}{suffix}"
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def run_step(self, name, importer, report):
+        measurement = Measurement()
+        with report.open(encoding="utf-8") as scan, measurement.measure():
+            test, _, new_findings, closed_findings, reactivated_findings, untouched_findings, _ = importer.process_scan(scan)
+        result = {
+            "step": name,
+            **measurement.as_dict(),
+            "new_findings": new_findings,
+            "closed_findings": closed_findings,
+            "reactivated_findings": reactivated_findings,
+            "untouched_findings": untouched_findings,
+        }
+        logger.info("%s: %s", name, result)
+        return test, result
+
+    def benchmark(self, user, scan_type, size, endpoints_per_finding, *, run_async):
+        product_type, _ = Product_Type.objects.get_or_create(name="Import benchmark")
+        product = Product.objects.create(
+            name=f"Import benchmark {scan_type} {size} {endpoints_per_finding} {timezone.now().isoformat()}",
+            description="Created by the benchmark_import command",
+            prod_type=product_type,
+        )
+        engagement = Engagement.objects.create(name="Import benchmark", product=product, target_start=timezone.now(), target_end=timezone.now())
+        environment, _ = Development_Environment.objects.get_or_create(name="Development")
+        options = {
+            "user": user,
+            "lead": user,
+            "scan_type": scan_type,
+            "scan_date": None,
+            "minimum_severity": "Info",
+            "active": True,
+            "verified": True,
+            "sync": not run_async,
+        }
+        results = []
+        with tempfile.TemporaryDirectory() as directory:
+            report = self.write_report(directory, scan_type, range(size), endpoints_per_finding)
+            # a tenth of the findings is closed and replaced by new ones
+            changed_report = self.write_report(directory, scan_type, range(size // 10, size + size // 10), endpoints_per_finding)
+            test, result = self.run_step("import", DefaultImporter(engagement=engagement, environment=environment, **options), report)
+            results.append(result)
+            # like the API, the reimports close the findings that are no longer in the report
+            test, result = self.run_step("reimport_unchanged", DefaultReImporter(test=test, close_old_findings=True, **options), report)
+            results.append(result)
+            test, result = self.run_step("reimport_changed", DefaultReImporter(test=test, close_old_findings=True, **options), changed_report)
+            results.append(result)
+        return product, results
+
+    def handle(self, *args, **options):
+        logger.info("EXPERIMENTAL: This command may be changed/deprecated/removed without prior notice.")
+        run_async = options["run_async"]
+        endpoint_variants = {"with": [True], "without": [False], "both": [False, True]}[options["endpoints"]]
+        user = self.get_benchmark_user(run_async=run_async)
+        runs = []
+        with impersonate(user):
+            for size in sorted(options["sizes"]):
+                for scan_type in options["scan_types"]:
+                    for with_endpoints in endpoint_variants:
+                        if with_endpoints and scan_type in SCAN_TYPES_WITHOUT_ENDPOINTS:
+                            continue
+                        endpoints_per_finding = options["endpoints_per_finding"] if with_endpoints else 0
+                        logger.info("benchmarking %s with %i findings and %i endpoints per finding", scan_type, size, endpoints_per_finding)
+                        product, results = self.benchmark(user, scan_type, size, endpoints_per_finding, run_async=run_async)
+                        runs.append({
+                            "scan_type": scan_type,
+                            "findings": size,
+                            "endpoints_per_finding": endpoints_per_finding,
+                            "steps": results,
+                        })
+                        if not options["keep_data"]:
+                            product.delete()
+        if not options["keep_data"]:
+            self.remove_benchmark_user_and_product_type(user)
+
+        output = {
+            "version": __version__,
+            "created": timezone.now().isoformat(),
+            "async": run_async,
+            "settings": {
+                "IMPORT_BULK_CREATE": settings.IMPORT_BULK_CREATE,
+                "IMPORT_BULK_CREATE_BATCH_SIZE": settings.IMPORT_BULK_CREATE_BATCH_SIZE,
+                "IMPORT_CHUNK_SIZE": settings.IMPORT_CHUNK_SIZE,
+            },
+            "runs": runs,
+        }
+        with Path(options["output"]).open("w", encoding="utf-8") as output_file:
+            json.dump(output, output_file, indent=2)
+        self.stdout.write(f"Results written to {options['output']}")
@@ -1,9 +1,13 @@
 import logging
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 from django.core.management.base import BaseCommand
+from django.db import connections
 from pytz import timezone
 
-from dojo.models import Finding, Product
+from dojo.models import Finding, Product, compute_hash_codes
 from dojo.utils import (
     calculate_grade,
     do_dedupe_finding,
@@ -18,22 +22,50 @@ logger = logging.getLogger(__name__)
 deduplicationLogger = logging.getLogger("dojo.specific-loggers.deduplication")
 
 
-def generate_hash_code(f):
-    old_hash_code = f.hash_code
-    f.hash_code = f.compute_hash_code()
-    if f.hash_code != old_hash_code:
-        logger.debug("%d: hash_code changed from %s to %s", f.id, old_hash_code, f.hash_code)
-    return f
+def get_findings(restrict_to_parsers):
+    if restrict_to_parsers is not None:
+        return Finding.objects.filter(test__test_type__name__in=restrict_to_parsers)
+    # add filter on id to make counts not slow on mysql
+    return Finding.objects.all().filter(id__gt=0)
+
+
+def generate_hash_codes_for_range(start_id, end_id, restrict_to_parsers, dry_run):
+    """
+    Recomputes the hash codes of the findings with an id in [start_id, end_id) and saves the changed ones
+    with a single bulk_update. Returns the number of findings processed and the number of changed hash codes per test type.
+    This runs in the worker processes of the pool, so everything it needs is passed as picklable arguments.
+    """
+    findings = list(
+        get_findings(restrict_to_parsers)
+        .filter(id__gte=start_id, id__lt=end_id)
+        .select_related("test__test_type", "test__engagement")
+        .order_by("id"),
+    )
+    changed = []
+    changed_per_test_type = Counter()
+    # the hash codes are computed with the compiled plan of each test type, and the endpoints and
+    # vulnerability ids are prefetched for the whole range if the plans need them
+    for finding, hash_code in zip(findings, compute_hash_codes(findings), strict=True):
+        if hash_code != finding.hash_code:
+            logger.debug("%d: hash_code changed from %s to %s", finding.id, finding.hash_code, hash_code)
+            finding.hash_code = hash_code
+            changed.append(finding)
+            changed_per_test_type[finding.test.test_type.name] += 1
+    if changed and not dry_run:
+        Finding.objects.bulk_update(changed, ["hash_code"])
+    return len(findings), changed_per_test_type
 
 
 class Command(BaseCommand):
 
     """
     Updates hash codes and/or runs deduplication for findings. Hashcode calculation always runs in the foreground, dedupe by default runs in the background.
-    Usage: manage.py dedupe [--parser "Parser1 Scan" --parser "Parser2 Scan"...] [--hash_code_only] [--dedupe_only] [--dedupe_sync]'
+    Usage: manage.py dedupe [--parser "Parser1 Scan" --parser "Parser2 Scan"...] [--hash_code_only] [--dedupe_only] [--dedupe_sync]
+                            [--workers N] [--chunk_size N] [--resume_from_id ID] [--dry_run]
     """
 
-    help = 'Usage: manage.py dedupe [--parser "Parser1 Scan" --parser "Parser2 Scan"...] [--hash_code_only] [--dedupe_only] [--dedupe_sync]'
+    help = ('Usage: manage.py dedupe [--parser "Parser1 Scan" --parser "Parser2 Scan"...] [--hash_code_only] [--dedupe_only] [--dedupe_sync] '
+            "[--workers N] [--chunk_size N] [--resume_from_id ID] [--dry_run]")
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -46,30 +78,38 @@ class Command(BaseCommand):
         parser.add_argument("--hash_code_only", action="store_true", help="Only compute hash codes")
         parser.add_argument("--dedupe_only", action="store_true", help="Only run deduplication")
         parser.add_argument("--dedupe_sync", action="store_true", help="Run dedupe in the foreground, default false")
+        parser.add_argument("--workers", type=int, default=1, help="Number of processes computing hash codes, default 1")
+        parser.add_argument("--chunk_size", type=int, default=1000, help="Size of the finding id ranges that are hashed and saved at once, default 1000")
+        parser.add_argument("--resume_from_id", type=int, default=0, help="Only compute hash codes for findings with this id or higher, to resume an interrupted run")
+        parser.add_argument("--dry_run", action="store_true", help="Only report how many hash codes would change per test type, without saving them or deduplicating")
 
     def handle(self, *args, **options):
         restrict_to_parsers = options["parser"]
         hash_code_only = options["hash_code_only"]
         dedupe_only = options["dedupe_only"]
         dedupe_sync = options["dedupe_sync"]
+        dry_run = options["dry_run"]
 
+        findings = get_findings(restrict_to_parsers)
         if restrict_to_parsers is not None:
-            findings = Finding.objects.filter(test__test_type__name__in=restrict_to_parsers)
             logger.info("######## Will process only parsers %s and %d findings ########", *restrict_to_parsers, findings.count())
         else:
-            # add filter on id to make counts not slow on mysql
-            findings = Finding.objects.all().filter(id__gt=0)
             logger.info("######## Will process the full database with %d findings ########", findings.count())
 
         # Phase 1: update hash_codes without deduplicating
         if not dedupe_only:
             logger.info("######## Start Updating Hashcodes (foreground) ########")
+            changed_per_test_type = self.update_hash_codes(findings, restrict_to_parsers, **options)
+            logger.info("######## Done Updating Hashcodes########")
 
-            # only prefetch here for hash_code calculation
-            finds = findings.prefetch_related("endpoints", "test__test_type")
-            mass_model_updater(Finding, finds, generate_hash_code, fields=["hash_code"], order="asc", log_prefix="hash_code computation ")
+            if dry_run:
+                self.stdout.write(f"{sum(changed_per_test_type.values())} hash codes would change")
+                for test_type, count in sorted(changed_per_test_type.items()):
+                    self.stdout.write(f"{test_type}: {count}")
 
-            logger.info("######## Done Updating Hashcodes########")
+        # a dry run never changes the findings, so there is nothing to deduplicate
+        if dry_run:
+            return
 
         # Phase 2: deduplicate synchronously
         if not hash_code_only:
@@ -89,3 +129,42 @@ class Command(BaseCommand):
                 logger.info("######## Done deduplicating (%s) ########", ("foreground" if dedupe_sync else "tasks submitted to celery"))
             else:
                 logger.debug("skipping dedupe because it's disabled in system settings")
+
+    def update_hash_codes(self, findings, restrict_to_parsers, *, workers, chunk_size, resume_from_id, dry_run, **kwargs):
+        """
+        Splits the id space of the findings into ranges of chunk_size ids and recomputes the hash codes range by range,
+        in a pool of worker processes if more than one worker is requested. The ranges are handled in order, so after
+        each range the next id to resume from is logged.
+        """
+        findings = findings.filter(id__gte=resume_from_id)
+        first = findings.order_by("id").values_list("id", flat=True).first()
+        last = findings.order_by("-id").values_list("id", flat=True).first()
+        changed_per_test_type = Counter()
+        if first is None:
+            return changed_per_test_type
+        ranges = [(start_id, min(start_id + chunk_size, last + 1)) for start_id in range(first, last + 1, chunk_size)]
+
+        if workers > 1:
+            # the worker processes can not share the database connections of this process
+            connections.close_all()
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+            results = executor.map(
+                generate_hash_codes_for_range,
+                *zip(*ranges, strict=True),
+                [restrict_to_parsers] * len(ranges),
+                [dry_run] * len(ranges),
+            )
+        else:
+            executor = None
+            results = (generate_hash_codes_for_range(start_id, end_id, restrict_to_parsers, dry_run) for start_id, end_id in ranges)
+
+        processed = 0
+        try:
+            for (_start_id, end_id), (count, changed) in zip(ranges, results, strict=True):
+                processed += count
+                changed_per_test_type.update(changed)
+                logger.info("hash_code computation %d findings processed, %d hash codes changed, resume with --resume_from_id %d", processed, sum(changed_per_test_type.values()), end_id)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+        return changed_per_test_type
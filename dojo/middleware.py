@@ -1,13 +1,16 @@
+import copy
 import logging
 import re
 import time
 from contextlib import suppress
 from threading import local
 from urllib.parse import quote
+from uuid import uuid4
 
 from auditlog.context import set_actor
 from auditlog.middleware import AuditlogMiddleware as _AuditlogMiddleware
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.http import HttpResponseRedirect
 from django.urls import reverse
@@ -105,13 +108,25 @@ class DojoSytemSettingsMiddleware:
     @classmethod
     def load(cls):
         from dojo.models import System_Settings
-        system_settings = System_Settings.objects.get(no_cache=True)
+        system_settings = System_Settings.objects.get_from_process_cache()
         cls._thread_local.system_settings = system_settings
         return system_settings
 
 
+SYSTEM_SETTINGS_VERSION_KEY = "system_settings_version"
+
+
+def invalidate_system_settings():
+    """Makes all processes load the system settings from the database again on their next use"""
+    if settings.SYSTEM_SETTINGS_CACHE_TIMEOUT > 0:
+        cache.set(SYSTEM_SETTINGS_VERSION_KEY, uuid4().hex, timeout=None)
+
+
 class System_Settings_Manager(models.Manager):
 
+    # (version, load time, system settings) of the system settings kept in memory by this process
+    _process_cache = None
+
     def get_from_db(self, *args, **kwargs):
         # logger.debug('refreshing system_settings from db')
         try:
@@ -124,6 +139,34 @@ class System_Settings_Manager(models.Manager):
             return System_Settings()
         return from_db
 
+    def get_from_process_cache(self, *args, **kwargs):
+        """
+        Returns the system settings kept in memory by this process, as long as the version in the
+        cache shared between all processes has not changed and they were loaded less than
+        SYSTEM_SETTINGS_CACHE_TIMEOUT seconds ago. Without SYSTEM_SETTINGS_CACHE_TIMEOUT, they are
+        loaded from the database. Every caller gets a copy, so changes made to it are not seen by others
+        """
+        if settings.SYSTEM_SETTINGS_CACHE_TIMEOUT <= 0 or args or kwargs:
+            return self.get_from_db(*args, **kwargs)
+
+        version = cache.get(SYSTEM_SETTINGS_VERSION_KEY)
+        if version is None:
+            cache.add(SYSTEM_SETTINGS_VERSION_KEY, uuid4().hex, timeout=None)
+            version = cache.get(SYSTEM_SETTINGS_VERSION_KEY)
+        # the tuple is replaced as a whole, so other threads never see a partial update
+        process_cache = System_Settings_Manager._process_cache
+        if process_cache is not None:
+            cached_version, loaded, system_settings = process_cache
+            if cached_version == version and time.monotonic() - loaded < settings.SYSTEM_SETTINGS_CACHE_TIMEOUT:
+                return copy.copy(system_settings)
+
+        system_settings = self.get_from_db()
+        # the default instance returned when the database is not available is not kept
+        if system_settings.pk is not None:
+            System_Settings_Manager._process_cache = (version, time.monotonic(), system_settings)
+            return copy.copy(system_settings)
+        return system_settings
+
     def get(self, no_cache=False, *args, **kwargs):  # noqa: FBT002 - this is bit hard to fix nice have this universally fixed
         if no_cache:
             # logger.debug('no_cache specified or cached value found, loading system settings from db')
@@ -132,8 +175,8 @@ class System_Settings_Manager(models.Manager):
         from_cache = DojoSytemSettingsMiddleware.get_system_settings()
 
         if not from_cache:
-            # logger.debug('no cached value found, loading system settings from db')
-            return self.get_from_db(*args, **kwargs)
+            # logger.debug('no cached value found, loading system settings from db or the cache of this process')
+            return self.get_from_process_cache(*args, **kwargs)
 
         return from_cache
 
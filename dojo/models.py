@@ -4,10 +4,13 @@ import hashlib
 import logging
 import re
 import warnings
+from collections.abc import Callable
 from contextlib import suppress
 from datetime import datetime, timedelta
 from decimal import Decimal
+from operator import attrgetter
 from pathlib import Path
+from typing import NamedTuple
 from uuid import uuid4
 
 import dateutil
@@ -22,11 +25,13 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from django.core.signals import setting_changed
 from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator, validate_ipv46_address
 from django.db import connection, models
 from django.db.models import Count, JSONField, Q
 from django.db.models.expressions import Case, When
 from django.db.models.functions import Lower
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.deconstruct import deconstructible
@@ -1228,6 +1233,13 @@ class Product(models.Model):
         from django.urls import reverse
         return reverse("view_product", args=[str(self.id)])
 
+    def delete(self, *args, **kwargs):
+        from dojo.product.helpers import product_counters_deferred
+        # the counters are deleted with the product, so the deleted findings, endpoints and
+        # engagements don't need to mark them as stale one by one
+        with product_counters_deferred():
+            return super().delete(*args, **kwargs)
+
     @cached_property
     def findings_count(self):
         try:
@@ -1616,8 +1628,12 @@ class Engagement(models.Model):
     def delete(self, *args, **kwargs):
         logger.debug("%d engagement delete", self.id)
         from dojo.finding import helper
+        from dojo.product.helpers import mark_product_counters_stale, product_counters_deferred
         helper.prepare_duplicates_for_delete(engagement=self)
-        super().delete(*args, **kwargs)
+        # the counters are marked as stale once, instead of once for every deleted finding and endpoint status
+        with product_counters_deferred():
+            super().delete(*args, **kwargs)
+        mark_product_counters_stale(product_id=self.product_id)
         with suppress(Product.DoesNotExist):
             # Suppressing a potential issue created from async delete removing
             # related objects in a separate task
@@ -2225,7 +2241,11 @@ class Test(models.Model):
 
     def delete(self, *args, **kwargs):
         logger.debug("%d test delete", self.id)
-        super().delete(*args, **kwargs)
+        from dojo.product.helpers import mark_product_counters_stale, product_counters_deferred
+        # the counters are marked as stale once, instead of once for every deleted finding and endpoint status
+        with product_counters_deferred():
+            super().delete(*args, **kwargs)
+        mark_product_counters_stale(product__engagement=self.engagement_id)
         with suppress(Engagement.DoesNotExist, Product.DoesNotExist):
             # Suppressing a potential issue created from async delete removing
             # related objects in a separate task
@@ -2247,7 +2267,20 @@ class Test_Import(TimeStampedModel):
     IMPORT_TYPE = "import"
     REIMPORT_TYPE = "reimport"
 
-    test = models.ForeignKey(Test, editable=False, null=False, blank=False, on_delete=models.CASCADE)
+    STATUS_PENDING = "Pending"
+    STATUS_RUNNING = "Running"
+    STATUS_COMPLETED = "Completed"
+    STATUS_FAILED = "Failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_COMPLETED, _("Completed")),
+        (STATUS_FAILED, _("Failed")),
+    )
+
+    # the test is only empty while an asynchronous import into a new test has not created it yet,
+    # or when the import failed before its findings could be imported
+    test = models.ForeignKey(Test, editable=False, null=True, blank=True, on_delete=models.CASCADE)
     findings_affected = models.ManyToManyField("Finding", through="Test_Import_Finding_Action")
     import_settings = JSONField(null=True)
     type = models.CharField(max_length=64, null=False, blank=False, default="unknown")
@@ -2260,6 +2293,15 @@ class Test_Import(TimeStampedModel):
     branch_tag = models.CharField(editable=True, max_length=150,
                                    null=True, blank=True, help_text=_("Tag or branch that was tested, a reimport may update this field."), verbose_name=_("Branch/Tag"))
 
+    # fields of asynchronous import jobs, imports that were processed in the request are completed right away
+    engagement = models.ForeignKey(Engagement, editable=False, null=True, blank=True, on_delete=models.CASCADE,
+                                   help_text=_("Engagement the report of an asynchronous import job is imported into."))
+    status = models.CharField(editable=False, max_length=16, choices=STATUS_CHOICES, default=STATUS_COMPLETED)
+    progress = JSONField(editable=False, null=True, help_text=_("Number of findings parsed, matched, created and closed so far."))
+    error = models.TextField(editable=False, null=True, blank=True)
+    scan_file = models.FileField(editable=False, null=True, blank=True, upload_to=UniqueUploadNameProvider("import_jobs", keep_basename=True),
+                                 help_text=_("Uploaded report of an asynchronous import job, removed once it has been processed."))
+
     def get_queryset(self):
         logger.debug("prefetch test_import counts")
         super_query = super().get_queryset()
@@ -2302,6 +2344,82 @@ class Test_Import_Finding_Action(TimeStampedModel):
         return f"{self.finding.id}: {self.action}"
 
 
+# The compiled hash code plans per (test type name, scan type), see get_hash_code_plan
+HASH_CODE_PLANS = {}
+
+
+class HashCodePlan(NamedTuple):
+    fields: tuple[str, ...]
+    getters: tuple[Callable, ...]
+    allows_null_cwe: bool
+
+
+def _get_hash_code_field_getter(field):
+    # For endpoints and vulnerability_ids, need to compute the field
+    if field == "endpoints":
+        return Finding.get_endpoints
+    if field == "vulnerability_ids":
+        return Finding.get_vulnerability_ids
+    # Generically use the finding attribute having the same name, converts to str in case it's integer
+    getter = attrgetter(field)
+    return lambda finding: str(getter(finding))
+
+
+def get_hash_code_plan(test):
+    """
+    Returns the plan used to compute the hash codes of the findings of the test: the fields of
+    HASHCODE_FIELDS_PER_SCANNER and their getters, or None when the legacy algorithm must be used.
+    The plan is compiled once per test type and scan type, and again when the hash code settings change
+    """
+    key = (test.test_type.name, test.scan_type)
+    if key in HASH_CODE_PLANS:
+        return HASH_CODE_PLANS[key]
+
+    plan = None
+    # Check if all needed settings are defined
+    if not hasattr(settings, "HASHCODE_FIELDS_PER_SCANNER") or not hasattr(settings, "HASHCODE_ALLOWS_NULL_CWE") or not hasattr(settings, "HASHCODE_ALLOWED_FIELDS"):
+        deduplicationLogger.debug("no or incomplete configuration per hash_code found; using legacy algorithm")
+    # Check if hash_code fields are found in the settings
+    elif not (hash_code_fields := test.hash_code_fields):
+        deduplicationLogger.debug("No configuration for hash_code computation found; using legacy algorithm for %s", key)
+    # Check if all elements of HASHCODE_FIELDS_PER_SCANNER are in HASHCODE_ALLOWED_FIELDS
+    elif not all(elem in settings.HASHCODE_ALLOWED_FIELDS for elem in hash_code_fields):
+        deduplicationLogger.debug(
+            "compute_hash_code - configuration error: some elements of HASHCODE_FIELDS_PER_SCANNER are not in the allowed list HASHCODE_ALLOWED_FIELDS. "
+            "Using default fields")
+    else:
+        plan = HashCodePlan(
+            fields=tuple(hash_code_fields),
+            getters=tuple(_get_hash_code_field_getter(field) for field in hash_code_fields),
+            allows_null_cwe=test.hash_code_allows_null_cwe,
+        )
+        deduplicationLogger.debug("hash_code of %s computed based on: %s", key, ", ".join(plan.fields))
+    HASH_CODE_PLANS[key] = plan
+    return plan
+
+
+@receiver(setting_changed)
+def clear_hash_code_plans(*args, setting, **kwargs):
+    if setting.startswith(("HASHCODE_", "HASH_CODE_")):
+        HASH_CODE_PLANS.clear()
+
+
+def compute_hash_codes(findings):
+    """
+    Computes the hash codes of a list of findings, saved or not, without setting them. The endpoints and
+    vulnerability ids of the saved findings are prefetched at once when the hash code plans need them
+    """
+    if saved_findings := [finding for finding in findings if finding.id is not None]:
+        fields = set()
+        for finding in saved_findings:
+            if plan := get_hash_code_plan(finding.test):
+                fields.update(plan.fields)
+        lookups = [lookup for field, lookup in (("endpoints", "endpoints"), ("vulnerability_ids", "vulnerability_id_set")) if field in fields]
+        if lookups:
+            models.prefetch_related_objects(saved_findings, *lookups)
+    return [finding.compute_hash_code() for finding in findings]
+
+
 class Finding(models.Model):
     title = models.CharField(max_length=511,
                              verbose_name=_("Title"),
@@ -2702,29 +2820,7 @@ class Finding(models.Model):
         if not user:
             from dojo.utils import get_current_user
             user = get_current_user()
-        # Title Casing
-        from titlecase import titlecase
-        self.title = titlecase(self.title[:511])
-        # Set the date of the finding if nothing is supplied
-        if self.date is None:
-            self.date = timezone.now()
-        # Assign the numerical severity for correct sorting order
-        self.numerical_severity = Finding.get_numerical_severity(self.severity)
-
-        # Synchronize cvssv3 score using cvssv3 vector
-        if self.cvssv3:
-            try:
-
-                cvss_data = parse_cvss_data(self.cvssv3)
-                if cvss_data:
-                    self.cvssv3 = cvss_data.get("vector")
-                    self.cvssv3_score = cvss_data.get("score")
-
-            except Exception as ex:
-                logger.warning("Can't compute cvssv3 score for finding id %i. Invalid cvssv3 vector found: '%s'. Exception: %s.", self.id, self.cvssv3, ex)
-                # remove invalid cvssv3 vector for new findings, or should we just throw a ValidationError?
-                if self.pk is None:
-                    self.cvssv3 = None
+        self.normalize_fields()
 
         self.set_hash_code(dedupe_option)
 
@@ -2770,6 +2866,32 @@ class Finding(models.Model):
         from django.urls import reverse
         return reverse("view_finding", args=[str(self.id)])
 
+    def normalize_fields(self):
+        """Normalizes the fields of the finding that are derived from other fields, without touching the database"""
+        # Title Casing
+        from titlecase import titlecase
+        self.title = titlecase(self.title[:511])
+        # Set the date of the finding if nothing is supplied
+        if self.date is None:
+            self.date = timezone.now()
+        # Assign the numerical severity for correct sorting order
+        self.numerical_severity = Finding.get_numerical_severity(self.severity)
+
+        # Synchronize cvssv3 score using cvssv3 vector
+        if self.cvssv3:
+            try:
+
+                cvss_data = parse_cvss_data(self.cvssv3)
+                if cvss_data:
+                    self.cvssv3 = cvss_data.get("vector")
+                    self.cvssv3_score = cvss_data.get("score")
+
+            except Exception as ex:
+                logger.warning("Can't compute cvssv3 score for finding id %i. Invalid cvssv3 vector found: '%s'. Exception: %s.", self.id, self.cvssv3, ex)
+                # remove invalid cvssv3 vector for new findings, or should we just throw a ValidationError?
+                if self.pk is None:
+                    self.cvssv3 = None
+
     def copy(self, test=None):
         copy = _copy_model_util(self)
         # Save the necessary ManyToMany relationships
@@ -2831,58 +2953,21 @@ class Finding(models.Model):
         return None
 
     def compute_hash_code(self):
-
-        # Check if all needed settings are defined
-        if not hasattr(settings, "HASHCODE_FIELDS_PER_SCANNER") or not hasattr(settings, "HASHCODE_ALLOWS_NULL_CWE") or not hasattr(settings, "HASHCODE_ALLOWED_FIELDS"):
-            deduplicationLogger.debug("no or incomplete configuration per hash_code found; using legacy algorithm")
-            return self.compute_hash_code_legacy()
-
-        hash_code_fields = self.test.hash_code_fields
-
-        # Check if hash_code fields are found in the settings
-        if not hash_code_fields:
-            deduplicationLogger.debug(
-                "No configuration for hash_code computation found; using default fields for " + ("dynamic" if self.dynamic_finding else "static") + " scanners")
-            return self.compute_hash_code_legacy()
-
-        # Check if all elements of HASHCODE_FIELDS_PER_SCANNER are in HASHCODE_ALLOWED_FIELDS
-        if not (all(elem in settings.HASHCODE_ALLOWED_FIELDS for elem in hash_code_fields)):
-            deduplicationLogger.debug(
-                "compute_hash_code - configuration error: some elements of HASHCODE_FIELDS_PER_SCANNER are not in the allowed list HASHCODE_ALLOWED_FIELDS. "
-                "Using default fields")
+        plan = get_hash_code_plan(self.test)
+        if plan is None:
             return self.compute_hash_code_legacy()
 
         # Make sure that we have a cwe if we need one
-        if self.cwe == 0 and not self.test.hash_code_allows_null_cwe:
+        if self.cwe == 0 and not plan.allows_null_cwe:
             deduplicationLogger.warning(
-                "Cannot compute hash_code based on configured fields because cwe is 0 for finding of title '" + self.title + "' found in file '" + str(self.file_path)
-                + "'. Fallback to legacy mode for this finding.")
+                "Cannot compute hash_code based on configured fields because cwe is 0 for finding of title '%s' found in file '%s'. "
+                "Fallback to legacy mode for this finding.", self.title, self.file_path)
             return self.compute_hash_code_legacy()
 
-        deduplicationLogger.debug("computing hash_code for finding id " + str(self.id) + " based on: " + ", ".join(hash_code_fields))
-
-        fields_to_hash = ""
-        for hashcodeField in hash_code_fields:
-            if hashcodeField == "endpoints":
-                # For endpoints, need to compute the field
-                myEndpoints = self.get_endpoints()
-                fields_to_hash += myEndpoints
-                deduplicationLogger.debug(hashcodeField + " : " + myEndpoints)
-            elif hashcodeField == "vulnerability_ids":
-                # For vulnerability_ids, need to compute the field
-                my_vulnerability_ids = self.get_vulnerability_ids()
-                fields_to_hash += my_vulnerability_ids
-                deduplicationLogger.debug(hashcodeField + " : " + my_vulnerability_ids)
-            else:
-                # Generically use the finding attribute having the same name, converts to str in case it's integer
-                fields_to_hash += str(getattr(self, hashcodeField))
-                deduplicationLogger.debug(hashcodeField + " : " + str(getattr(self, hashcodeField)))
-        deduplicationLogger.debug("compute_hash_code - fields_to_hash = " + fields_to_hash)
-        return self.hash_fields(fields_to_hash)
+        return self.hash_fields("".join([getter(self) for getter in plan.getters]))
 
     def compute_hash_code_legacy(self):
         fields_to_hash = self.title + str(self.cwe) + str(self.line) + str(self.file_path) + self.description
-        deduplicationLogger.debug("compute_hash_code_legacy - fields_to_hash = " + fields_to_hash)
         return self.hash_fields(fields_to_hash)
 
     # Get vulnerability_ids to use for hash_code computation
@@ -2898,10 +2983,8 @@ class Finding(models.Model):
             else:
                 deduplicationLogger.debug("finding has no unsaved vulnerability references")
         else:
-            vulnerability_ids = Vulnerability_Id.objects.filter(finding=self)
-            deduplicationLogger.debug("get_vulnerability_ids after the finding was saved. Vulnerability references count: " + str(vulnerability_ids.count()))
             # convert list of vulnerability_ids to the list of their canonical representation
-            vulnerability_id_str_list = [str(vulnerability_id) for vulnerability_id in vulnerability_ids.all()]
+            vulnerability_id_str_list = [str(vulnerability_id) for vulnerability_id in self.vulnerability_id_set.all()]
             # sort vulnerability_ids strings
             vulnerability_id_str = "".join(sorted(vulnerability_id_str_list))
         return vulnerability_id_str
@@ -2925,7 +3008,6 @@ class Finding(models.Model):
                 # After saving dynamic_finding may be set to False probably during the saving process (observed on Bandit scan before forcing dynamic_finding=False at parser level)
                 deduplicationLogger.debug("trying to get endpoints on a finding before it was saved but no endpoints found (static parser wrongly identified as dynamic?")
         else:
-            deduplicationLogger.debug("get_endpoints: after the finding was saved. Endpoints count: " + str(self.endpoints.count()))
             # convert list of endpoints to the list of their canonical representation
             endpoint_str_list = [str(endpoint) for endpoint in self.endpoints.all()]
             # sort endpoints strings
@@ -2939,11 +3021,10 @@ class Finding(models.Model):
     def hash_fields(self, fields_to_hash):
         if hasattr(settings, "HASH_CODE_FIELDS_ALWAYS"):
             for field in settings.HASH_CODE_FIELDS_ALWAYS:
-                if getattr(self, field):
-                    fields_to_hash += str(getattr(self, field))
+                if value := getattr(self, field):
+                    fields_to_hash += str(value)
 
-        logger.debug("fields_to_hash      : %s", fields_to_hash)
-        logger.debug("fields_to_hash lower: %s", fields_to_hash.lower())
+        deduplicationLogger.debug("fields_to_hash: %s", fields_to_hash)
         return hashlib.sha256(fields_to_hash.casefold().encode("utf-8").strip()).hexdigest()
 
     def duplicate_finding_set(self):
@@ -3061,8 +3142,9 @@ class Finding(models.Model):
         enforce_period = getattr(sla_configuration, str("enforce_" + self.severity.lower()), None)
         return sla_period, enforce_period
 
-    def set_sla_expiration_date(self):
-        system_settings = System_Settings.objects.get()
+    def set_sla_expiration_date(self, system_settings=None):
+        if system_settings is None:
+            system_settings = System_Settings.objects.get()
         if not system_settings.enable_finding_sla:
             return
 
@@ -3444,6 +3526,52 @@ class Stub_Finding(models.Model):
         return bc
 
 
+class Finding_Daily_Severity_Snapshot(models.Model):
+
+    """
+    The number of (non duplicate) findings of a product that were opened, closed and risk accepted
+    on a day, and the number of findings that were open at the end of that day, per severity.
+    Maintained by dojo.product.helpers.update_finding_daily_severity_snapshots
+    """
+
+    product = models.ForeignKey(Product, editable=False, on_delete=models.CASCADE)
+    date = models.DateField(editable=False)
+    severity = models.CharField(max_length=200, editable=False, choices=SEVERITY_CHOICES)
+    opened = models.PositiveIntegerField(default=0, editable=False)
+    closed = models.PositiveIntegerField(default=0, editable=False)
+    risk_accepted = models.PositiveIntegerField(default=0, editable=False)
+    active = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        unique_together = (("product", "date", "severity"))
+        ordering = ("product", "date", "severity")
+
+    def __str__(self):
+        return f"{self.product_id} {self.date} {self.severity}: {self.active}"
+
+
+class Product_Counters(models.Model):
+
+    """
+    The counts shown in the header of the product pages. The counters are marked as stale by
+    the signals in dojo.product.signals, and recounted in the background by dojo.product.helpers.update_product_counters_task.
+    The daily severity snapshots of the product are marked as stale along with them, and recomputed by
+    dojo.product.helpers.update_stale_finding_daily_severity_snapshots
+    """
+
+    product = models.OneToOneField(Product, primary_key=True, editable=False, on_delete=models.CASCADE)
+    engagement_count = models.PositiveIntegerField(default=0, editable=False)
+    open_findings_count = models.PositiveIntegerField(default=0, editable=False)
+    endpoints_count = models.PositiveIntegerField(default=0, editable=False)
+    endpoint_hosts_count = models.PositiveIntegerField(default=0, editable=False)
+    stale = models.BooleanField(default=True, editable=False)
+    snapshots_stale = models.BooleanField(default=True, editable=False)
+    updated = models.DateTimeField(auto_now=True, editable=False)
+
+    def __str__(self):
+        return f"{self.product_id}: {self.engagement_count} engagements, {self.open_findings_count} open findings"
+
+
 class Finding_Group(TimeStampedModel):
 
     GROUP_BY_OPTIONS = [("component_name", "Component Name"),
@@ -4761,3 +4889,5 @@ admin.site.register(General_Survey)
 admin.site.register(Test_Import)
 admin.site.register(Test_Import_Finding_Action)
 admin.site.register(Finding_Group)
+admin.site.register(Finding_Daily_Severity_Snapshot)
+admin.site.register(Product_Counters)
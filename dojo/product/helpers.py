@@ -1,38 +1,357 @@
 import contextlib
 import logging
+import threading
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, DateField, F, OuterRef, Q, Subquery, When
+from django.db.models.functions import Coalesce, Greatest, TruncDate
+from django.utils import timezone
 
 from dojo.celery import app
-from dojo.decorators import dojo_async_task
-from dojo.models import Endpoint, Engagement, Finding, Product, Test
+from dojo.decorators import dojo_async_task, we_want_async
+from dojo.models import (
+    SEVERITIES,
+    Endpoint,
+    Engagement,
+    Finding,
+    Finding_Daily_Severity_Snapshot,
+    Product,
+    Product_Counters,
+    Risk_Acceptance,
+    Test,
+)
 
 logger = logging.getLogger(__name__)
 
+_product_counters_local = threading.local()
+
+
+# the objects inheriting the tags of a product, with the lookup of their product
+TAG_INHERITING_MODELS = [
+    (Engagement, "product"),
+    (Test, "engagement__product"),
+    (Finding, "test__engagement__product"),
+    (Endpoint, "product"),
+]
+
 
 @dojo_async_task
 @app.task
 def propagate_tags_on_product(product_id, *args, **kwargs):
     with contextlib.suppress(Product.DoesNotExist):
         product = Product.objects.get(id=product_id)
-        propagate_tags_on_product_sync(product)
+        chunks = list(get_tag_propagation_chunks(product))
+        # the chunks run in parallel, so the tags they add are created once here instead of by every chunk
+        product_tags = set(product.tags.values_list("name", flat=True))
+        for model in dict.fromkeys(model for model, _ in chunks):
+            for field_name in ["tags", "inherited_tags"]:
+                _get_or_create_tag_ids(model._meta.get_field(field_name).remote_field.model, product_tags)
+        # every chunk of objects is updated in a task of its own
+        for model, object_ids in chunks:
+            propagate_tags_on_object_chunk(product.id, model._meta.label, object_ids)
 
 
 def propagate_tags_on_product_sync(product):
-    # enagagements
-    logger.debug(f"Propagating tags from {product} to all engagements")
-    propagate_tags_on_object_list(Engagement.objects.filter(product=product))
-    # tests
-    logger.debug(f"Propagating tags from {product} to all tests")
-    propagate_tags_on_object_list(Test.objects.filter(engagement__product=product))
-    # findings
-    logger.debug(f"Propagating tags from {product} to all findings")
-    propagate_tags_on_object_list(Finding.objects.filter(test__engagement__product=product))
-    # endpoints
-    logger.debug(f"Propagating tags from {product} to all endpoints")
-    propagate_tags_on_object_list(Endpoint.objects.filter(product=product))
-
-
-def propagate_tags_on_object_list(object_list):
-    for obj in object_list:
-        if obj and obj.id is not None:
-            logger.debug(f"\tPropagating tags to {type(obj)} - {obj}")
-            obj.save()
+    for model, object_ids in get_tag_propagation_chunks(product):
+        propagate_tags_on_object_ids(product, model, object_ids)
+
+
+def get_tag_propagation_chunks(product):
+    """Yields the models inheriting the tags of the product, with the ids of their objects in chunks"""
+    chunk_size = settings.PRODUCT_TAG_PROPAGATION_CHUNK_SIZE
+    for model, product_lookup in TAG_INHERITING_MODELS:
+        logger.debug(f"Propagating tags from {product} to all {model._meta.verbose_name_plural}")
+        object_ids = list(model.objects.filter(**{product_lookup: product}).order_by("id").values_list("id", flat=True))
+        for start in range(0, len(object_ids), chunk_size):
+            yield model, object_ids[start:start + chunk_size]
+
+
+@dojo_async_task
+@app.task
+def propagate_tags_on_object_chunk(product_id, model_label, object_ids, *args, **kwargs):
+    with contextlib.suppress(Product.DoesNotExist):
+        product = Product.objects.get(id=product_id)
+        propagate_tags_on_object_ids(product, apps.get_model(model_label), object_ids)
+
+
+def propagate_tags_on_object_ids(product, model, object_ids):
+    """
+    Makes the tags of the product the inherited tags of the objects with the given ids, and replaces the
+    previously inherited tags in their tags. Only the missing and outdated rows of the tag tables are
+    written, in bulk, so the objects are not saved and their save methods and signals do not run.
+    """
+    product_tags = set(product.tags.values_list("name", flat=True))
+    tags_field = model._meta.get_field("tags")
+    inherited_tags_field = model._meta.get_field("inherited_tags")
+    with transaction.atomic():
+        current_tags = _get_object_tag_names(tags_field, object_ids)
+        current_inherited_tags = _get_object_tag_names(inherited_tags_field, object_ids)
+        tags = {}
+        inherited_tags = {}
+        for object_id in object_ids:
+            # the tags of the object itself are kept, the tags inherited before are replaced
+            own_tags = current_tags[object_id] - current_inherited_tags[object_id]
+            tags[object_id] = own_tags | product_tags
+            inherited_tags[object_id] = product_tags
+        _set_object_tag_names(tags_field, current_tags, tags)
+        _set_object_tag_names(inherited_tags_field, current_inherited_tags, inherited_tags)
+
+
+def _get_object_tag_names(field, object_ids):
+    """Returns the names of the tags of the objects in a tag field, by object id"""
+    through = field.remote_field.through
+    tag_names = defaultdict(set)
+    for object_id, tag_name in through.objects.filter(**{f"{field.m2m_field_name()}__in": object_ids}).values_list(
+            field.m2m_field_name(), f"{field.m2m_reverse_field_name()}__name"):
+        tag_names[object_id].add(tag_name)
+    return tag_names
+
+
+def _get_or_create_tag_ids(tag_model, tag_names):
+    """Returns the ids of the tags with the given names by name, the missing tags are created"""
+    tag_ids = dict(tag_model.objects.filter(name__in=tag_names).values_list("name", "id"))
+    for tag_name in set(tag_names) - tag_ids.keys():
+        # unlike create, get_or_create returns the tag when another task created it in the meantime
+        tag_ids[tag_name] = tag_model.objects.get_or_create(name=tag_name)[0].id
+    return tag_ids
+
+
+def _set_object_tag_names(field, current_tag_names, new_tag_names):
+    """Adds and removes the rows of a tag field to go from the current to the new tag names of the objects"""
+    through = field.remote_field.through
+    tag_model = field.remote_field.model
+    object_column = field.m2m_field_name()
+    tag_column = field.m2m_reverse_field_name()
+    added = defaultdict(list)
+    removed = defaultdict(list)
+    for object_id, tag_names in new_tag_names.items():
+        for tag_name in tag_names - current_tag_names[object_id]:
+            added[tag_name].append(object_id)
+        for tag_name in current_tag_names[object_id] - tag_names:
+            removed[tag_name].append(object_id)
+
+    tag_ids = _get_or_create_tag_ids(tag_model, added)
+    through.objects.bulk_create(
+        [through(**{f"{object_column}_id": object_id, f"{tag_column}_id": tag_ids[tag_name]})
+         for tag_name, object_ids in added.items() for object_id in object_ids],
+        batch_size=1000,
+    )
+    for tag_name, object_ids in added.items():
+        tag_model.objects.filter(id=tag_ids[tag_name]).update(count=F("count") + len(object_ids))
+
+    for tag_name, object_ids in removed.items():
+        through.objects.filter(**{f"{object_column}__in": object_ids, f"{tag_column}__name": tag_name}).delete()
+        tag_model.objects.filter(name=tag_name).update(count=F("count") - len(object_ids))
+        # like tagulous, tags that are no longer used are deleted
+        for tag in tag_model.objects.filter(name=tag_name, count__lte=0):
+            tag.try_delete()
+
+
+@dojo_async_task
+@app.task
+def update_product_finding_daily_severity_snapshots(product_id, days=90, *args, **kwargs):
+    """Recomputes the daily severity snapshots of the last `days` days of a single product"""
+    today = timezone.localdate()
+    if days >= 90:
+        # like the counters, the snapshots are marked as up to date before computing them
+        Product_Counters.objects.filter(product_id=product_id).update(snapshots_stale=False)
+    update_finding_daily_severity_snapshots([product_id], today - timedelta(days=days), today)
+
+
+def update_stale_finding_daily_severity_snapshots():
+    """
+    Recomputes the last 90 days of daily severity snapshots of the products whose findings changed
+    since they were computed. The snapshots of past days are computed from the current findings, so
+    they change as well when e.g. a finding is deleted or its severity or date is changed.
+    """
+    product_ids = list(Product_Counters.objects.filter(snapshots_stale=True).values_list("product_id", flat=True))
+    if not product_ids:
+        return
+    Product_Counters.objects.filter(product_id__in=product_ids).update(snapshots_stale=False)
+    today = timezone.localdate()
+    update_finding_daily_severity_snapshots(product_ids, today - timedelta(days=90), today)
+
+
+def update_finding_daily_severity_snapshots(product_ids=None, start_date=None, end_date=None):
+    """
+    Recomputes the Finding_Daily_Severity_Snapshot rows of the given products (all products by default)
+    for every day between start_date and end_date (both included, today by default). The counts are
+    computed with a handful of grouped queries, whatever the number of findings or days.
+
+    A finding is counted as open from its date until it is mitigated or risk accepted. Findings that
+    were never active, mitigated or risk accepted (e.g. false positives) are not counted at all.
+    """
+    end_date = end_date or timezone.localdate()
+    start_date = start_date or end_date
+    products = Product.objects.all() if product_ids is None else Product.objects.filter(id__in=product_ids)
+    product_ids = list(products.values_list("id", flat=True))
+    if not product_ids or start_date > end_date:
+        return
+
+    first_risk_acceptance = Risk_Acceptance.objects.filter(accepted_findings=OuterRef("pk")).order_by("created").values("created")[:1]
+    findings = (
+        Finding.objects.filter(test__engagement__product_id__in=product_ids, duplicate=False)
+        .filter(Q(active=True) | Q(is_mitigated=True) | Q(risk_accepted=True))
+        .annotate(
+            snapshot_product=F("test__engagement__product_id"),
+            # the day the finding stopped being open, never before the day it was opened.
+            # simple risk acceptance does not have a risk acceptance object, so we fall back to creation date.
+            closed_date=Case(
+                When(is_mitigated=True, then=Greatest(Coalesce(TruncDate("mitigated"), "date"), "date")),
+                When(risk_accepted=True, then=Greatest(
+                    Coalesce(TruncDate(Subquery(first_risk_acceptance)), TruncDate("created"), "date"), "date")),
+                default=None,
+                output_field=DateField(),
+            ),
+        )
+        .order_by()
+    )
+
+    # findings that were already open before the start date
+    open_counts = defaultdict(int)
+    for row in (
+        findings.filter(date__lt=start_date)
+        .filter(Q(closed_date__isnull=True) | Q(closed_date__gte=start_date))
+        .values("snapshot_product", "severity")
+        .annotate(count=Count("id"))
+    ):
+        open_counts[row["snapshot_product"], row["severity"]] = row["count"]
+
+    def daily_counts(queryset, date_field):
+        counts = defaultdict(int)
+        for row in (
+            queryset.filter(**{f"{date_field}__gte": start_date, f"{date_field}__lte": end_date})
+            .values("snapshot_product", date_field, "severity")
+            .annotate(count=Count("id"))
+        ):
+            counts[row["snapshot_product"], row[date_field], row["severity"]] = row["count"]
+        return counts
+
+    opened_counts = daily_counts(findings, "date")
+    closed_counts = daily_counts(findings.filter(is_mitigated=True), "closed_date")
+    risk_accepted_counts = daily_counts(findings.filter(is_mitigated=False, risk_accepted=True), "closed_date")
+
+    snapshots = []
+    for product_id in product_ids:
+        for severity in SEVERITIES:
+            active = open_counts[product_id, severity]
+            day = start_date
+            while day <= end_date:
+                key = (product_id, day, severity)
+                active += opened_counts[key] - closed_counts[key] - risk_accepted_counts[key]
+                snapshots.append(Finding_Daily_Severity_Snapshot(
+                    product_id=product_id,
+                    date=day,
+                    severity=severity,
+                    opened=opened_counts[key],
+                    closed=closed_counts[key],
+                    risk_accepted=risk_accepted_counts[key],
+                    active=active,
+                ))
+                day += timedelta(days=1)
+
+    # every day of the range is written, so upserting leaves no stale rows behind
+    Finding_Daily_Severity_Snapshot.objects.bulk_create(
+        snapshots,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["product", "date", "severity"],
+        update_fields=["opened", "closed", "risk_accepted", "active"],
+    )
+
+
+def get_product_counters(product):
+    """
+    Returns the stored counters of the product. Stale counters are returned as they are, and
+    recounted in the background
+    """
+    counters = Product_Counters.objects.filter(product=product).first()
+    if counters is None:
+        # there is nothing to show yet, so the counters of a new product are counted right away
+        return update_product_counters(product)
+    if counters.stale:
+        schedule_product_counters_update(product.id)
+    return counters
+
+
+def schedule_product_counters_update(product_id, *args, **kwargs):
+    """
+    Recounts the counters of the product. When this is done in the background, all recounts
+    requested for a product within PRODUCT_COUNTERS_DEBOUNCE_SECONDS are collapsed into a single
+    task, which runs once the window has passed.
+    """
+    debounce_seconds = settings.PRODUCT_COUNTERS_DEBOUNCE_SECONDS
+    if debounce_seconds > 0 and we_want_async(*args, func=update_product_counters_task, **kwargs):
+        # the key expires when the pending task starts, so later changes get a task of their own
+        if not cache.add(f"update_product_counters_pending_{product_id}", value=True, timeout=debounce_seconds):
+            logger.debug("product counters update for product %s is already pending", product_id)
+            return None
+        kwargs["countdown"] = debounce_seconds
+    return update_product_counters_task(product_id, *args, **kwargs)
+
+
+@dojo_async_task
+@app.task
+def update_product_counters_task(product_id, *args, **kwargs):
+    with contextlib.suppress(Product.DoesNotExist):
+        update_product_counters(Product.objects.get(id=product_id))
+
+
+def update_product_counters(product):
+    """Recounts and stores the counters shown in the header of the product pages"""
+    # the counters are marked as up to date before counting, so changes made while
+    # counting leave them stale
+    Product_Counters.objects.filter(product=product).update(stale=False)
+    active_endpoints = Endpoint.objects.filter(
+        product=product,
+        status_endpoint__mitigated=False,
+        status_endpoint__false_positive=False,
+        status_endpoint__out_of_scope=False,
+        status_endpoint__risk_accepted=False,
+    )
+    counters = Product_Counters(
+        product=product,
+        engagement_count=Engagement.objects.filter(product=product, active=True).count(),
+        open_findings_count=Finding.objects.filter(test__engagement__product=product,
+                                                   false_p=False,
+                                                   duplicate=False,
+                                                   out_of_scope=False,
+                                                   active=True,
+                                                   mitigated__isnull=True).count(),
+        endpoints_count=active_endpoints.distinct().count(),
+        endpoint_hosts_count=active_endpoints.values("host").distinct().count(),
+        stale=False,
+    )
+    fields = ["engagement_count", "open_findings_count", "endpoints_count", "endpoint_hosts_count"]
+    if not Product_Counters.objects.filter(product=product).update(**{field: getattr(counters, field) for field in fields}):
+        Product_Counters.objects.bulk_create([counters], ignore_conflicts=True)
+    return counters
+
+
+def mark_product_counters_stale(**product_filter):
+    """Marks the counters and daily severity snapshots of the products matching the filter as stale, e.g. product_id=1"""
+    Product_Counters.objects.filter(Q(stale=False) | Q(snapshots_stale=False), **product_filter).update(stale=True, snapshots_stale=True)
+
+
+@contextlib.contextmanager
+def product_counters_deferred():
+    """
+    Within this block (or decorated function), saving findings, endpoints and engagements does not
+    mark the product counters as stale. The importers use this, as they mark the counters of the
+    product as stale once at the end of the import.
+    """
+    deferred = product_counters_are_deferred()
+    _product_counters_local.deferred = True
+    try:
+        yield
+    finally:
+        _product_counters_local.deferred = deferred
+
+
+def product_counters_are_deferred():
+    return getattr(_product_counters_local, "deferred", False)
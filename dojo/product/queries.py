@@ -1,8 +1,8 @@
 from crum import get_current_user
-from django.db.models import Exists, OuterRef, Q
+from django.db.models import Q
 
 from dojo.authorization.authorization import (
-    get_roles_for_permission,
+    get_authorized_product_ids,
     role_has_permission,
     user_has_global_permission,
     user_has_permission,
@@ -19,8 +19,6 @@ from dojo.models import (
     Product_API_Scan_Configuration,
     Product_Group,
     Product_Member,
-    Product_Type_Group,
-    Product_Type_Member,
 )
 
 
@@ -38,31 +36,7 @@ def get_authorized_products(permission, user=None):
     if user_has_global_permission(user, permission):
         return Product.objects.all().order_by("name")
 
-    roles = get_roles_for_permission(permission)
-    authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("prod_type_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("pk"),
-        user=user,
-        role__in=roles)
-    authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("pk"),
-        group__users=user,
-        role__in=roles)
-    products = Product.objects.annotate(
-        prod_type__member=Exists(authorized_product_type_roles),
-        member=Exists(authorized_product_roles),
-        prod_type__authorized_group=Exists(authorized_product_type_groups),
-        authorized_group=Exists(authorized_product_groups)).order_by("name")
-    return products.filter(
-        Q(prod_type__member=True) | Q(member=True)
-        | Q(prod_type__authorized_group=True) | Q(authorized_group=True))
+    return Product.objects.filter(id__in=get_authorized_product_ids(permission, user)).order_by("name")
 
 
 def get_authorized_members_for_product(product, permission):
@@ -155,31 +129,7 @@ def get_authorized_app_analysis(permission):
     if user_has_global_permission(user, permission):
         return App_Analysis.objects.all().order_by("id")
 
-    roles = get_roles_for_permission(permission)
-    authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("product_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("product_id"),
-        group__users=user,
-        role__in=roles)
-    app_analysis = App_Analysis.objects.annotate(
-        product__prod_type__member=Exists(authorized_product_type_roles),
-        product__member=Exists(authorized_product_roles),
-        product__prod_type__authorized_group=Exists(authorized_product_type_groups),
-        product__authorized_group=Exists(authorized_product_groups)).order_by("id")
-    return app_analysis.filter(
-        Q(product__prod_type__member=True) | Q(product__member=True)
-        | Q(product__prod_type__authorized_group=True) | Q(product__authorized_group=True))
+    return App_Analysis.objects.filter(product__in=get_authorized_product_ids(permission, user)).order_by("id")
 
 
 def get_authorized_dojo_meta(permission):
@@ -194,82 +144,11 @@ def get_authorized_dojo_meta(permission):
     if user_has_global_permission(user, permission):
         return DojoMeta.objects.all().order_by("id")
 
-    roles = get_roles_for_permission(permission)
-    product_authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    product_authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("product_id"),
-        user=user,
-        role__in=roles)
-    product_authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    product_authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("product_id"),
-        group__users=user,
-        role__in=roles)
-    endpoint_authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("endpoint__product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    endpoint_authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("endpoint__product_id"),
-        user=user,
-        role__in=roles)
-    endpoint_authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("endpoint__product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    endpoint_authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("endpoint__product_id"),
-        group__users=user,
-        role__in=roles)
-    finding_authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("finding__test__engagement__product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    finding_authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("finding__test__engagement__product_id"),
-        user=user,
-        role__in=roles)
-    finding_authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("finding__test__engagement__product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    finding_authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("finding__test__engagement__product_id"),
-        group__users=user,
-        role__in=roles)
-    dojo_meta = DojoMeta.objects.annotate(
-        product__prod_type__member=Exists(product_authorized_product_type_roles),
-        product__member=Exists(product_authorized_product_roles),
-        product__prod_type__authorized_group=Exists(product_authorized_product_type_groups),
-        product__authorized_group=Exists(product_authorized_product_groups),
-        endpoint__product__prod_type__member=Exists(endpoint_authorized_product_type_roles),
-        endpoint__product__member=Exists(endpoint_authorized_product_roles),
-        endpoint__product__prod_type__authorized_group=Exists(endpoint_authorized_product_type_groups),
-        endpoint__product__authorized_group=Exists(endpoint_authorized_product_groups),
-        finding__test__engagement__product__prod_type__member=Exists(finding_authorized_product_type_roles),
-        finding__test__engagement__product__member=Exists(finding_authorized_product_roles),
-        finding__test__engagement__product__prod_type__authorized_group=Exists(finding_authorized_product_type_groups),
-        finding__test__engagement__product__authorized_group=Exists(finding_authorized_product_groups),
-    ).order_by("id")
-    return dojo_meta.filter(
-        Q(product__prod_type__member=True)
-        | Q(product__member=True)
-        | Q(product__prod_type__authorized_group=True)
-        | Q(product__authorized_group=True)
-        | Q(endpoint__product__prod_type__member=True)
-        | Q(endpoint__product__member=True)
-        | Q(endpoint__product__prod_type__authorized_group=True)
-        | Q(endpoint__product__authorized_group=True)
-        | Q(finding__test__engagement__product__prod_type__member=True)
-        | Q(finding__test__engagement__product__member=True)
-        | Q(finding__test__engagement__product__prod_type__authorized_group=True)
-        | Q(finding__test__engagement__product__authorized_group=True))
+    authorized_product_ids = get_authorized_product_ids(permission, user)
+    return DojoMeta.objects.filter(
+        Q(product__in=authorized_product_ids)
+        | Q(endpoint__product__in=authorized_product_ids)
+        | Q(finding__test__engagement__product__in=authorized_product_ids)).order_by("id")
 
 
 def get_authorized_languages(permission):
@@ -284,31 +163,7 @@ def get_authorized_languages(permission):
     if user_has_global_permission(user, permission):
         return Languages.objects.all().order_by("id")
 
-    roles = get_roles_for_permission(permission)
-    authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("product_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("product_id"),
-        group__users=user,
-        role__in=roles)
-    languages = Languages.objects.annotate(
-        product__prod_type__member=Exists(authorized_product_type_roles),
-        product__member=Exists(authorized_product_roles),
-        product__prod_type__authorized_group=Exists(authorized_product_type_groups),
-        product__authorized_group=Exists(authorized_product_groups)).order_by("id")
-    return languages.filter(
-        Q(product__prod_type__member=True) | Q(product__member=True)
-        | Q(product__prod_type__authorized_group=True) | Q(product__authorized_group=True))
+    return Languages.objects.filter(product__in=get_authorized_product_ids(permission, user)).order_by("id")
 
 
 def get_authorized_engagement_presets(permission):
@@ -323,31 +178,7 @@ def get_authorized_engagement_presets(permission):
     if user_has_global_permission(user, permission):
         return Engagement_Presets.objects.all().order_by("id")
 
-    roles = get_roles_for_permission(permission)
-    authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("product_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("product_id"),
-        group__users=user,
-        role__in=roles)
-    engagement_presets = Engagement_Presets.objects.annotate(
-        product__prod_type__member=Exists(authorized_product_type_roles),
-        product__member=Exists(authorized_product_roles),
-        product__prod_type__authorized_group=Exists(authorized_product_type_groups),
-        product__authorized_group=Exists(authorized_product_groups)).order_by("id")
-    return engagement_presets.filter(
-        Q(product__prod_type__member=True) | Q(product__member=True)
-        | Q(product__prod_type__authorized_group=True) | Q(product__authorized_group=True))
+    return Engagement_Presets.objects.filter(product__in=get_authorized_product_ids(permission, user)).order_by("id")
 
 
 def get_authorized_product_api_scan_configurations(permission):
@@ -362,28 +193,4 @@ def get_authorized_product_api_scan_configurations(permission):
     if user_has_global_permission(user, permission):
         return Product_API_Scan_Configuration.objects.all().order_by("id")
 
-    roles = get_roles_for_permission(permission)
-    authorized_product_type_roles = Product_Type_Member.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_roles = Product_Member.objects.filter(
-        product=OuterRef("product_id"),
-        user=user,
-        role__in=roles)
-    authorized_product_type_groups = Product_Type_Group.objects.filter(
-        product_type=OuterRef("product__prod_type_id"),
-        group__users=user,
-        role__in=roles)
-    authorized_product_groups = Product_Group.objects.filter(
-        product=OuterRef("product_id"),
-        group__users=user,
-        role__in=roles)
-    product_api_scan_configurations = Product_API_Scan_Configuration.objects.annotate(
-        product__prod_type__member=Exists(authorized_product_type_roles),
-        product__member=Exists(authorized_product_roles),
-        product__prod_type__authorized_group=Exists(authorized_product_type_groups),
-        product__authorized_group=Exists(authorized_product_groups)).order_by("id")
-    return product_api_scan_configurations.filter(
-        Q(product__prod_type__member=True) | Q(product__member=True)
-        | Q(product__prod_type__authorized_group=True) | Q(product__authorized_group=True))
+    return Product_API_Scan_Configuration.objects.filter(product__in=get_authorized_product_ids(permission, user)).order_by("id")
@@ -6,8 +6,9 @@ from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
-from dojo.models import Product
+from dojo.models import Endpoint, Endpoint_Status, Engagement, Finding, Product
 from dojo.notifications.helper import create_notification
+from dojo.product.helpers import mark_product_counters_stale, product_counters_are_deferred
 
 
 @receiver(post_save, sender=Product)
@@ -37,3 +38,26 @@ def product_post_delete(sender, instance, **kwargs):
                         description=description,
                         url=reverse("product"),
                         icon="exclamation-triangle")
+
+
+@receiver(post_save, sender=Engagement)
+@receiver(post_delete, sender=Engagement)
+@receiver(post_save, sender=Endpoint)
+@receiver(post_delete, sender=Endpoint)
+def product_counters_product_child_changed(sender, instance, **kwargs):
+    if not product_counters_are_deferred():
+        mark_product_counters_stale(product_id=instance.product_id)
+
+
+@receiver(post_save, sender=Finding)
+@receiver(post_delete, sender=Finding)
+def product_counters_finding_changed(sender, instance, **kwargs):
+    if not product_counters_are_deferred():
+        mark_product_counters_stale(product__engagement__test=instance.test_id)
+
+
+@receiver(post_save, sender=Endpoint_Status)
+@receiver(post_delete, sender=Endpoint_Status)
+def product_counters_endpoint_status_changed(sender, instance, **kwargs):
+    if not product_counters_are_deferred():
+        mark_product_counters_stale(product__endpoint=instance.endpoint_id)
@@ -36,4 +36,6 @@ urlpatterns = [
         views.CSVExportView.as_view(), name="csv_export"),
     re_path(r"^reports/excel_export$",
         views.ExcelExportView.as_view(), name="excel_export"),
+    re_path(r"^reports/finding_exports/(?P<filename>[0-9a-f-]{36}\.(?:csv|xlsx))$",
+        views.download_finding_export, name="download_finding_export"),
 ]
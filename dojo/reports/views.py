@@ -1,17 +1,33 @@
 import csv
+import inspect
 import logging
 import re
 from datetime import datetime
+from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.contrib import messages
 from django.core.exceptions import PermissionDenied
-from django.http import Http404, HttpRequest, HttpResponse, QueryDict
+from django.db.models import Prefetch
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    QueryDict,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.http import url_has_allowed_host_and_scheme
 from django.views import View
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 
 from dojo.authorization.authorization import user_has_permission_or_403
@@ -27,7 +43,7 @@ from dojo.filters import (
 from dojo.finding.queries import get_authorized_findings
 from dojo.finding.views import BaseListFindings
 from dojo.forms import ReportOptionsForm
-from dojo.models import Dojo_User, Endpoint, Engagement, Finding, Product, Product_Type, Test
+from dojo.models import Dojo_User, Endpoint, Engagement, Finding, Finding_Group, Product, Product_Type, Test
 from dojo.reports.widgets import (
     CoverPage,
     CustomReportJsonForm,
@@ -797,6 +813,82 @@ def get_attributes():
     return ["sla_age", "sla_deadline", "sla_days_remaining"]
 
 
+def prefetch_related_findings_for_export(findings):
+    return findings.select_related(
+        "test__test_type",
+        "test__engagement__product",
+        "defect_review_requested_by",
+        "duplicate_finding",
+        "last_reviewed_by",
+        "mitigated_by",
+        "reporter",
+        "review_requested_by",
+        "sonarqube_issue",
+    ).prefetch_related(
+        Prefetch("finding_group_set", queryset=Finding_Group.objects.order_by("id")),
+        "endpoints",
+        "vulnerability_id_set",
+        "tags",
+    )
+
+
+def get_export_columns(finding):
+    """
+    Returns the attributes of the finding that are exported, together with how their value is read.
+    The columns are determined once per export, as all findings have the same attributes.
+    """
+    allowed_attributes = get_attributes()
+    excludes_list = get_excludes()
+    allowed_foreign_keys = get_foreign_keys()
+    columns = []
+    for key in dir(finding):
+        if key in excludes_list or key.startswith("_"):
+            continue
+        try:
+            attribute = getattr(finding, key)
+        except Exception as exc:
+            logger.warning(f"Error in attribute: {key}" + str(exc))
+            columns.append((key, "getattr"))
+            continue
+        if callable(attribute):
+            if key in allowed_attributes:
+                columns.append((key, "call"))
+        elif key in allowed_foreign_keys or key in allowed_attributes:
+            columns.append((key, "str"))
+        elif isinstance(inspect.getattr_static(type(finding), key, None), cached_property):
+            columns.append((key, "getattr"))
+        else:
+            columns.append((key, "field"))
+    return columns
+
+
+def get_export_value(finding, key, kind):
+    if kind == "call":
+        return getattr(finding, key)()
+    if kind == "field":
+        return finding.__dict__.get(key)
+    attribute = getattr(finding, key)
+    if kind == "str" and attribute:
+        return str(attribute)
+    # cached properties are stored in __dict__ once they have been read
+    return finding.__dict__.get(key)
+
+
+def iterate_findings_for_export(findings):
+    for finding in prefetch_related_findings_for_export(findings).iterator(chunk_size=settings.FINDING_EXPORT_CHUNK_SIZE):
+        # the finding_group property would query the database for every finding
+        finding.finding_group = next(iter(finding.finding_group_set.all()), None)
+        yield finding
+
+
+class Echo:
+
+    """An object implementing just the write method of the file-like interface, for the csv writer"""
+
+    def write(self, value):
+        return value
+
+
 class CSVExportView(View):
     def add_findings_data(self):
         return self.findings
@@ -811,29 +903,20 @@ class CSVExportView(View):
         findings, _obj = get_findings(request)
         self.findings = findings
         findings = self.add_findings_data()
-        response = HttpResponse(content_type="text/csv")
+        if export_in_background(request, findings, "csv"):
+            return redirect_to_exported_findings(request)
+        writer = csv.writer(Echo())
+        response = StreamingHttpResponse((writer.writerow(row) for row in self.get_rows(findings)), content_type="text/csv")
         response["Content-Disposition"] = "attachment; filename=findings.csv"
-        writer = csv.writer(response)
-        allowed_attributes = get_attributes()
-        excludes_list = get_excludes()
-        allowed_foreign_keys = get_foreign_keys()
-        first_row = True
+        return response
 
-        for finding in findings:
+    def get_rows(self, findings):
+        columns = None
+        for finding in iterate_findings_for_export(findings):
             self.finding = finding
-            if first_row:
-                fields = []
-                self.fields = fields
-                for key in dir(finding):
-                    try:
-                        if key not in excludes_list and (not callable(getattr(finding, key)) or key in allowed_attributes) and not key.startswith("_"):
-                            if callable(getattr(finding, key)) and key not in allowed_attributes:
-                                continue
-                            fields.append(key)
-                    except Exception as exc:
-                        logger.error("Error in attribute: " + str(exc))
-                        fields.append(key)
-                        continue
+            if columns is None:
+                columns = get_export_columns(finding)
+                fields = [key for key, _kind in columns]
                 fields.extend((
                     "test",
                     "found_by",
@@ -848,72 +931,64 @@ class CSVExportView(View):
                 self.fields = fields
                 self.add_extra_headers()
 
-                writer.writerow(fields)
-
-                first_row = False
-            if not first_row:
-                fields = []
-                for key in dir(finding):
-                    try:
-                        if key not in excludes_list and (not callable(getattr(finding, key)) or key in allowed_attributes) and not key.startswith("_"):
-                            if not callable(getattr(finding, key)):
-                                value = finding.__dict__.get(key)
-                            if (key in allowed_foreign_keys or key in allowed_attributes) and getattr(finding, key):
-                                if callable(getattr(finding, key)):
-                                    func = getattr(finding, key)
-                                    result = func()
-                                    value = result
-                                else:
-                                    value = str(getattr(finding, key))
-                            if value and isinstance(value, str):
-                                value = value.replace("\n", " NEWLINE ").replace("\r", "")
-                            fields.append(value)
-                    except Exception as exc:
-                        logger.error("Error in attribute: " + str(exc))
-                        fields.append("Value not supported")
-                        continue
-                fields.append(finding.test.title)
-                fields.append(finding.test.test_type.name)
-                fields.append(finding.test.engagement.id)
-                fields.append(finding.test.engagement.name)
-                fields.append(finding.test.engagement.product.id)
-                fields.append(finding.test.engagement.product.name)
-
-                endpoint_value = ""
-                for endpoint in finding.endpoints.all():
-                    endpoint_value += f"{endpoint}; "
-                endpoint_value = endpoint_value.removesuffix("; ")
-                if len(endpoint_value) > EXCEL_CHAR_LIMIT:
-                    endpoint_value = endpoint_value[:EXCEL_CHAR_LIMIT - 3] + "..."
-                fields.append(endpoint_value)
-
-                vulnerability_ids_value = ""
-                for num_vulnerability_ids, vulnerability_id in enumerate(finding.vulnerability_ids):
-                    if num_vulnerability_ids > 5:
-                        vulnerability_ids_value += "..."
-                        break
-                    vulnerability_ids_value += f"{vulnerability_id}; "
-                if finding.cve and vulnerability_ids_value.find(finding.cve) < 0:
-                    vulnerability_ids_value += finding.cve
-                vulnerability_ids_value = vulnerability_ids_value.removesuffix("; ")
-                fields.append(vulnerability_ids_value)
-                # Tags
-                tags_value = ""
-                for num_tags, tag in enumerate(finding.tags.all()):
-                    if num_tags > 5:
-                        tags_value += "..."
-                        break
-                    tags_value += f"{tag}; "
-                tags_value = tags_value.removesuffix("; ")
-                fields.append(tags_value)
-
-                self.fields = fields
-                self.finding = finding
-                self.add_extra_values()
+                yield self.fields
+
+            fields = []
+            for key, kind in columns:
+                try:
+                    value = get_export_value(finding, key, kind)
+                    if value and isinstance(value, str):
+                        value = value.replace("\n", " NEWLINE ").replace("\r", "")
+                    fields.append(value)
+                except Exception as exc:
+                    logger.error("Error in attribute: " + str(exc))
+                    fields.append("Value not supported")
+                    continue
+            fields.append(finding.test.title)
+            fields.append(finding.test.test_type.name)
+            fields.append(finding.test.engagement.id)
+            fields.append(finding.test.engagement.name)
+            fields.append(finding.test.engagement.product.id)
+            fields.append(finding.test.engagement.product.name)
+
+            endpoint_value = ""
+            for endpoint in finding.endpoints.all():
+                endpoint_value += f"{endpoint}; "
+            endpoint_value = endpoint_value.removesuffix("; ")
+            if len(endpoint_value) > EXCEL_CHAR_LIMIT:
+                endpoint_value = endpoint_value[:EXCEL_CHAR_LIMIT - 3] + "..."
+            fields.append(endpoint_value)
+
+            vulnerability_ids_value = ""
+            for num_vulnerability_ids, vulnerability_id in enumerate(finding.vulnerability_ids):
+                if num_vulnerability_ids > 5:
+                    vulnerability_ids_value += "..."
+                    break
+                vulnerability_ids_value += f"{vulnerability_id}; "
+            if finding.cve and vulnerability_ids_value.find(finding.cve) < 0:
+                vulnerability_ids_value += finding.cve
+            vulnerability_ids_value = vulnerability_ids_value.removesuffix("; ")
+            fields.append(vulnerability_ids_value)
+            # Tags
+            tags_value = ""
+            for num_tags, tag in enumerate(finding.tags.all()):
+                if num_tags > 5:
+                    tags_value += "..."
+                    break
+                tags_value += f"{tag}; "
+            tags_value = tags_value.removesuffix("; ")
+            fields.append(tags_value)
+
+            self.fields = fields
+            self.finding = finding
+            self.add_extra_values()
 
-                writer.writerow(fields)
+            yield self.fields
 
-        return response
+    def write(self, findings, file):
+        writer = csv.writer(file)
+        for row in self.get_rows(findings):
+            writer.writerow(row)
 
 
 class ExcelExportView(View):
@@ -931,139 +1006,140 @@ class ExcelExportView(View):
         findings, _obj = get_findings(request)
         self.findings = findings
         findings = self.add_findings_data()
-        workbook = Workbook()
+        if export_in_background(request, findings, "xlsx"):
+            return redirect_to_exported_findings(request)
+        # the workbook is written to a temporary file, which is streamed and removed once it is closed
+        file = NamedTemporaryFile(suffix=".xlsx")
+        self.write(findings, file)
+        file.seek(0)
+        return FileResponse(
+            file,
+            as_attachment=True,
+            filename="findings.xlsx",
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+    def write(self, findings, file):
+        # in write-only mode, rows are written to the file as they are added instead of being kept in memory
+        workbook = Workbook(write_only=True)
         workbook.iso_dates = True
-        worksheet = workbook.active
-        worksheet.title = "Findings"
+        worksheet = workbook.create_sheet("Findings")
         self.worksheet = worksheet
-        font_bold = Font(bold=True)
-        self.font_bold = font_bold
-        allowed_attributes = get_attributes()
-        excludes_list = get_excludes()
-        allowed_foreign_keys = get_foreign_keys()
-
-        row_num = 1
-        for finding in findings:
+        self.font_bold = Font(bold=True)
+        for row in self.get_rows(findings):
+            worksheet.append(row)
+        workbook.save(file)
+
+    def header_cell(self, value):
+        cell = WriteOnlyCell(self.worksheet, value=value)
+        cell.font = self.font_bold
+        return cell
+
+    def get_rows(self, findings):
+        columns = None
+        for finding in iterate_findings_for_export(findings):
             logger.debug(f"processing finding: {finding.id}")
-            if row_num == 1:
-                col_num = 1
-                for key in dir(finding):
-                    try:
-                        if key not in excludes_list and (not callable(getattr(finding, key)) or key in allowed_attributes) and not key.startswith("_"):
-                            if callable(getattr(finding, key)) and key not in allowed_attributes:
-                                continue
-                            cell = worksheet.cell(row=row_num, column=col_num, value=key)
-                            cell.font = font_bold
-                            col_num += 1
-                    except Exception as exc:
-                        logger.warning(f"Error in attribute: {key}" + str(exc))
-                        cell = worksheet.cell(row=row_num, column=col_num, value=key)
-                        col_num += 1
-                        continue
-                cell = worksheet.cell(row=row_num, column=col_num, value="found_by")
-                cell.font = font_bold
-                col_num += 1
-                worksheet.cell(row=row_num, column=col_num, value="engagement_id")
-                cell = cell.font = font_bold
-                col_num += 1
-                cell = worksheet.cell(row=row_num, column=col_num, value="engagement")
-                cell.font = font_bold
-                col_num += 1
-                cell = worksheet.cell(row=row_num, column=col_num, value="product_id")
-                cell.font = font_bold
-                col_num += 1
-                cell = worksheet.cell(row=row_num, column=col_num, value="product")
-                cell.font = font_bold
-                col_num += 1
-                cell = worksheet.cell(row=row_num, column=col_num, value="endpoints")
-                cell.font = font_bold
-                col_num += 1
-                cell = worksheet.cell(row=row_num, column=col_num, value="vulnerability_ids")
-                cell.font = font_bold
-                col_num += 1
-                cell = worksheet.cell(row=row_num, column=col_num, value="tags")
-                cell.font = font_bold
-                col_num += 1
-                self.row_num = row_num
-                self.col_num = col_num
+            self.finding = finding
+            if columns is None:
+                columns = get_export_columns(finding)
+                fields = [self.header_cell(key) for key, _kind in columns]
+                fields.extend(self.header_cell(key) for key in (
+                    "found_by",
+                    "engagement_id",
+                    "engagement",
+                    "product_id",
+                    "product",
+                    "endpoints",
+                    "vulnerability_ids",
+                    "tags",
+                ))
+                self.fields = fields
                 self.add_extra_headers()
 
-                row_num = 2
-            if row_num > 1:
-                col_num = 1
-                for key in dir(finding):
-                    try:
-                        if key not in excludes_list and (not callable(getattr(finding, key)) or key in allowed_attributes) and not key.startswith("_"):
-                            if not callable(getattr(finding, key)):
-                                value = finding.__dict__.get(key)
-                            if (key in allowed_foreign_keys or key in allowed_attributes) and getattr(finding, key):
-                                if callable(getattr(finding, key)):
-                                    func = getattr(finding, key)
-                                    result = func()
-                                    value = result
-                                else:
-                                    value = str(getattr(finding, key))
-                            if value and isinstance(value, datetime):
-                                value = value.replace(tzinfo=None)
-                            worksheet.cell(row=row_num, column=col_num, value=value)
-                            col_num += 1
-                    except Exception as exc:
-                        logger.warning(f"Error in attribute: {key}" + str(exc))
-                        worksheet.cell(row=row_num, column=col_num, value="Value not supported")
-                        col_num += 1
-                        continue
-                worksheet.cell(row=row_num, column=col_num, value=finding.test.test_type.name)
-                col_num += 1
-                worksheet.cell(row=row_num, column=col_num, value=finding.test.engagement.id)
-                col_num += 1
-                worksheet.cell(row=row_num, column=col_num, value=finding.test.engagement.name)
-                col_num += 1
-                worksheet.cell(row=row_num, column=col_num, value=finding.test.engagement.product.id)
-                col_num += 1
-                worksheet.cell(row=row_num, column=col_num, value=finding.test.engagement.product.name)
-                col_num += 1
-
-                endpoint_value = ""
-                for endpoint in finding.endpoints.all():
-                    endpoint_value += f"{endpoint}; \n"
-                endpoint_value = endpoint_value.removesuffix("; \n")
-                if len(endpoint_value) > EXCEL_CHAR_LIMIT:
-                    endpoint_value = endpoint_value[:EXCEL_CHAR_LIMIT - 3] + "..."
-                worksheet.cell(row=row_num, column=col_num, value=endpoint_value)
-                col_num += 1
-
-                vulnerability_ids_value = ""
-                for num_vulnerability_ids, vulnerability_id in enumerate(finding.vulnerability_ids):
-                    if num_vulnerability_ids > 5:
-                        vulnerability_ids_value += "..."
-                        break
-                    vulnerability_ids_value += f"{vulnerability_id}; \n"
-                if finding.cve and vulnerability_ids_value.find(finding.cve) < 0:
-                    vulnerability_ids_value += finding.cve
-                vulnerability_ids_value = vulnerability_ids_value.removesuffix("; \n")
-                worksheet.cell(row=row_num, column=col_num, value=vulnerability_ids_value)
-                col_num += 1
-                # tags
-                tags_value = ""
-                for tag in finding.tags.all():
-                    tags_value += f"{tag}; \n"
-                tags_value = tags_value.removesuffix("; \n")
-                worksheet.cell(row=row_num, column=col_num, value=tags_value)
-                col_num += 1
-                self.col_num = col_num
-                self.row_num = row_num
-                self.finding = finding
-                self.add_extra_values()
-            row_num += 1
-
-        with NamedTemporaryFile() as tmp:
-            workbook.save(tmp.name)
-            tmp.seek(0)
-            stream = tmp.read()
-
-        response = HttpResponse(
-            content=stream,
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-        response["Content-Disposition"] = "attachment; filename=findings.xlsx"
-        return response
+                yield self.fields
+
+            fields = []
+            for key, kind in columns:
+                try:
+                    value = get_export_value(finding, key, kind)
+                    if value and isinstance(value, datetime):
+                        value = value.replace(tzinfo=None)
+                    # the cell checks the value, so that unsupported values do not break the row
+                    fields.append(WriteOnlyCell(self.worksheet, value=value))
+                except Exception as exc:
+                    logger.warning(f"Error in attribute: {key}" + str(exc))
+                    fields.append("Value not supported")
+                    continue
+            fields.append(finding.test.test_type.name)
+            fields.append(finding.test.engagement.id)
+            fields.append(finding.test.engagement.name)
+            fields.append(finding.test.engagement.product.id)
+            fields.append(finding.test.engagement.product.name)
+
+            endpoint_value = ""
+            for endpoint in finding.endpoints.all():
+                endpoint_value += f"{endpoint}; \n"
+            endpoint_value = endpoint_value.removesuffix("; \n")
+            if len(endpoint_value) > EXCEL_CHAR_LIMIT:
+                endpoint_value = endpoint_value[:EXCEL_CHAR_LIMIT - 3] + "..."
+            fields.append(endpoint_value)
+
+            vulnerability_ids_value = ""
+            for num_vulnerability_ids, vulnerability_id in enumerate(finding.vulnerability_ids):
+                if num_vulnerability_ids > 5:
+                    vulnerability_ids_value += "..."
+                    break
+                vulnerability_ids_value += f"{vulnerability_id}; \n"
+            if finding.cve and vulnerability_ids_value.find(finding.cve) < 0:
+                vulnerability_ids_value += finding.cve
+            vulnerability_ids_value = vulnerability_ids_value.removesuffix("; \n")
+            fields.append(vulnerability_ids_value)
+            # tags
+            tags_value = ""
+            for tag in finding.tags.all():
+                tags_value += f"{tag}; \n"
+            tags_value = tags_value.removesuffix("; \n")
+            fields.append(tags_value)
+            self.fields = fields
+            self.finding = finding
+            self.add_extra_values()
+
+            yield self.fields
+
+
+def export_in_background(request, findings, export_format):
+    """
+    Starts a background export of the findings when there are more than FINDING_EXPORT_BACKGROUND_THRESHOLD.
+    The user is notified with a link to download the file once it is created.
+    """
+    threshold = settings.FINDING_EXPORT_BACKGROUND_THRESHOLD
+    if threshold <= 0 or findings.count() <= threshold:
+        return False
+    from dojo.tasks import export_findings
+    export_findings(request.user.id, request.META.get("QUERY_STRING"), export_format)
+    messages.add_message(
+        request,
+        messages.SUCCESS,
+        "The findings are exported in the background. You will be notified when the export is ready for download.",
+        extra_tags="alert-success")
+    return True
+
+
+def redirect_to_exported_findings(request):
+    """Redirects back to the list of findings the export was started from, if it is on this site"""
+    url = request.META.get("QUERY_STRING").removeprefix("url=")
+    if url_has_allowed_host_and_scheme(url, allowed_hosts=None):
+        return HttpResponseRedirect(url)
+    return HttpResponseRedirect(reverse("all_findings"))
+
+
+def get_finding_export_directory(user):
+    return Path(settings.MEDIA_ROOT) / "finding_exports" / str(user.id)
+
+
+def download_finding_export(request, filename):
+    # exports are stored per user, so users can only download their own exports
+    path = get_finding_export_directory(request.user) / filename
+    if not path.is_file():
+        raise Http404
+    return FileResponse(path.open("rb"), as_attachment=True, filename=f"findings{path.suffix}")
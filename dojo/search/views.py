@@ -233,8 +233,7 @@ def simple_search(request):
                 finding_templates = apply_tag_filters(finding_templates, operators)
 
                 if keywords_query:
-                    watson_results = watson.filter(finding_templates, keywords_query)
-                    finding_templates = finding_templates.filter(id__in=[watson.id for watson in watson_results])
+                    finding_templates = apply_search_index_filter(finding_templates, keywords_query)
 
                 finding_templates = finding_templates[:max_results]
             else:
@@ -247,8 +246,7 @@ def simple_search(request):
                 tests = apply_tag_filters(tests, operators)
 
                 if keywords_query:
-                    watson_results = watson.filter(tests, keywords_query)
-                    tests = tests.filter(id__in=[watson.id for watson in watson_results])
+                    tests = apply_search_index_filter(tests, keywords_query)
 
                 tests = tests.prefetch_related("engagement", "engagement__product", "test_type", "tags", "engagement__tags", "engagement__product__tags")
                 tests = tests[:max_results]
@@ -262,8 +260,7 @@ def simple_search(request):
                 engagements = apply_tag_filters(engagements, operators)
 
                 if keywords_query:
-                    watson_results = watson.filter(engagements, keywords_query)
-                    engagements = engagements.filter(id__in=[watson.id for watson in watson_results])
+                    engagements = apply_search_index_filter(engagements, keywords_query)
 
                 engagements = engagements.prefetch_related("product", "product__tags", "tags")
                 engagements = engagements[:max_results]
@@ -277,8 +274,7 @@ def simple_search(request):
                 products = apply_tag_filters(products, operators)
 
                 if keywords_query:
-                    watson_results = watson.filter(products, keywords_query)
-                    products = products.filter(id__in=[watson.id for watson in watson_results])
+                    products = apply_search_index_filter(products, keywords_query)
 
                 products = products.prefetch_related("tags")
                 products = products[:max_results]
@@ -291,7 +287,10 @@ def simple_search(request):
                 endpoints = authorized_endpoints
                 endpoints = apply_tag_filters(endpoints, operators)
 
-                endpoints = endpoints.filter(Q(host__icontains=keywords_query) | Q(path__icontains=keywords_query) | Q(protocol__icontains=keywords_query) | Q(query__icontains=keywords_query) | Q(fragment__icontains=keywords_query))
+                if keywords_query:
+                    endpoints = apply_search_index_filter(endpoints, keywords_query,
+                        Q(host__icontains=keywords_query) | Q(path__icontains=keywords_query) | Q(protocol__icontains=keywords_query) | Q(query__icontains=keywords_query) | Q(fragment__icontains=keywords_query))
+
                 endpoints = prefetch_for_endpoints(endpoints)
                 endpoints = endpoints[:max_results]
             else:
@@ -310,7 +309,8 @@ def simple_search(request):
                 logger.debug("searching technologies")
 
                 app_analysis = authorized_app_analysis
-                app_analysis = app_analysis.filter(name__icontains=keywords_query)
+                if keywords_query:
+                    app_analysis = apply_search_index_filter(app_analysis, keywords_query, Q(name__icontains=keywords_query))
                 app_analysis = app_analysis[:max_results]
             else:
                 app_analysis = None
@@ -321,8 +321,7 @@ def simple_search(request):
                 vulnerability_ids = authorized_vulnerability_ids
                 vulnerability_ids = apply_vulnerability_id_filter(vulnerability_ids, operators)
                 if keywords_query:
-                    watson_results = watson.filter(vulnerability_ids, keywords_query)
-                    vulnerability_ids = vulnerability_ids.filter(id__in=[watson.id for watson in watson_results])
+                    vulnerability_ids = apply_search_index_filter(vulnerability_ids, keywords_query)
                 vulnerability_ids = vulnerability_ids.prefetch_related("finding__test__engagement__product", "finding__test__engagement__product__tags")
                 vulnerability_ids = vulnerability_ids[:max_results]
             else:
@@ -537,6 +536,16 @@ def apply_vulnerability_id_filter(qs, operators):
     return qs
 
 
+def apply_search_index_filter(qs, keywords_query, substring_query=None):
+    # the matching ids are selected with a subquery on the search index instead of being loaded first,
+    # which could be all objects of a table for common words
+    query = Q(id__in=watson.filter(qs.model, keywords_query, ranking=False).values("id"))
+    # the index only matches words and word prefixes, so parts of e.g. host names are matched separately
+    if substring_query is not None:
+        query |= substring_query
+    return qs.filter(query)
+
+
 def perform_keyword_search_for_operator(qs, operators, operator, keywords_query):
     watson_results = None
     operator_query = ""
@@ -280,6 +280,34 @@ env = environ.FileAwareEnv(
     DD_ASYNC_OBJECT_DELETE=(bool, False),
     # The number of objects to be deleted per celeryworker
     DD_ASYNC_OBEJECT_DELETE_CHUNK_SIZE=(int, 100),
+    # When enabled, the importer inserts findings and their related objects in batches using bulk_create
+    # and runs the post processing (deduplication, grading, ...) once per batch instead of once per finding
+    DD_IMPORT_BULK_CREATE=(bool, False),
+    # The number of findings inserted per batch when DD_IMPORT_BULK_CREATE is enabled
+    DD_IMPORT_BULK_CREATE_BATCH_SIZE=(int, 1000),
+    # The number of parsed findings the importers process (and post process) at a time
+    DD_IMPORT_CHUNK_SIZE=(int, 1000),
+    # The product grade calculations requested for a product within this number of seconds are collapsed
+    # into a single background task. Set to 0 to calculate the grade for every request
+    DD_PRODUCT_GRADE_DEBOUNCE_SECONDS=(int, 60),
+    # The recounts of the stale counters of a product requested within this number of seconds are collapsed
+    # into a single background task. Set to 0 to start a task for every request
+    DD_PRODUCT_COUNTERS_DEBOUNCE_SECONDS=(int, 60),
+    # The number of seconds the ids of the products a user is authorized for are cached. Requires a cache
+    # that is shared between all processes (CACHES), so it is disabled by default
+    DD_AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT=(int, 0),
+    # The number of findings the CSV and Excel exports read from the database at a time
+    DD_FINDING_EXPORT_CHUNK_SIZE=(int, 500),
+    # Exports of more findings than this are created in the background, and the user is notified when the
+    # file is ready for download. Set to 0 to always create the export in the request
+    DD_FINDING_EXPORT_BACKGROUND_THRESHOLD=(int, 0),
+    # Number of seconds every process keeps the system settings in memory. On every use, a version in the cache
+    # that is shared between all processes (CACHES) is checked, which changes when the system settings are saved.
+    # This requires a shared cache, so it is disabled by default
+    DD_SYSTEM_SETTINGS_CACHE_TIMEOUT=(int, 0),
+    # The number of engagements, tests, findings or endpoints whose inherited tags are updated per background task
+    # when the tags of a product change
+    DD_PRODUCT_TAG_PROPAGATION_CHUNK_SIZE=(int, 1000),
     # When enabled, display the preview of objects to be deleted. This can take a long time to render
     # for very large objects
     DD_DELETE_PREVIEW=(bool, True),
@@ -1197,6 +1225,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "dojo.tasks.clear_sessions",
         "schedule": crontab(hour=0, minute=0, day_of_week=0),
     },
+    "update_finding_daily_severity_snapshots": {
+        "task": "dojo.tasks.update_finding_daily_severity_snapshots_task",
+        "schedule": timedelta(hours=1),
+    },
+    "reconcile_product_counters": {
+        "task": "dojo.tasks.reconcile_product_counters",
+        "schedule": timedelta(hours=1),
+    },
     # 'jira_status_reconciliation': {
     #     'task': 'dojo.tasks.jira_status_reconciliation_task',
     #     'schedule': timedelta(hours=12),
@@ -1800,6 +1836,34 @@ SONARQUBE_API_PARSER_HOTSPOTS = env("DD_SONARQUBE_API_PARSER_HOTSPOTS")
 ASYNC_OBJECT_DELETE = env("DD_ASYNC_OBJECT_DELETE")
 # The number of objects to be deleted per celeryworker
 ASYNC_OBEJECT_DELETE_CHUNK_SIZE = env("DD_ASYNC_OBEJECT_DELETE_CHUNK_SIZE")
+# When enabled, the importer inserts findings and their related objects in batches using bulk_create
+# and runs the post processing (deduplication, grading, ...) once per batch instead of once per finding
+IMPORT_BULK_CREATE = env("DD_IMPORT_BULK_CREATE")
+# The number of findings inserted per batch when IMPORT_BULK_CREATE is enabled
+IMPORT_BULK_CREATE_BATCH_SIZE = env("DD_IMPORT_BULK_CREATE_BATCH_SIZE")
+# The number of parsed findings the importers process (and post process) at a time
+IMPORT_CHUNK_SIZE = env("DD_IMPORT_CHUNK_SIZE")
+# The product grade calculations requested for a product within this number of seconds are collapsed
+# into a single background task. Set to 0 to calculate the grade for every request
+PRODUCT_GRADE_DEBOUNCE_SECONDS = env("DD_PRODUCT_GRADE_DEBOUNCE_SECONDS")
+# The recounts of the stale counters of a product requested within this number of seconds are collapsed
+# into a single background task. Set to 0 to start a task for every request
+PRODUCT_COUNTERS_DEBOUNCE_SECONDS = env("DD_PRODUCT_COUNTERS_DEBOUNCE_SECONDS")
+# The number of seconds the ids of the products a user is authorized for are cached. Requires a cache
+# that is shared between all processes (CACHES), so it is disabled by default
+AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT = env("DD_AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT")
+# The number of findings the CSV and Excel exports read from the database at a time
+FINDING_EXPORT_CHUNK_SIZE = env("DD_FINDING_EXPORT_CHUNK_SIZE")
+# Exports of more findings than this are created in the background, and the user is notified when the
+# file is ready for download. Set to 0 to always create the export in the request
+FINDING_EXPORT_BACKGROUND_THRESHOLD = env("DD_FINDING_EXPORT_BACKGROUND_THRESHOLD")
+# Number of seconds every process keeps the system settings in memory. On every use, a version in the cache
+# that is shared between all processes (CACHES) is checked, which changes when the system settings are saved.
+# This requires a shared cache, so it is disabled by default
+SYSTEM_SETTINGS_CACHE_TIMEOUT = env("DD_SYSTEM_SETTINGS_CACHE_TIMEOUT")
+# The number of engagements, tests, findings or endpoints whose inherited tags are updated per background task
+# when the tags of a product change
+PRODUCT_TAG_PROPAGATION_CHUNK_SIZE = env("DD_PRODUCT_TAG_PROPAGATION_CHUNK_SIZE")
 # When enabled, display the preview of objects to be deleted. This can take a long time to render
 # for very large objects
 DELETE_PREVIEW = env("DD_DELETE_PREVIEW")
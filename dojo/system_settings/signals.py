@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from dojo.middleware import invalidate_system_settings
+from dojo.models import System_Settings
+
+
+@receiver(post_save, sender=System_Settings)
+def system_settings_saved(sender, instance, **kwargs):
+    invalidate_system_settings()
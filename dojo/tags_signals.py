@@ -41,7 +41,9 @@ def make_inherited_tags_sticky(sender, instance, action, **kwargs):
 @receiver(signals.post_save, sender=Finding)
 def inherit_tags_on_instance(sender, instance, created, **kwargs):
     if inherit_product_tags(instance):
-        tag_list = instance._tags_tagulous.get_tag_list()
+        # tagulous only sets _tags_tagulous when the tags are accessed for the first time, which is
+        # not the case for objects created with bulk_create, so the tags are read through the descriptor
+        tag_list = instance.tags.get_tag_list()
         if propagate_inheritance(instance, tag_list=tag_list):
             instance.inherit_tags(tag_list)
 
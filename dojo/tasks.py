@@ -1,17 +1,32 @@
 import logging
 from datetime import date, timedelta
+from uuid import uuid4
 
 from auditlog.models import LogEntry
 from celery.utils.log import get_task_logger
+from crum import impersonate
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from django.core.management import call_command
-from django.db.models import Count, Prefetch
+from django.db.models import Count, Prefetch, Q
+from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
 
 from dojo.celery import app
-from dojo.models import Alerts, Announcement, Endpoint, Engagement, Finding, Product, System_Settings, User
+from dojo.decorators import dojo_async_task
+from dojo.models import (
+    Alerts,
+    Announcement,
+    Dojo_User,
+    Endpoint,
+    Engagement,
+    Finding,
+    Product,
+    System_Settings,
+    Test_Import,
+    User,
+)
 from dojo.notifications.helper import create_notification
 from dojo.utils import calculate_grade, sla_compute_and_notify
 
@@ -222,3 +237,93 @@ def evaluate_pro_proposition(*args, **kwargs):
 @app.task
 def clear_sessions(*args, **kwargs):
     call_command("clearsessions")
+
+
+@app.task
+def update_finding_daily_severity_snapshots_task(*args, **kwargs):
+    # recompute yesterday as well, so findings closed late in the day are caught up with
+    from dojo.product.helpers import (
+        update_finding_daily_severity_snapshots,
+        update_stale_finding_daily_severity_snapshots,
+    )
+    today = timezone.localdate()
+    update_finding_daily_severity_snapshots(start_date=today - timedelta(days=1), end_date=today)
+    # and the whole window of the products whose findings changed since it was computed
+    update_stale_finding_daily_severity_snapshots()
+
+
+@app.task
+def reconcile_product_counters(*args, **kwargs):
+    # recount the stale counters, and all counters once a day to catch changes that did not send signals
+    from dojo.product.helpers import update_product_counters
+    products = Product.objects.filter(
+        Q(product_counters__isnull=True)
+        | Q(product_counters__stale=True)
+        | Q(product_counters__updated__lt=timezone.now() - timedelta(days=1)),
+    )
+    for product in products:
+        update_product_counters(product)
+
+
+@dojo_async_task
+@app.task
+def export_findings(user_id, query_string, export_format, *args, **kwargs):
+    """Writes the findings of a CSV or Excel export to a file the user can download, and notifies the user"""
+    from dojo.reports.views import CSVExportView, ExcelExportView, get_finding_export_directory, get_findings
+    user = Dojo_User.objects.get(id=user_id)
+    request = HttpRequest()
+    request.META["QUERY_STRING"] = query_string
+    request.user = user
+    directory = get_finding_export_directory(user)
+    directory.mkdir(parents=True, exist_ok=True)
+    # only the latest export of a user is kept
+    for old_export in directory.iterdir():
+        old_export.unlink()
+    filename = f"{uuid4()}.{export_format}"
+    with impersonate(user):
+        findings, _obj = get_findings(request)
+        if export_format == "csv":
+            with (directory / filename).open("w", newline="") as file:
+                CSVExportView().write(findings, file)
+        else:
+            with (directory / filename).open("wb") as file:
+                ExcelExportView().write(findings, file)
+    create_notification(event="other",
+                        title="Findings export ready",
+                        description=f"The export of {findings.count()} findings is ready for download.",
+                        url=reverse("download_finding_export", args=(filename,)),
+                        recipients=[user.username])
+
+
+@dojo_async_task
+@app.task
+def process_import_job(import_job_id, options, *args, **kwargs):
+    """Imports the stored report of an asynchronous import job, and records the outcome on the job"""
+    from dojo.importers.default_importer import DefaultImporter
+    from dojo.importers.default_reimporter import DefaultReImporter
+    import_job = Test_Import.objects.get(id=import_job_id)
+    import_job.status = Test_Import.STATUS_RUNNING
+    import_job.save(update_fields=["status", "modified"])
+    importer_class = DefaultReImporter if import_job.type == Test_Import.REIMPORT_TYPE else DefaultImporter
+    try:
+        with impersonate(kwargs.get("async_user")), import_job.scan_file.open("rb") as scan:
+            test, _, new_findings, closed_findings, reactivated_findings, untouched_findings, _ = importer_class(
+                import_job=import_job,
+                **options,
+            ).process_scan(scan)
+    except Exception as e:
+        logger.exception("import job %i failed", import_job.id)
+        import_job.status = Test_Import.STATUS_FAILED
+        import_job.error = str(e)
+    else:
+        import_job.test = test
+        import_job.status = Test_Import.STATUS_COMPLETED
+        import_job.progress = {
+            **(import_job.progress or {}),
+            "created": new_findings,
+            "closed": closed_findings,
+            "reactivated": reactivated_findings,
+            "untouched": untouched_findings,
+        }
+    import_job.scan_file.delete(save=False)
+    import_job.save()
@@ -1,9 +1,8 @@
-import json
-
 from cvss import parser as cvss_parser
 from cvss.cvss3 import CVSS3
 
 from dojo.models import Finding
+from dojo.tools.utils import iterparse_json
 
 
 class AnchoreGrypeParser:
@@ -27,9 +26,9 @@ class AnchoreGrypeParser:
         )
 
     def get_findings(self, file, test):
-        data = json.load(file)
         dupes = {}
-        for item in data.get("matches", []):
+        # the matches are read one at a time, large reports are never loaded in memory at once
+        for _, item in iterparse_json(file, ["matches[]"]):
             vulnerability = item["vulnerability"]
             vuln_id = vulnerability["id"]
             vuln_namespace = vulnerability.get("namespace")
@@ -3,9 +3,9 @@ import logging
 import re
 
 import html2text
-from defusedxml import ElementTree
 
 from dojo.models import Endpoint, Finding
+from dojo.tools.utils import iterparse_xml
 
 logger = logging.getLogger(__name__)
 
@@ -89,12 +89,11 @@ class BurpParser:
         )
 
     def get_findings(self, xml_output, test):
-        tree = ElementTree.parse(xml_output, ElementTree.XMLParser())
-        return self.get_items(tree, test)
+        return self.get_items(iterparse_xml(xml_output, ["issue"]), test)
 
-    def get_items(self, tree, test):
+    def get_items(self, issue_nodes, test):
         items = {}
-        for node in tree.findall("issue"):
+        for node in issue_nodes:
             item = get_item(node, test)
             dupe_key = item.vuln_id_from_tool
             if dupe_key in items:
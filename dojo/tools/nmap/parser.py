@@ -2,9 +2,9 @@ import contextlib
 import datetime
 
 from cpe import CPE
-from defusedxml.ElementTree import parse
 
 from dojo.models import Endpoint, Finding
+from dojo.tools.utils import iterparse_xml
 
 
 class NmapParser:
@@ -18,8 +18,8 @@ class NmapParser:
         return "XML output (use -oX)"
 
     def get_findings(self, file, test):
-        tree = parse(file)
-        root = tree.getroot()
+        elements = iterparse_xml(file, ["host"], yield_root=True)
+        root = next(elements)
         dupes = {}
         if "nmaprun" not in root.tag:
             msg = "This doesn't seem to be a valid Nmap xml file."
@@ -31,7 +31,7 @@ class NmapParser:
                 int(root.attrib["start"]),
             )
 
-        for host in root.findall("host"):
+        for host in elements:
             host_info = "### Host\n\n"
 
             ip = host.find("address[@addrtype='ipv4']").attrib["addr"]
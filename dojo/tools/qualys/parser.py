@@ -3,11 +3,11 @@ import logging
 
 import html2text
 from cvss import CVSS3
-from defusedxml import ElementTree
 from django.conf import settings
 
 from dojo.models import Endpoint, Finding
 from dojo.tools.qualys import csv_parser
+from dojo.tools.utils import iterparse_xml
 from dojo.utils import parse_cvss_data
 
 logger = logging.getLogger(__name__)
@@ -199,7 +199,7 @@ def split_cvss(value, _temp):
         _temp["CVSS_value"] = float(value)
 
 
-def parse_finding(host, tree):
+def parse_finding(host, vuln_details_by_id):
     ret_rows = []
     issue_row = {}
 
@@ -266,8 +266,7 @@ def parse_finding(host, tree):
                 # DefectDojo does not support cvssv2
                 temp["CVSS_vector"] = None
 
-        search = f".//GLOSSARY/VULN_DETAILS_LIST/VULN_DETAILS[@id='{gid}']"
-        vuln_item = tree.find(search)
+        vuln_item = vuln_details_by_id.get(gid)
         if vuln_item is not None:
             finding = Finding()
             # Vuln name
@@ -368,11 +367,14 @@ def parse_finding(host, tree):
 
 
 def qualys_parser(qualys_xml_file):
-    parser = ElementTree.XMLParser()
-    tree = ElementTree.parse(qualys_xml_file, parser)
-    host_list = tree.find("HOST_LIST")
+    # The glossary with the details of the vulnerabilities comes after the hosts in the report,
+    # so it is read in a first pass and the hosts are streamed in a second one
+    vuln_details_by_id = {
+        vuln_details.attrib.get("id"): vuln_details
+        for vuln_details in iterparse_xml(qualys_xml_file, ["GLOSSARY/VULN_DETAILS_LIST/VULN_DETAILS"])
+    }
+    qualys_xml_file.seek(0)
     finding_list = []
-    if host_list is not None:
-        for host in host_list:
-            finding_list += parse_finding(host, tree)
+    for host in iterparse_xml(qualys_xml_file, ["HOST_LIST/HOST"]):
+        finding_list += parse_finding(host, vuln_details_by_id)
     return finding_list
@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 import textwrap
@@ -8,6 +7,7 @@ from django.utils.translation import gettext as _
 
 from dojo.models import Finding
 from dojo.tools.parser_test import ParserTest
+from dojo.tools.utils import iterparse_json
 
 logger = logging.getLogger(__name__)
 
@@ -99,37 +99,55 @@ class SarifParser:
 
     def get_findings(self, filehandle, test):
         """For simple interface of parser contract we just aggregate everything"""
-        tree = json.load(filehandle)
+        runs = self.__get_runs(filehandle)
         items = []
         # for each runs we just aggregate everything
-        for run in tree.get("runs", []):
-            items.extend(self.__get_items_from_run(run))
+        for run_items in self.__get_items_from_runs(filehandle, runs).values():
+            items.extend(run_items)
         return items
 
     def get_tests(self, scan_type, handle):
-        tree = json.load(handle)
+        runs = self.__get_runs(handle)
+        items = self.__get_items_from_runs(handle, runs)
         tests = []
-        for run in tree.get("runs", []):
+        for run_index, run in runs.items():
             test = ParserTest(
                 name=run["tool"]["driver"]["name"],
                 parser_type=run["tool"]["driver"]["name"],
                 version=run["tool"]["driver"].get("version"),
             )
-            test.findings = self.__get_items_from_run(run)
+            test.findings = items[run_index]
             tests.append(test)
         return tests
 
-    def __get_items_from_run(self, run):
-        items = []
-        # load rules
-        rules = get_rules(run)
-        artifacts = get_artifacts(run)
-        # get the timestamp of the run if possible
-        run_date = self.__get_last_invocation_date(run)
-        for result in run.get("results", []):
-            result_items = get_items_from_result(result, rules, artifacts, run_date)
+    def __get_runs(self, handle):
+        """
+        Read the runs of the report without their results, which can be very large.
+        The runs are returned by their index in the report
+        """
+        runs = {}
+        for path, value in iterparse_json(handle, ["runs[].tool", "runs[].artifacts", "runs[].invocations"]):
+            runs.setdefault(path[1], {})[path[2]] = value
+        return runs
+
+    def __get_items_from_runs(self, handle, runs):
+        """Read the results of the report again one at a time, and return the findings of each run by its index"""
+        items = {run_index: [] for run_index in runs}
+        run_contexts = {}
+        handle.seek(0)
+        for path, result in iterparse_json(handle, ["runs[].results[]"]):
+            run_index = path[1]
+            if run_index not in run_contexts:
+                run = runs.get(run_index, {})
+                # load rules
+                rules = get_rules(run)
+                artifacts = get_artifacts(run)
+                # get the timestamp of the run if possible
+                run_date = self.__get_last_invocation_date(run)
+                run_contexts[run_index] = (rules, artifacts, run_date)
+            result_items = get_items_from_result(result, *run_contexts[run_index])
             if result_items:
-                items.extend(result_items)
+                items.setdefault(run_index, []).extend(result_items)
         return items
 
     def __get_last_invocation_date(self, data):
@@ -4,6 +4,7 @@ import json
 import logging
 
 from dojo.models import Finding
+from dojo.tools.utils import iterparse_json
 from dojo.utils import parse_cvss_data
 
 logger = logging.getLogger(__name__)
@@ -147,63 +148,33 @@ class TrivyParser:
         return status_mapping.get(trivy_status, {})
 
     def get_findings(self, scan_file, test):
-        scan_data = scan_file.read()
-
-        try:
-            data = json.loads(str(scan_data, "utf-8"))
-        except Exception:
-            data = json.loads(scan_data)
-
-        # Legacy format is empty
-        if data is None:
-            return []
-        # Legacy format with results
-        if isinstance(data, list):
-            return self.get_result_items(test, data)
-        schema_version = data.get("SchemaVersion", None)
-        artifact_name = data.get("ArtifactName", "")
-        cluster_name = data.get("ClusterName")
+        # the fields telling the schema of the report are read first, then the report is read
+        # again to get the results one at a time without loading the whole report in memory
+        header = {
+            path[0]: value
+            for path, value in iterparse_json(scan_file, ["SchemaVersion", "ArtifactName", "ClusterName"])
+        }
+        schema_version = header.get("SchemaVersion")
+        artifact_name = header.get("ArtifactName", "")
+        cluster_name = header.get("ClusterName")
         if schema_version == 2:
-            results = data.get("Results", [])
+            scan_file.seek(0)
+            results = (result for _, result in iterparse_json(scan_file, ["Results[]"]))
             return self.get_result_items(test, results, artifact_name=artifact_name)
         if cluster_name is not None:
             findings = []
-            vulnerabilities = data.get("Vulnerabilities", [])
-            for service in vulnerabilities:
-                namespace = service.get("Namespace")
-                kind = service.get("Kind")
-                name = service.get("Name")
-                service_name = ""
-                if namespace:
-                    service_name = f"{namespace} / "
-                if kind:
-                    service_name += f"{kind} / "
-                if name:
-                    service_name += f"{name} / "
-                if len(service_name) >= 3:
-                    service_name = service_name[:-3]
+            scan_file.seek(0)
+            for _, service in iterparse_json(scan_file, ["Vulnerabilities[]"]):
                 findings += self.get_result_items(
-                    test, service.get("Results", []), service_name,
+                    test, service.get("Results", []), self.get_service_name(service),
                 )
-            misconfigurations = data.get("Misconfigurations", [])
-            for service in misconfigurations:
-                namespace = service.get("Namespace")
-                kind = service.get("Kind")
-                name = service.get("Name")
-                service_name = ""
-                if namespace:
-                    service_name = f"{namespace} / "
-                if kind:
-                    service_name += f"{kind} / "
-                if name:
-                    service_name += f"{name} / "
-                if len(service_name) >= 3:
-                    service_name = service_name[:-3]
+            scan_file.seek(0)
+            for _, service in iterparse_json(scan_file, ["Misconfigurations[]"]):
                 findings += self.get_result_items(
-                    test, service.get("Results", []), service_name,
+                    test, service.get("Results", []), self.get_service_name(service),
                 )
-            resources = data.get("Resources", [])
-            for resource in resources:
+            scan_file.seek(0)
+            for _, resource in iterparse_json(scan_file, ["Resources[]"]):
                 namespace = resource.get("Namespace")
                 kind = resource.get("Kind")
                 name = resource.get("Name")
@@ -219,9 +190,33 @@ class TrivyParser:
                     test, resource.get("Results", []), resource_name,
                 )
             return findings
+
+        scan_file.seek(0)
+        data = json.load(scan_file)
+        # Legacy format is empty
+        if data is None:
+            return []
+        # Legacy format with results
+        if isinstance(data, list):
+            return self.get_result_items(test, data)
         msg = "Schema of Trivy json report is not supported"
         raise ValueError(msg)
 
+    def get_service_name(self, service):
+        namespace = service.get("Namespace")
+        kind = service.get("Kind")
+        name = service.get("Name")
+        service_name = ""
+        if namespace:
+            service_name = f"{namespace} / "
+        if kind:
+            service_name += f"{kind} / "
+        if name:
+            service_name += f"{name} / "
+        if len(service_name) >= 3:
+            service_name = service_name[:-3]
+        return service_name
+
     def get_result_items(self, test, results, service_name=None, artifact_name=""):
         items = []
         for target_data in results:
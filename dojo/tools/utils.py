@@ -1,8 +1,17 @@
+import codecs
 import json
 import logging
+import re
+
+from defusedxml import ElementTree
 
 logger = logging.getLogger(__name__)
 
+JSON_WHITESPACE_REGEX = re.compile(r"[ \t\n\r]*")
+# a complete string, or one of the characters changing the nesting of a JSON document. A lone quote is
+# the start of a string that does not end in the buffer
+JSON_STRUCTURE_REGEX = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|["{}\[\]]', re.DOTALL)
+
 
 def get_npm_cwe(item_node):
     """
@@ -27,3 +36,204 @@ def get_npm_cwe(item_node):
 
     # Use CWE-1035 as fallback (vulnerable third party component)
     return 1035
+
+
+def iterparse_xml(file, paths, *, yield_root=False):
+    """
+    Parses the XML file incrementally and yields the elements matching one of the paths once they are complete.
+    The paths are relative to the root element, for example "site/alerts/alertitem" for the alerts of a ZAP report.
+
+    Every element is detached from the tree as soon as it is complete, so the memory used does not grow
+    with the size of the report: an element that was yielded is only kept as long as the caller holds it.
+    With yield_root, the root element is yielded first; only its tag and attributes are available then.
+
+    The defusedxml parser is used, which rejects entity declarations and external references (XXE, billion laughs).
+    """
+    paths = set(paths)
+    # the open elements and their paths relative to the root
+    stack = []
+    path_stack = []
+    # the number of open elements matching one of the paths, their children must be kept
+    matching_depth = 0
+    for event, element in ElementTree.iterparse(file, events=("start", "end")):
+        if event == "start":
+            if not stack:
+                path = ""
+                if yield_root:
+                    yield element
+            else:
+                path = f"{path_stack[-1]}/{element.tag}" if path_stack[-1] else element.tag
+            stack.append(element)
+            path_stack.append(path)
+            if path in paths:
+                matching_depth += 1
+            continue
+
+        stack.pop()
+        path = path_stack.pop()
+        if not stack:
+            # the root element is never detached
+            break
+        if path in paths:
+            matching_depth -= 1
+            if matching_depth == 0:
+                stack[-1].remove(element)
+                yield element
+        elif matching_depth == 0:
+            # nobody will ever look at this element anymore
+            stack[-1].remove(element)
+
+
+class _JsonReader:
+
+    """
+    Reads a JSON document from a file one chunk at a time. Only the values to be returned are decoded,
+    using the C accelerated decoder of the json module, everything else is skipped without creating objects.
+    """
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self):
+        """Drops the consumed part of the buffer and appends the next chunk of the file, returns False at the end of the file"""
+        if self.eof:
+            return False
+        # read at least as much as is already buffered so that very large values are not re-scanned too often
+        data = self.file.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not data:
+            self.eof = True
+        if isinstance(data, bytes):
+            data = self.decoder.decode(data, final=self.eof)
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def fail(self, msg):
+        raise json.JSONDecodeError(msg, self.buffer, self.pos)
+
+    def peek(self):
+        """Returns the next character that is not a whitespace, or an empty string at the end of the file"""
+        while True:
+            self.pos = JSON_WHITESPACE_REGEX.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ""
+
+    def next_char(self):
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # the value may continue in the next chunk
+                if self.read_more():
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self.read_more():
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self):
+        if self.peek() not in {"{", "["}:
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            match = JSON_STRUCTURE_REGEX.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self.read_more():
+                    self.fail("Unterminated object or array")
+                continue
+            part = match.group()
+            if part == '"':
+                # the string continues in the next chunk
+                self.pos = match.start()
+                if not self.read_more():
+                    self.fail("Unterminated string")
+                continue
+            self.pos = match.end()
+            if part in {"{", "["}:
+                depth += 1
+            elif part in {"}", "]"}:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def items(self, node, path):
+        """Yields the values matching the paths of the node from the value starting at the current position"""
+        if None in node:
+            yield path, self.read_value()
+            return
+        char = self.peek()
+        if char == "[" and "[]" in node:
+            self.pos += 1
+            if self.peek() == "]":
+                self.pos += 1
+                return
+            index = 0
+            while True:
+                yield from self.items(node["[]"], (*path, index))
+                index += 1
+                char = self.next_char()
+                if char == "]":
+                    return
+                if char != ",":
+                    self.fail("Expecting ',' delimiter")
+        elif char == "{" and node.keys() - {"[]"}:
+            self.pos += 1
+            if self.peek() == "}":
+                self.pos += 1
+                return
+            while True:
+                key = self.read_value()
+                if self.next_char() != ":":
+                    self.fail("Expecting ':' delimiter")
+                if key != "[]" and key in node:
+                    yield from self.items(node[key], (*path, key))
+                else:
+                    self.skip_value()
+                char = self.next_char()
+                if char == "}":
+                    return
+                if char != ",":
+                    self.fail("Expecting ',' delimiter")
+        else:
+            self.skip_value()
+
+
+def iterparse_json(file, paths, *, chunk_size=65536):
+    """
+    Parses the JSON file incrementally and yields the values matching one of the paths, in the order of the document.
+    A path is a list of object keys separated by dots where "[]" stands for every item of an array, for example
+    "Results[].Vulnerabilities[]" for the vulnerabilities of a Trivy report or "[]" for the items of a top level array.
+
+    The values are yielded as (path, value) tuples where path is the tuple of the keys and array indexes leading to
+    the value, such as ("runs", 0, "results", 12). Only the matching values are decoded and kept in memory, so the
+    memory used does not grow with the size of the report. The file can be opened in binary or text mode.
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        for key in path.split("."):
+            name = key.split("[]", 1)[0]
+            if name:
+                node = node.setdefault(name, {})
+            for _ in range(key.count("[]")):
+                node = node.setdefault("[]", {})
+        node[None] = True
+    yield from _JsonReader(file, chunk_size).items(tree, ())
@@ -1,7 +1,7 @@
-from defusedxml import ElementTree
 from html2text import html2text
 
 from dojo.models import Endpoint, Finding
+from dojo.tools.utils import iterparse_xml
 
 
 class ZapParser:
@@ -72,62 +72,59 @@ class ZapParser:
         if not file.name.endswith(".xml"):
             msg = "Internal error: Wrong file format, please use xml."
             raise ValueError(msg)
-        tree = ElementTree.parse(file)
-        items = []
-        for node in tree.findall("site"):
-            for item in node.findall("alerts/alertitem"):
-                finding = Finding(
-                    test=test,
-                    title=item.findtext("alert"),
-                    description=html2text(item.findtext("desc")),
-                    severity=self.MAPPING_SEVERITY.get(
-                        item.findtext("riskcode"),
-                    ),
-                    scanner_confidence=self.MAPPING_CONFIDENCE.get(
-                        item.findtext("riskcode"),
-                    ),
-                    mitigation=html2text(item.findtext("solution")),
-                    references=html2text(item.findtext("reference")),
-                    dynamic_finding=True,
-                    static_finding=False,
-                    vuln_id_from_tool=item.findtext("pluginid"),
-                )
-                if (
-                    item.findtext("cweid") is not None
-                    and item.findtext("cweid").isdigit()
-                ):
-                    finding.cwe = int(item.findtext("cweid"))
+        # the findings are yielded as the report is read, so the importer never has all of them in memory
+        for item in iterparse_xml(file, ["site/alerts/alertitem"]):
+            finding = Finding(
+                test=test,
+                title=item.findtext("alert"),
+                description=html2text(item.findtext("desc")),
+                severity=self.MAPPING_SEVERITY.get(
+                    item.findtext("riskcode"),
+                ),
+                scanner_confidence=self.MAPPING_CONFIDENCE.get(
+                    item.findtext("riskcode"),
+                ),
+                mitigation=html2text(item.findtext("solution")),
+                references=html2text(item.findtext("reference")),
+                dynamic_finding=True,
+                static_finding=False,
+                vuln_id_from_tool=item.findtext("pluginid"),
+            )
+            if (
+                item.findtext("cweid") is not None
+                and item.findtext("cweid").isdigit()
+            ):
+                finding.cwe = int(item.findtext("cweid"))
 
-                finding.unsaved_endpoints = []
-                finding.unsaved_req_resp = []
-                for instance in item.findall("instances/instance"):
-                    endpoint = Endpoint.from_uri(instance.findtext("uri"))
-                    # If the requestheader key is set, the report is in the "XML with requests and responses"
-                    # format - load requests and responses and add them to the
-                    # database
-                    if instance.findtext("requestheader") is not None:
-                        # Assemble the request from header and body
-                        request = instance.findtext(
-                            "requestheader",
-                        ) + instance.findtext("requestbody")
-                        response = instance.findtext(
-                            "responseheader",
-                        ) + instance.findtext("responsebody")
-                    else:
-                        # The report is in the regular XML format, without requests and responses.
-                        # Use the default settings for constructing the request
-                        # and response fields.
-                        request = f"Method:           {instance.findtext('method')} \nParam:            {instance.findtext('param')} \nAttack:           {instance.findtext('attack')} \nEndpointQuery:    {endpoint.query} \nEndpointFragment: {endpoint.fragment}"
-                        response = f"{instance.findtext('evidence')}"
+            finding.unsaved_endpoints = []
+            finding.unsaved_req_resp = []
+            for instance in item.findall("instances/instance"):
+                endpoint = Endpoint.from_uri(instance.findtext("uri"))
+                # If the requestheader key is set, the report is in the "XML with requests and responses"
+                # format - load requests and responses and add them to the
+                # database
+                if instance.findtext("requestheader") is not None:
+                    # Assemble the request from header and body
+                    request = instance.findtext(
+                        "requestheader",
+                    ) + instance.findtext("requestbody")
+                    response = instance.findtext(
+                        "responseheader",
+                    ) + instance.findtext("responsebody")
+                else:
+                    # The report is in the regular XML format, without requests and responses.
+                    # Use the default settings for constructing the request
+                    # and response fields.
+                    request = f"Method:           {instance.findtext('method')} \nParam:            {instance.findtext('param')} \nAttack:           {instance.findtext('attack')} \nEndpointQuery:    {endpoint.query} \nEndpointFragment: {endpoint.fragment}"
+                    response = f"{instance.findtext('evidence')}"
 
-                    # we remove query and fragment because with some configuration
-                    # the tool generate them on-the-go and it produces a lot of
-                    # fake endpoints
-                    endpoint.query = None
-                    endpoint.fragment = None
-                    finding.unsaved_endpoints.append(endpoint)
-                    finding.unsaved_req_resp.append(
-                        {"req": request, "resp": response},
-                    )
-                items.append(finding)
-        return items
+                # we remove query and fragment because with some configuration
+                # the tool generate them on-the-go and it produces a lot of
+                # fake endpoints
+                endpoint.query = None
+                endpoint.fragment = None
+                finding.unsaved_endpoints.append(endpoint)
+                finding.unsaved_req_resp.append(
+                    {"req": request, "resp": response},
+                )
+            yield finding
@@ -30,6 +30,7 @@ from dojo.api_v2.views import (
     FindingTemplatesViewSet,
     FindingViewSet,
     GlobalRoleViewSet,
+    ImportJobViewSet,
     ImportLanguagesView,
     ImportScanView,
     JiraInstanceViewSet,
@@ -134,6 +135,7 @@ v2_api.register(r"engagement_presets", EngagementPresetsViewset, basename="engag
 v2_api.register(r"finding_templates", FindingTemplatesViewSet, basename="finding_template")
 v2_api.register(r"findings", FindingViewSet, basename="finding")
 v2_api.register(r"global_roles", GlobalRoleViewSet, basename="global_role")
+v2_api.register(r"import-jobs", ImportJobViewSet, basename="importjob")
 v2_api.register(r"import-languages", ImportLanguagesView, basename="importlanguages")
 v2_api.register(r"import-scan", ImportScanView, basename="importscan")
 v2_api.register(r"jira_instances", JiraInstanceViewSet, basename="jira_instance")
@@ -1,5 +1,6 @@
 import binascii
 import calendar as tcalendar
+import copy
 import hashlib
 import importlib
 import logging
@@ -7,9 +8,12 @@ import mimetypes
 import os
 import pathlib
 import re
+import threading
+from bisect import bisect_left, bisect_right
 from calendar import monthrange
 from collections.abc import Callable
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from math import pi, sqrt
 from pathlib import Path
 
@@ -19,7 +23,11 @@ import cvss.parser
 import hyperlink
 import vobject
 from asteval import Interpreter
+from auditlog.cid import get_cid
+from auditlog.context import auditlog_disabled
+from auditlog.diff import model_instance_diff
 from auditlog.models import LogEntry
+from auditlog.registry import auditlog
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cvss.cvss3 import CVSS3
@@ -29,6 +37,8 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.signals import user_logged_in, user_logged_out, user_login_failed
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import FieldError
 from django.core.paginator import Paginator
 from django.db.models import Case, Count, IntegerField, Q, Subquery, Sum, Value, When
 from django.db.models.query import QuerySet
@@ -39,10 +49,12 @@ from django.urls import get_resolver, get_script_prefix, reverse
 from django.utils import timezone
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils.translation import gettext as _
+from watson import search as watson
+from watson.models import SearchEntry
 
 from dojo.authorization.roles_permissions import Permissions
 from dojo.celery import app
-from dojo.decorators import dojo_async_task, dojo_model_from_id, dojo_model_to_id
+from dojo.decorators import dojo_async_task, dojo_model_from_id, dojo_model_to_id, we_want_async
 from dojo.finding.queries import get_authorized_findings
 from dojo.github import (
     add_external_issue_github,
@@ -52,24 +64,34 @@ from dojo.github import (
 )
 from dojo.models import (
     NOTIFICATION_CHOICES,
+    SEVERITIES,
     Benchmark_Type,
     Dojo_Group_Member,
     Dojo_User,
     Endpoint,
+    Endpoint_Status,
     Engagement,
     FileUpload,
     Finding,
+    Finding_Daily_Severity_Snapshot,
     Finding_Group,
     Finding_Template,
     Language_Type,
     Languages,
     Notifications,
     Product,
+    Product_Counters,
     System_Settings,
     Test,
     User,
 )
 from dojo.notifications.helper import create_notification
+from dojo.product.helpers import (
+    get_product_counters,
+    mark_product_counters_stale,
+    product_counters_deferred,
+    update_product_finding_daily_severity_snapshots,
+)
 
 logger = logging.getLogger(__name__)
 deduplicationLogger = logging.getLogger("dojo.specific-loggers.deduplication")
@@ -276,25 +298,46 @@ def are_urls_equal(url1, url2, fields):
     return True
 
 
-def are_endpoints_duplicates(new_finding, to_duplicate_finding):
+ENDPOINT_DEDUPE_FIELDS = ("scheme", "host", "port", "path", "query", "fragment", "userinfo", "user")
+
+
+def get_endpoint_keys(finding, fields, endpoint_keys_cache=None):
+    """
+    Returns the set of endpoints of the finding, each one projected on the supplied hyperlink fields.
+    Two endpoints are equal in terms of these fields when their keys are equal (see are_urls_equal).
+    The keys are stored in endpoint_keys_cache by finding id, so they are only computed once per dedupe run.
+    """
+    if endpoint_keys_cache is not None and finding.id in endpoint_keys_cache:
+        return endpoint_keys_cache[finding.id]
+    endpoint_keys = frozenset(
+        tuple(getattr(url, field) for field in fields)
+        for url in get_endpoints_as_url(finding)
+    )
+    if endpoint_keys_cache is not None:
+        endpoint_keys_cache[finding.id] = endpoint_keys
+    return endpoint_keys
+
+
+def are_endpoints_duplicates(new_finding, to_duplicate_finding, endpoint_keys_cache=None):
     fields = settings.DEDUPE_ALGO_ENDPOINT_FIELDS
     # shortcut if fields list is empty/feature is disabled
     if len(fields) == 0:
         deduplicationLogger.debug("deduplication by endpoint fields is disabled")
         return True
 
-    list1 = get_endpoints_as_url(new_finding)
-    list2 = get_endpoints_as_url(to_duplicate_finding)
+    for field in fields:
+        if field not in ENDPOINT_DEDUPE_FIELDS:
+            logger.warning("Field " + field + " is not supported by the endpoint dedupe algorithm, ignoring it.")
+    fields = [field for field in fields if field in ENDPOINT_DEDUPE_FIELDS]
+
+    keys1 = get_endpoint_keys(new_finding, fields, endpoint_keys_cache)
+    keys2 = get_endpoint_keys(to_duplicate_finding, fields, endpoint_keys_cache)
 
-    deduplicationLogger.debug(f"Starting deduplication by endpoint fields for finding {new_finding.id} with urls {list1} and finding {to_duplicate_finding.id} with urls {list2}")
-    if list1 == [] and list2 == []:
+    deduplicationLogger.debug(f"Starting deduplication by endpoint fields for finding {new_finding.id} with endpoints {keys1} and finding {to_duplicate_finding.id} with endpoints {keys2}")
+    if not keys1 and not keys2:
         return True
 
-    for l1 in list1:
-        for l2 in list2:
-            if are_urls_equal(l1, l2, fields):
-                return True
-    return False
+    return not keys1.isdisjoint(keys2)
 
 
 @dojo_model_to_id
@@ -310,7 +353,7 @@ def do_dedupe_finding(new_finding, *args, **kwargs):
         return dedupe_method(new_finding, *args, **kwargs)
 
     try:
-        enabled = System_Settings.objects.get(no_cache=True).enable_deduplication
+        enabled = System_Settings.objects.get().enable_deduplication
     except System_Settings.DoesNotExist:
         logger.warning("system settings not found")
         enabled = False
@@ -469,16 +512,18 @@ def deduplicate_hash_code(new_finding):
                 id=new_finding.id).exclude(
                     hash_code=None).exclude(
                         duplicate=True).order_by("id")
+    existing_findings = existing_findings.prefetch_related("endpoints")
 
     deduplicationLogger.debug("Found "
         + str(len(existing_findings)) + " findings with same hash_code")
+    endpoint_keys_cache = {}
     for find in existing_findings:
         if is_deduplication_on_engagement_mismatch(new_finding, find):
             deduplicationLogger.debug(
                 "deduplication_on_engagement_mismatch, skipping dedupe.")
             continue
         try:
-            if are_endpoints_duplicates(new_finding, find):
+            if are_endpoints_duplicates(new_finding, find, endpoint_keys_cache):
                 set_duplicate(new_finding, find)
                 break
         except Exception as e:
@@ -503,15 +548,17 @@ def deduplicate_uid_or_hash_code(new_finding):
             test__engagement__product=new_finding.test.engagement.product).exclude(
                 id=new_finding.id).exclude(
                         duplicate=True).order_by("id")
+    existing_findings = existing_findings.prefetch_related("endpoints")
     deduplicationLogger.debug("Found "
         + str(len(existing_findings)) + " findings with either the same unique_id_from_tool or hash_code")
+    endpoint_keys_cache = {}
     for find in existing_findings:
         if is_deduplication_on_engagement_mismatch(new_finding, find):
             deduplicationLogger.debug(
                 "deduplication_on_engagement_mismatch, skipping dedupe.")
             continue
         try:
-            if are_endpoints_duplicates(new_finding, find):
+            if are_endpoints_duplicates(new_finding, find, endpoint_keys_cache):
                 set_duplicate(new_finding, find)
         except Exception as e:
             deduplicationLogger.debug(str(e))
@@ -519,6 +566,167 @@ def deduplicate_uid_or_hash_code(new_finding):
         break
 
 
+@dojo_async_task
+@app.task
+def dedupe_batch(test_id, *args, finding_ids=None, **kwargs):
+    """
+    Deduplicates the findings of a test in one pass. All candidate originals are fetched with a
+    single query and matched in memory, instead of running one query per finding.
+    When finding_ids is supplied, only those findings of the test are deduplicated.
+    """
+    if dedupe_method := get_custom_method("FINDING_DEDUPE_METHOD"):
+        findings = Finding.objects.filter(test_id=test_id).order_by("id")
+        if finding_ids is not None:
+            findings = findings.filter(id__in=finding_ids)
+        for finding in findings:
+            dedupe_method(finding, *args, **kwargs)
+        return
+
+    try:
+        enabled = System_Settings.objects.get().enable_deduplication
+    except System_Settings.DoesNotExist:
+        logger.warning("system settings not found")
+        enabled = False
+    if not enabled:
+        deduplicationLogger.debug("dedupe_batch: skipping dedupe because it's disabled in system settings get()")
+        return
+
+    test = Test.objects.select_related("engagement__product", "test_type").get(id=test_id)
+    findings = test.finding_set.prefetch_related("endpoints", "original_finding").order_by("id")
+    if finding_ids is not None:
+        findings = findings.filter(id__in=finding_ids)
+    # the findings share the test, so there is no need to query it again for each of them
+    findings = list(findings)
+    for finding in findings:
+        finding.test = test
+    if not findings:
+        return
+
+    deduplication_algorithm = test.deduplication_algorithm
+    deduplicationLogger.debug("dedupe_batch for test %i: %i findings, deduplication algorithm: %s", test.id, len(findings), deduplication_algorithm)
+    if deduplication_algorithm not in {settings.DEDUPE_ALGO_HASH_CODE, settings.DEDUPE_ALGO_UNIQUE_ID_FROM_TOOL, settings.DEDUPE_ALGO_UNIQUE_ID_FROM_TOOL_OR_HASH_CODE}:
+        deduplicationLogger.debug("no configuration per parser found; using legacy algorithm")
+        for finding in findings:
+            deduplicate_legacy(finding)
+        return
+
+    candidates_by_id = get_dedupe_batch_candidates(test, findings, deduplication_algorithm)
+    # use the same instances for the findings being deduplicated, so that the changes made
+    # while going through the batch are seen when they are candidates for a later finding
+    candidates_by_id.update({finding.id: finding for finding in findings})
+    candidates_by_hash_code = {}
+    candidates_by_unique_id_from_tool = {}
+    for candidate in sorted(candidates_by_id.values(), key=lambda candidate: candidate.id):
+        if candidate.hash_code is not None:
+            candidates_by_hash_code.setdefault(candidate.hash_code, []).append(candidate)
+        if candidate.unique_id_from_tool is not None:
+            candidates_by_unique_id_from_tool.setdefault(candidate.unique_id_from_tool, []).append(candidate)
+
+    batch_ids = {finding.id for finding in findings}
+    now = timezone.now()
+    endpoint_keys_cache = {}
+    duplicates = []
+    # bulk_update doesn't trigger the auditlog, so take a copy of the duplicates to record the changes ourselves
+    old_duplicates = []
+    found_by = set()
+    for new_finding in findings:
+        if deduplication_algorithm == settings.DEDUPE_ALGO_HASH_CODE:
+            candidates = candidates_by_hash_code.get(new_finding.hash_code, []) if new_finding.hash_code is not None else []
+        elif deduplication_algorithm == settings.DEDUPE_ALGO_UNIQUE_ID_FROM_TOOL:
+            candidates = candidates_by_unique_id_from_tool.get(new_finding.unique_id_from_tool, []) if new_finding.unique_id_from_tool is not None else []
+        else:
+            candidates = candidates_by_hash_code.get(new_finding.hash_code, []) if new_finding.hash_code is not None else []
+            if new_finding.unique_id_from_tool is not None:
+                # unique_id_from_tool can only apply to the same test_type because it is parser dependent
+                candidates = sorted(
+                    {candidate.id: candidate for candidate in candidates + [
+                        candidate for candidate in candidates_by_unique_id_from_tool.get(new_finding.unique_id_from_tool, [])
+                        if candidate.test.test_type_id == test.test_type_id
+                    ]}.values(),
+                    key=lambda candidate: candidate.id)
+        # Findings of the batch that come after the new finding did not exist yet when it would
+        # have been deduplicated on save, so they are not considered as original
+        candidates = [
+            candidate for candidate in candidates
+            if candidate.id != new_finding.id and not candidate.duplicate
+            and (candidate.id < new_finding.id or candidate.id not in batch_ids)
+        ]
+        deduplicationLogger.debug("Found %i candidates for finding %i", len(candidates), new_finding.id)
+        for existing_finding in candidates:
+            if is_deduplication_on_engagement_mismatch(new_finding, existing_finding):
+                deduplicationLogger.debug(
+                    "deduplication_on_engagement_mismatch, skipping dedupe.")
+                continue
+            if deduplication_algorithm != settings.DEDUPE_ALGO_UNIQUE_ID_FROM_TOOL and not are_endpoints_duplicates(new_finding, existing_finding, endpoint_keys_cache):
+                if deduplication_algorithm == settings.DEDUPE_ALGO_HASH_CODE:
+                    continue
+                # deduplicate_uid_or_hash_code only looks at the first candidate
+                break
+            if new_finding.original_finding.all():
+                # the transitive duplicates have to be flattened, which is not done in bulk
+                try:
+                    set_duplicate(new_finding, existing_finding)
+                except Exception as e:
+                    deduplicationLogger.debug(str(e))
+                    continue
+                break
+            if is_duplicate_reopen(new_finding, existing_finding):
+                deduplicationLogger.debug("Found a regression. Ignore this so that a new duplicate chain can be made")
+                continue
+            if new_finding.duplicate and finding_mitigated(existing_finding):
+                deduplicationLogger.debug("Skip this finding as we do not want to attach a new duplicate to a mitigated finding")
+                continue
+            deduplicationLogger.debug("Setting new finding %i as a duplicate of existing finding %i", new_finding.id, existing_finding.id)
+            # bulk_update does not send the pre_save signal that keeps track of status changes
+            old_duplicates.append(copy.copy(new_finding))
+            if new_finding.active or new_finding.verified:
+                new_finding.last_status_update = now
+            new_finding.duplicate = True
+            new_finding.active = False
+            new_finding.verified = False
+            new_finding.duplicate_finding = existing_finding
+            duplicates.append(new_finding)
+            found_by.add((existing_finding.id, test.test_type_id))
+            break
+
+    Finding.objects.bulk_update(duplicates, ["duplicate", "active", "verified", "duplicate_finding", "last_status_update"])
+    bulk_create_update_log_entries(old_duplicates, duplicates, actor=get_current_user())
+    update_finding_search_index_entries([finding.id for finding in duplicates])
+    found_by_model = Finding.found_by.through
+    found_by_model.objects.bulk_create(
+        [found_by_model(finding_id=finding_id, test_type_id=test_type_id) for finding_id, test_type_id in found_by],
+        ignore_conflicts=True,
+    )
+    # the duplicates are no longer counted as open findings, and bulk_update doesn't send the
+    # signals that mark the product counters as stale
+    if duplicates:
+        mark_product_counters_stale(product_id=test.engagement.product_id)
+    deduplicationLogger.debug("dedupe_batch for test %i: %i duplicates found", test.id, len(duplicates))
+
+
+def get_dedupe_batch_candidates(test, findings, deduplication_algorithm):
+    """Returns the findings that could be the original of any of the supplied findings of the test, by id"""
+    hash_codes = {finding.hash_code for finding in findings if finding.hash_code is not None}
+    unique_ids_from_tool = {finding.unique_id_from_tool for finding in findings if finding.unique_id_from_tool is not None}
+    if deduplication_algorithm == settings.DEDUPE_ALGO_HASH_CODE:
+        query = Q(hash_code__in=hash_codes)
+    elif deduplication_algorithm == settings.DEDUPE_ALGO_UNIQUE_ID_FROM_TOOL:
+        query = Q(unique_id_from_tool__in=unique_ids_from_tool)
+        # the unique_id_from_tool is unique for a given tool: do not compare with other tools
+        if not test.engagement.deduplication_on_engagement:
+            query &= Q(test__test_type=test.test_type)
+    else:
+        query = Q(hash_code__in=hash_codes) | (Q(unique_id_from_tool__in=unique_ids_from_tool) & Q(test__test_type=test.test_type))
+
+    if test.engagement.deduplication_on_engagement:
+        query &= Q(test__engagement=test.engagement)
+    else:
+        query &= Q(test__engagement__product=test.engagement.product)
+
+    candidates = Finding.objects.filter(query).exclude(duplicate=True).select_related("test__engagement").prefetch_related("endpoints")
+    return {candidate.id: candidate for candidate in candidates}
+
+
 def set_duplicate(new_finding, existing_finding):
     deduplicationLogger.debug(f"new_finding.status(): {new_finding.id} {new_finding.status()}")
     deduplicationLogger.debug(f"existing_finding.status(): {existing_finding.id} {existing_finding.status()}")
@@ -802,16 +1010,17 @@ def get_punchcard_data(objs, start_date, weeks, view="Finding"):
         # so we could have for 29/12/2019: week=1 and year=2019 :-D. So using week number from db is not practical
         if view == "Finding":
             severities_by_day = objs.filter(created__date__gte=first_sunday).filter(created__date__lt=last_sunday) \
-                                        .values("created__date") \
+                                        .values_list("created__date") \
                                         .annotate(count=Count("id")) \
                                         .order_by("created__date")
         elif view == "Endpoint":
             severities_by_day = objs.filter(date__gte=first_sunday).filter(date__lt=last_sunday) \
-                                        .values("date") \
+                                        .values_list("date") \
                                         .annotate(count=Count("id")) \
                                         .order_by("date")
+        severities_by_day = list(severities_by_day)
         # return empty stuff if no findings to be statted
-        if severities_by_day.count() <= 0:
+        if not severities_by_day:
             return None, None
 
         # day of the week numbers:
@@ -827,57 +1036,24 @@ def get_punchcard_data(objs, start_date, weeks, view="Finding"):
         # map from python to javascript, do not use week numbers or day numbers from database.
         day_offset = {0: 5, 1: 4, 2: 3, 3: 2, 4: 1, 5: 0, 6: 6}
 
-        punchcard = []
-        ticks = []
-        highest_day_count = 0
-        tick = 0
-        day_counts = [0, 0, 0, 0, 0, 0, 0]
-
         start_of_week = timezone.make_aware(datetime.combine(first_sunday, datetime.min.time()))
-        start_of_next_week = start_of_week + relativedelta(weeks=1)
-
-        for day in severities_by_day:
-            if view == "Finding":
-                created = day["created__date"]
-            elif view == "Endpoint":
-                created = day["date"]
-            day_count = day["count"]
+        first_day = start_of_week.date()
+        # the week in progress + empty weeks on the end are always shown
+        week_count = max(weeks + 1, (severities_by_day[-1][0] - first_day).days // 7 + 1)
+        day_counts = [[0, 0, 0, 0, 0, 0, 0] for _ in range(week_count)]
 
-            created = timezone.make_aware(datetime.combine(created, datetime.min.time()))
-
-            if created < start_of_week:
+        for created, day_count in severities_by_day:
+            if created < first_day:
                 raise ValueError("date found outside supported range: " + str(created))
-            if created >= start_of_week and created < start_of_next_week:
-                # add day count to current week data
-                day_counts[day_offset[created.weekday()]] = day_count
-                highest_day_count = max(highest_day_count, day_count)
-            else:
-                # created >= start_of_next_week, so store current week, prepare for next
-                while created >= start_of_next_week:
-                    week_data, label = get_week_data(start_of_week, tick, day_counts)
-                    punchcard.extend(week_data)
-                    ticks.append(label)
-                    tick += 1
-
-                    # new week, new values!
-                    day_counts = [0, 0, 0, 0, 0, 0, 0]
-                    start_of_week = start_of_next_week
-                    start_of_next_week += relativedelta(weeks=1)
-
-                # finally a day that falls into the week bracket
-                day_counts[day_offset[created.weekday()]] = day_count
-                highest_day_count = max(highest_day_count, day_count)
-
-        # add week in progress + empty weeks on the end if needed
-        while tick < weeks + 1:
-            week_data, label = get_week_data(start_of_week, tick, day_counts)
+            day_counts[(created - first_day).days // 7][day_offset[created.weekday()]] = day_count
+        highest_day_count = max(day_count for _, day_count in severities_by_day)
+
+        punchcard = []
+        ticks = []
+        for tick in range(week_count):
+            week_data, label = get_week_data(start_of_week + relativedelta(weeks=tick), tick, day_counts[tick])
             punchcard.extend(week_data)
             ticks.append(label)
-            tick += 1
-
-            day_counts = [0, 0, 0, 0, 0, 0, 0]
-            start_of_week = start_of_next_week
-            start_of_next_week += relativedelta(weeks=1)
 
         # adjust the size or circles
         ratio = (sqrt(highest_day_count / pi))
@@ -990,6 +1166,24 @@ def get_period_counts_legacy(findings,
     }
 
 
+def cumulative_counts_by_day(rows):
+    """
+    Turns (day, count) rows into a sorted list of days and the running total of the counts,
+    so the number of items in any range of days can be looked up with count_between_days
+    """
+    days, totals = [], [0]
+    for day, count in sorted(rows):
+        days.append(day)
+        totals.append(totals[-1] + count)
+    return days, totals
+
+
+def count_between_days(cumulative_counts, start_day, end_day):
+    """Returns the number of items counted from start_day up to and including end_day"""
+    days, totals = cumulative_counts
+    return totals[bisect_right(days, end_day)] - totals[bisect_left(days, start_day)]
+
+
 def get_period_counts(findings,
                       findings_closed,
                       accepted_findings,
@@ -1011,6 +1205,44 @@ def get_period_counts(findings,
     accepted_in_period.append(
         ["Timestamp", "Date", "S0", "S1", "S2", "S3", "Total", "Closed"])
 
+    severities = ["Critical", "High", "Medium", "Low"]
+    # the findings can also be endpoint statuses
+    finding_prefix = "finding__" if findings.model is Endpoint_Status else ""
+
+    # count the findings per day once, then count the days of each period
+    opened_rows = {severity: [] for severity in severities}
+    active_rows = {severity: [] for severity in severities}
+    for day, severity, active, count in findings.order_by() \
+            .values_list("date", f"{finding_prefix}severity", f"{finding_prefix}active") \
+            .annotate(count=Count("id", distinct=True)):
+        if severity in opened_rows:
+            opened_rows[severity].append((day, count))
+            if active:
+                active_rows[severity].append((day, count))
+    opened_counts = {severity: cumulative_counts_by_day(rows) for severity, rows in opened_rows.items()}
+    active_counts = {severity: cumulative_counts_by_day(rows) for severity, rows in active_rows.items()}
+
+    try:
+        closed_rows = findings_closed.order_by().filter(mitigated__isnull=False) \
+            .values_list("mitigated__date").annotate(count=Count("id", distinct=True))
+    except FieldError:
+        closed_rows = findings_closed.order_by().filter(mitigated_time__isnull=False) \
+            .values_list("mitigated_time__date").annotate(count=Count("id", distinct=True))
+    closed_counts = cumulative_counts_by_day(closed_rows)
+
+    accepted_rows = {severity: [] for severity in severities}
+    if accepted_findings is not None:
+        try:
+            risk_accepted_by_day = accepted_findings.order_by().filter(risk_acceptance__created__isnull=False) \
+                .values_list("risk_acceptance__created__date", "severity").annotate(count=Count("id"))
+        except FieldError:
+            risk_accepted_by_day = accepted_findings.order_by() \
+                .values_list("date", "finding__severity").annotate(count=Count("id"))
+        for day, severity, count in risk_accepted_by_day:
+            if severity in accepted_rows:
+                accepted_rows[severity].append((day, count))
+    accepted_counts = {severity: cumulative_counts_by_day(rows) for severity, rows in accepted_rows.items()}
+
     for x in range(-1, period_interval):
         if relative_delta == "months":
             # make interval the first through last of month
@@ -1023,102 +1255,25 @@ def get_period_counts(findings,
             new_date = start_date + relativedelta(weeks=x, weekday=MO(1))
             end_date = new_date + relativedelta(weeks=1, weekday=MO(1))
 
-        try:
-            closed_in_range_count = findings_closed.filter(
-                mitigated__date__range=[new_date, end_date]).count()
-        except:
-            closed_in_range_count = findings_closed.filter(
-                mitigated_time__range=[new_date, end_date]).count()
-
-        if accepted_findings:
-            date_range = [
-                datetime(new_date.year, new_date.month, new_date.day, tzinfo=tz),
-                datetime(end_date.year, end_date.month, end_date.day, tzinfo=tz),
-            ]
-            try:
-                risks_a = accepted_findings.filter(risk_acceptance__created__date__range=date_range)
-            except:
-                risks_a = accepted_findings.filter(date__range=date_range)
-        else:
-            risks_a = None
+        # both ends of the period are included
+        start_day, end_day = new_date.date(), end_date.date()
+        closed_in_range_count = count_between_days(closed_counts, start_day, end_day)
+        f_counts = [count_between_days(opened_counts[severity], start_day, end_day) for severity in severities]
+        ra_counts = [count_between_days(accepted_counts[severity], start_day, end_day) for severity in severities]
+        active_counts_in_period = [count_between_days(active_counts[severity], date.min, end_day) for severity in severities]
 
-        f_crit_count, f_high_count, f_med_count, f_low_count, _ = [
-            0, 0, 0, 0, 0,
-        ]
-        ra_crit_count, ra_high_count, ra_med_count, ra_low_count, _ = [
-            0, 0, 0, 0, 0,
-        ]
-        active_crit_count, active_high_count, active_med_count, active_low_count, _ = [
-            0, 0, 0, 0, 0,
-        ]
-
-        for finding in findings:
-            try:
-                severity = finding.severity
-                active = finding.active
-#                risk_accepted = finding.risk_accepted TODO: in future release
-            except:
-                severity = finding.finding.severity
-                active = finding.finding.active
-#                risk_accepted = finding.finding.risk_accepted
-
-            try:
-                f_time = datetime.combine(finding.date, datetime.min.time()).replace(tzinfo=tz)
-            except:
-                f_time = finding.date
-
-            if f_time <= end_date:
-                if severity == "Critical":
-                    if new_date <= f_time:
-                        f_crit_count += 1
-                    if active:
-                        active_crit_count += 1
-                elif severity == "High":
-                    if new_date <= f_time:
-                        f_high_count += 1
-                    if active:
-                        active_high_count += 1
-                elif severity == "Medium":
-                    if new_date <= f_time:
-                        f_med_count += 1
-                    if active:
-                        active_med_count += 1
-                elif severity == "Low":
-                    if new_date <= f_time:
-                        f_low_count += 1
-                    if active:
-                        active_low_count += 1
-
-        if risks_a is not None:
-            for finding in risks_a:
-                try:
-                    severity = finding.severity
-                except:
-                    severity = finding.finding.severity
-                if severity == "Critical":
-                    ra_crit_count += 1
-                elif severity == "High":
-                    ra_high_count += 1
-                elif severity == "Medium":
-                    ra_med_count += 1
-                elif severity == "Low":
-                    ra_low_count += 1
-
-        total = f_crit_count + f_high_count + f_med_count + f_low_count
         opened_in_period.append(
             [(tcalendar.timegm(new_date.timetuple()) * 1000), new_date,
-             f_crit_count, f_high_count, f_med_count, f_low_count, total,
+             *f_counts, sum(f_counts),
              closed_in_range_count])
 
-        total = ra_crit_count + ra_high_count + ra_med_count + ra_low_count
         accepted_in_period.append(
             [(tcalendar.timegm(new_date.timetuple()) * 1000), new_date,
-             ra_crit_count, ra_high_count, ra_med_count, ra_low_count, total])
+             *ra_counts, sum(ra_counts)])
 
-        total = active_crit_count + active_high_count + active_med_count + active_low_count
         active_in_period.append(
             [(tcalendar.timegm(new_date.timetuple()) * 1000), new_date,
-             active_crit_count, active_high_count, active_med_count, active_low_count, total])
+             *active_counts_in_period, sum(active_counts_in_period)])
 
     return {
         "opened_per_period": opened_in_period,
@@ -1566,11 +1721,56 @@ def get_setting(setting):
     return getattr(settings, setting)
 
 
+@lru_cache(maxsize=8)
+def get_grade_product_function(product_grade):
+    """
+    Returns the grade_product function defined by the product_grade setting, so it is
+    evaluated only once instead of every time a grade is calculated
+    """
+    aeval = Interpreter()
+    aeval(product_grade)
+    return aeval.symtable.get("grade_product")
+
+
+grade_product_lock = threading.Lock()
+
+
+def grade_product(product_grade, critical, high, medium, low):
+    grade_product_function = get_grade_product_function(product_grade)
+    if grade_product_function is None:
+        logger.warning("the product grade setting does not define a grade_product function")
+        return None
+    # the function runs in the interpreter it was defined in, which is not thread safe
+    with grade_product_lock:
+        return grade_product_function(critical, high, medium, low)
+
+
+def calculate_grade(product, *args, **kwargs):
+    """
+    Calculates the grade of the product. When the grade is calculated in the background, all
+    calculations requested for a product within PRODUCT_GRADE_DEBOUNCE_SECONDS are collapsed
+    into a single task, which runs once the window has passed.
+    """
+    if not product:
+        logger.warning("ignoring calculate product for product None!")
+        return None
+
+    debounce_seconds = settings.PRODUCT_GRADE_DEBOUNCE_SECONDS
+    if debounce_seconds > 0 and we_want_async(*args, func=calculate_grade_task, **kwargs):
+        product_id = product.id if isinstance(product, Product) else product
+        # the key expires when the pending task starts, so later changes get a task of their own
+        if not cache.add(f"calculate_grade_pending_{product_id}", value=True, timeout=debounce_seconds):
+            logger.debug("product grade calculation for product %s is already pending", product_id)
+            return None
+        kwargs["countdown"] = debounce_seconds
+    return calculate_grade_task(product, *args, **kwargs)
+
+
 @dojo_model_to_id
 @dojo_async_task
 @app.task
 @dojo_model_from_id(model=Product)
-def calculate_grade(product, *args, **kwargs):
+def calculate_grade_task(product, *args, **kwargs):
     system_settings = System_Settings.objects.get()
     if not product:
         logger.warning("ignoring calculate product for product None!")
@@ -1604,10 +1804,7 @@ def calculate_grade(product, *args, **kwargs):
                 medium = severity_count["numerical_severity__count"]
             elif severity_count["severity"] == "Low":
                 low = severity_count["numerical_severity__count"]
-        aeval = Interpreter()
-        aeval(system_settings.product_grade)
-        grade_product = f"grade_product({critical}, {high}, {medium}, {low})"
-        product.prod_numeric_grade = aeval(grade_product)
+        product.prod_numeric_grade = grade_product(system_settings.product_grade, critical, high, medium, low)
         super(Product, product).save()
 
 
@@ -1628,23 +1825,11 @@ class Product_Tab:
         self.product = product
         self.title = title
         self.tab = tab
-        self.engagement_count = Engagement.objects.filter(
-            product=self.product, active=True).count()
-        self.open_findings_count = Finding.objects.filter(test__engagement__product=self.product,
-                                                          false_p=False,
-                                                          duplicate=False,
-                                                          out_of_scope=False,
-                                                          active=True,
-                                                          mitigated__isnull=True).count()
-        active_endpoints = Endpoint.objects.filter(
-            product=self.product,
-            status_endpoint__mitigated=False,
-            status_endpoint__false_positive=False,
-            status_endpoint__out_of_scope=False,
-            status_endpoint__risk_accepted=False,
-        )
-        self.endpoints_count = active_endpoints.distinct().count()
-        self.endpoint_hosts_count = active_endpoints.values("host").distinct().count()
+        counters = get_product_counters(self.product)
+        self.engagement_count = counters.engagement_count
+        self.open_findings_count = counters.open_findings_count
+        self.endpoints_count = counters.endpoints_count
+        self.endpoint_hosts_count = counters.endpoint_hosts_count
         self.benchmark_type = Benchmark_Type.objects.filter(
             enabled=True).order_by("name")
         self.engagement = None
@@ -1689,14 +1874,9 @@ class Product_Tab:
 # Used to display the counts and enabled tabs in the product view
 def tab_view_count(product_id):
     product = Product.objects.get(id=product_id)
-    engagements = Engagement.objects.filter(
-        product=product, active=True).count()
-    open_findings = Finding.objects.filter(test__engagement__product=product,
-                                           false_p=False,
-                                           duplicate=False,
-                                           out_of_scope=False,
-                                           active=True,
-                                           mitigated__isnull=True).count()
+    counters = get_product_counters(product)
+    engagements = counters.engagement_count
+    open_findings = counters.open_findings_count
     endpoints = Endpoint.objects.filter(product=product).count()
     # benchmarks = Benchmark_Product_Summary.objects.filter(product=product, publish=True, benchmark_type__enabled=True).order_by('benchmark_type__name')
     benchmark_type = Benchmark_Type.objects.filter(
@@ -1858,39 +2038,90 @@ def sla_compute_and_notify(*args, **kwargs):
 
     Notifications are managed the usual way, so you'd have to opt-in.
     Exception is for JIRA issues, which would get a comment anyways.
+
+    The findings are processed per product, by one sla_compute_and_notify_product
+    task per product that has findings to notify about.
+    """
+    # exit early on flags
+    system_settings = System_Settings.objects.get()
+    if not system_settings.enable_notify_sla_active and not system_settings.enable_notify_sla_active_verified:
+        logger.info("Will not notify on SLA breach per user configured settings")
+        return
+
+    try:
+        if system_settings.enable_finding_sla:
+            logger.info("About to process findings for SLA notifications.")
+            logger.debug(f"Active {system_settings.enable_notify_sla_active}, Verified {system_settings.enable_notify_sla_active_verified}, Has JIRA {system_settings.enable_notify_sla_jira_only}, pre-breach {settings.SLA_NOTIFY_PRE_BREACH}, post-breach {settings.SLA_NOTIFY_POST_BREACH}")
+
+            product_ids = get_sla_notification_findings(system_settings) \
+                .order_by() \
+                .values_list("test__engagement__product_id", flat=True) \
+                .distinct()
+            product_count = 0
+            for product_id in product_ids:
+                product_count += 1
+                sla_compute_and_notify_product(product_id, **kwargs)
+            logger.info(f"SLA run dispatched for {product_count} products")
+
+    except System_Settings.DoesNotExist:
+        logger.info("Findings SLA is not enabled.")
+
+
+def get_sla_notification_findings(system_settings):
+    """
+    Returns the findings that may need an SLA notification today. Only the findings with an
+    enforced SLA that expires within the notification window, or that have no SLA expiration
+    date yet, are returned. The exact number of days left is checked per finding.
+    """
+    query = None
+    if system_settings.enable_notify_sla_active_verified:
+        query = Q(active=True, verified=True, is_mitigated=False, duplicate=False)
+    elif system_settings.enable_notify_sla_active:
+        query = Q(active=True, is_mitigated=False, duplicate=False)
+    logger.debug(f"My query: {query}")
+
+    # A finding with 'Info' severity will not be considered for SLA notifications (not in model)
+    enforced_query = Q()
+    for severity in ["Critical", "High", "Medium", "Low"]:
+        enforced_query |= Q(severity=severity, **{f"test__engagement__product__sla_configuration__enforce_{severity.lower()}": True})
+
+    # findings without an expiration date are treated as breaching today, and the days left of the
+    # (rare) findings that have a mitigated date are counted from that date
+    today = timezone.now().date()
+    window_query = Q(sla_expiration_date__isnull=True) | Q(mitigated__isnull=False) | Q(
+        sla_expiration_date__gte=today - timedelta(days=settings.SLA_NOTIFY_POST_BREACH),
+        sla_expiration_date__lte=today + timedelta(days=settings.SLA_NOTIFY_PRE_BREACH),
+    )
+
+    findings = Finding.objects \
+        .filter(query) \
+        .filter(enforced_query) \
+        .filter(window_query) \
+        .exclude(test__engagement__product__disable_sla_breach_notifications=True)
+
+    if system_settings.enable_notify_sla_jira_only:
+        logger.debug("Ignoring findings that are not linked to a JIRA issue")
+        findings = findings.filter(jira_issue__isnull=False)
+
+    return findings
+
+
+@dojo_async_task
+@app.task
+def sla_compute_and_notify_product(product_id, *args, **kwargs):
+    """
+    Computes the SLA of the findings of a single product, and sends the per finding
+    and the combined SLA notifications of the product
     """
     import dojo.jira_link.helper as jira_helper
 
     class NotificationEntry:
-        def __init__(self, finding=None, jira_issue=None, *, do_jira_sla_comment=False):
+        def __init__(self, finding=None, jira_issue=None, jira_instance=None, *, do_jira_sla_comment=False):
             self.finding = finding
             self.jira_issue = jira_issue
+            self.jira_instance = jira_instance
             self.do_jira_sla_comment = do_jira_sla_comment
 
-    def _add_notification(finding, kind):
-        # jira_issue, do_jira_sla_comment are taken from the context
-        # kind can be one of: breached, prebreach, breaching
-        if finding.test.engagement.product.disable_sla_breach_notifications:
-            return
-
-        notification = NotificationEntry(finding=finding,
-                                         jira_issue=jira_issue,
-                                         do_jira_sla_comment=do_jira_sla_comment)
-
-        pt = finding.test.engagement.product.prod_type.name
-        p = finding.test.engagement.product.name
-
-        if pt in combined_notifications:
-            if p in combined_notifications[pt]:
-                if kind in combined_notifications[pt][p]:
-                    combined_notifications[pt][p][kind].append(notification)
-                else:
-                    combined_notifications[pt][p][kind] = [notification]
-            else:
-                combined_notifications[pt][p] = {kind: [notification]}
-        else:
-            combined_notifications[pt] = {p: {kind: [notification]}}
-
     def _notification_title_for_finding(finding, kind, sla_age):
         title = f"Finding {finding.id} - "
         if kind == "breached":
@@ -1906,161 +2137,133 @@ def sla_compute_and_notify(*args, **kwargs):
 
         return title
 
+    def _get_jira_project(finding):
+        # the JIRA configuration is looked up once per engagement, which falls back to the product
+        engagement = finding.test.engagement
+        if engagement.id not in jira_projects:
+            jira_projects[engagement.id] = jira_helper.get_jira_project(engagement)
+        return jira_projects[engagement.id]
+
     def _create_notifications():
-        for prodtype, comb_notif_prodtype in combined_notifications.items():
-            for prod, comb_notif_prod in comb_notif_prodtype.items():
-                for kind, comb_notif_kind in comb_notif_prod.items():
-                    # creating notifications on per-finding basis
-
-                    # we need this list for combined notification feature as we
-                    # can not supply references to local objects as
-                    # create_notification() arguments
-                    findings_list = []
-
-                    for n in comb_notif_kind:
-                        title = _notification_title_for_finding(n.finding, kind, n.finding.sla_days_remaining())
-
-                        create_notification(
-                            event="sla_breach",
-                            title=title,
-                            finding=n.finding,
-                            url=reverse("view_finding", args=(n.finding.id,)),
-                        )
-
-                        if n.do_jira_sla_comment:
-                            logger.info("Creating JIRA comment to notify of SLA breach information.")
-                            jira_helper.add_simple_jira_comment(jira_instance, n.jira_issue, title)
-
-                        findings_list.append(n.finding)
-
-                    # producing a "combined" SLA breach notification
-                    title_combined = f"SLA alert ({kind}): product type '{prodtype}', product '{prod}'"
-                    product = comb_notif_kind[0].finding.test.engagement.product
-                    create_notification(
-                        event="sla_breach_combined",
-                        title=title_combined,
-                        product=product,
-                        findings=findings_list,
-                        breach_kind=kind,
-                        base_url=get_script_prefix(),
-                    )
+        for kind, comb_notif_kind in combined_notifications.items():
+            # creating notifications on per-finding basis
+
+            # we need this list for combined notification feature as we
+            # can not supply references to local objects as
+            # create_notification() arguments
+            findings_list = []
+
+            for n in comb_notif_kind:
+                title = _notification_title_for_finding(n.finding, kind, n.finding.sla_days_remaining())
+
+                create_notification(
+                    event="sla_breach",
+                    title=title,
+                    finding=n.finding,
+                    url=reverse("view_finding", args=(n.finding.id,)),
+                )
+
+                if n.do_jira_sla_comment:
+                    logger.info("Creating JIRA comment to notify of SLA breach information.")
+                    jira_helper.add_simple_jira_comment(n.jira_instance, n.jira_issue, title)
+
+                findings_list.append(n.finding)
+
+            # producing a "combined" SLA breach notification
+            title_combined = f"SLA alert ({kind}): product type '{product.prod_type.name}', product '{product.name}'"
+            create_notification(
+                event="sla_breach_combined",
+                title=title_combined,
+                product=product,
+                findings=findings_list,
+                breach_kind=kind,
+                base_url=get_script_prefix(),
+            )
 
-    # exit early on flags
     system_settings = System_Settings.objects.get()
-    if not system_settings.enable_notify_sla_active and not system_settings.enable_notify_sla_active_verified:
-        logger.info("Will not notify on SLA breach per user configured settings")
+    product = Product.objects.select_related("prod_type").filter(id=product_id).first()
+    if product is None:
         return
 
-    jira_issue = None
-    jira_instance = None
-    # notifications list per product per product type
+    # notifications list per kind: breached, prebreach, breaching
     combined_notifications = {}
-    try:
-        if system_settings.enable_finding_sla:
-            logger.info("About to process findings for SLA notifications.")
-            logger.debug(f"Active {system_settings.enable_notify_sla_active}, Verified {system_settings.enable_notify_sla_active_verified}, Has JIRA {system_settings.enable_notify_sla_jira_only}, pre-breach {settings.SLA_NOTIFY_PRE_BREACH}, post-breach {settings.SLA_NOTIFY_POST_BREACH}")
-
-            query = None
-            if system_settings.enable_notify_sla_active_verified:
-                query = Q(active=True, verified=True, is_mitigated=False, duplicate=False)
-            elif system_settings.enable_notify_sla_active:
-                query = Q(active=True, is_mitigated=False, duplicate=False)
-            logger.debug(f"My query: {query}")
-
-            no_jira_findings = {}
-            if system_settings.enable_notify_sla_jira_only:
-                logger.debug("Ignoring findings that are not linked to a JIRA issue")
-                no_jira_findings = Finding.objects.exclude(jira_issue__isnull=False)
-
-            total_count = 0
-            pre_breach_count = 0
-            post_breach_count = 0
-            post_breach_no_notify_count = 0
-            jira_count = 0
-            at_breach_count = 0
-
-            # Taking away for now, since the prefetch is not efficient
-            # .select_related('jira_issue') \
-            # .prefetch_related(Prefetch('test__engagement__product__jira_project_set__jira_instance')) \
-            # A finding with 'Info' severity will not be considered for SLA notifications (not in model)
-            findings = Finding.objects \
-                .filter(query) \
-                .exclude(severity="Info") \
-                .exclude(id__in=no_jira_findings)
-
-            for finding in findings:
-                total_count += 1
-                sla_age = finding.sla_days_remaining()
-
-                # get the sla enforcement for the severity and, if the severity setting is not enforced, do not notify
-                # resolves an issue where notifications are always sent for the severity of SLA that is not enforced
-                severity, enforce = finding.get_sla_period()
-                if not enforce:
-                    logger.debug(f"SLA is not enforced for Finding {finding.id} of {severity} severity, skipping notification.")
-                    continue
-
-                # if SLA is set to 0 in settings, it's a null. And setting at 0 means no SLA apparently.
-                if sla_age is None:
-                    sla_age = 0
+    jira_projects = {}
+
+    total_count = 0
+    pre_breach_count = 0
+    post_breach_count = 0
+    post_breach_no_notify_count = 0
+    jira_count = 0
+    at_breach_count = 0
+
+    findings = get_sla_notification_findings(system_settings) \
+        .filter(test__engagement__product=product) \
+        .select_related("test__engagement__product__sla_configuration")
+
+    for finding in findings:
+        total_count += 1
+        sla_age = finding.sla_days_remaining()
+
+        # if SLA is set to 0 in settings, it's a null. And setting at 0 means no SLA apparently.
+        if sla_age is None:
+            sla_age = 0
+
+        if (sla_age < 0) and (abs(sla_age) > settings.SLA_NOTIFY_POST_BREACH):
+            post_breach_no_notify_count += 1
+            # Skip finding notification if breached for too long
+            logger.debug(f"Finding {finding.id} breached the SLA {abs(sla_age)} days ago. Skipping notifications.")
+            continue
 
-                if (sla_age < 0) and (abs(sla_age) > settings.SLA_NOTIFY_POST_BREACH):
-                    post_breach_no_notify_count += 1
-                    # Skip finding notification if breached for too long
-                    logger.debug(f"Finding {finding.id} breached the SLA {abs(sla_age)} days ago. Skipping notifications.")
-                    continue
+        do_jira_sla_comment = False
+        jira_issue = None
+        jira_instance = None
+        if finding.has_jira_issue:
+            jira_issue = finding.jira_issue
+        elif finding.has_jira_group_issue:
+            jira_issue = finding.finding_group.jira_issue
+
+        if jira_issue:
+            jira_count += 1
+            jira_project = _get_jira_project(finding)
+            if jira_project is not None and jira_project.jira_instance is not None:
+                jira_instance = jira_project.jira_instance
+                logger.debug(f"JIRA config for finding is {jira_instance}")
+                # global config or product config set, product level takes precedence
+                product_jira_sla_comment_enabled = jira_project.product_jira_sla_notification
+                jiraconfig_sla_notification_enabled = jira_instance.global_jira_sla_notification
+
+                if jiraconfig_sla_notification_enabled or product_jira_sla_comment_enabled:
+                    logger.debug(f"Global setting {jiraconfig_sla_notification_enabled} -- Product setting {product_jira_sla_comment_enabled}")
+                    do_jira_sla_comment = True
+                    logger.debug(f"JIRA issue is {jira_issue.jira_key}")
 
-                do_jira_sla_comment = False
-                jira_issue = None
-                if finding.has_jira_issue:
-                    jira_issue = finding.jira_issue
-                elif finding.has_jira_group_issue:
-                    jira_issue = finding.finding_group.jira_issue
-
-                if jira_issue:
-                    jira_count += 1
-                    jira_instance = jira_helper.get_jira_instance(finding)
-                    if jira_instance is not None:
-                        logger.debug(f"JIRA config for finding is {jira_instance}")
-                        # global config or product config set, product level takes precedence
-                        try:
-                            # TODO: see new property from #2649 to then replace, somehow not working with prefetching though.
-                            product_jira_sla_comment_enabled = jira_helper.get_jira_project(finding).product_jira_sla_notification
-                        except Exception as e:
-                            logger.error("The product is not linked to a JIRA configuration! Something is weird here.")
-                            logger.error(f"Error is: {e}")
-
-                        jiraconfig_sla_notification_enabled = jira_instance.global_jira_sla_notification
-
-                        if jiraconfig_sla_notification_enabled or product_jira_sla_comment_enabled:
-                            logger.debug(f"Global setting {jiraconfig_sla_notification_enabled} -- Product setting {product_jira_sla_comment_enabled}")
-                            do_jira_sla_comment = True
-                            logger.debug(f"JIRA issue is {jira_issue.jira_key}")
-
-                logger.debug(f"Finding {finding.id} has {sla_age} days left to breach SLA.")
-                if (sla_age < 0):
-                    post_breach_count += 1
-                    logger.info(f"Finding {finding.id} has breached by {abs(sla_age)} days.")
-                    abs_sla_age = abs(sla_age)
-                    if not system_settings.enable_notify_sla_exponential_backoff or abs_sla_age == 1 or (abs_sla_age & (abs_sla_age - 1) == 0):
-                        _add_notification(finding, "breached")
-                    else:
-                        logger.info("Skipping notification as exponential backoff is enabled and the SLA is not a power of two")
-                # The finding is within the pre-breach period
-                elif (sla_age > 0) and (sla_age <= settings.SLA_NOTIFY_PRE_BREACH):
-                    pre_breach_count += 1
-                    logger.info(f"Security SLA pre-breach warning for finding ID {finding.id}. Days remaining: {sla_age}")
-                    _add_notification(finding, "prebreach")
-                # The finding breaches the SLA today
-                elif (sla_age == 0):
-                    at_breach_count += 1
-                    logger.info(f"Security SLA breach warning. Finding ID {finding.id} breaching today ({sla_age})")
-                    _add_notification(finding, "breaching")
-
-            _create_notifications()
-            logger.info(f"SLA run results: Pre-breach: {pre_breach_count}, at-breach: {at_breach_count}, post-breach: {post_breach_count}, post-breach-no-notify: {post_breach_no_notify_count}, with-jira: {jira_count}, TOTAL: {total_count}")
+        notification = NotificationEntry(finding=finding,
+                                         jira_issue=jira_issue,
+                                         jira_instance=jira_instance,
+                                         do_jira_sla_comment=do_jira_sla_comment)
 
-    except System_Settings.DoesNotExist:
-        logger.info("Findings SLA is not enabled.")
+        logger.debug(f"Finding {finding.id} has {sla_age} days left to breach SLA.")
+        if (sla_age < 0):
+            post_breach_count += 1
+            logger.info(f"Finding {finding.id} has breached by {abs(sla_age)} days.")
+            abs_sla_age = abs(sla_age)
+            if not system_settings.enable_notify_sla_exponential_backoff or abs_sla_age == 1 or (abs_sla_age & (abs_sla_age - 1) == 0):
+                combined_notifications.setdefault("breached", []).append(notification)
+            else:
+                logger.info("Skipping notification as exponential backoff is enabled and the SLA is not a power of two")
+        # The finding is within the pre-breach period
+        elif (sla_age > 0) and (sla_age <= settings.SLA_NOTIFY_PRE_BREACH):
+            pre_breach_count += 1
+            logger.info(f"Security SLA pre-breach warning for finding ID {finding.id}. Days remaining: {sla_age}")
+            combined_notifications.setdefault("prebreach", []).append(notification)
+        # The finding breaches the SLA today
+        elif (sla_age == 0):
+            at_breach_count += 1
+            logger.info(f"Security SLA breach warning. Finding ID {finding.id} breaching today ({sla_age})")
+            combined_notifications.setdefault("breaching", []).append(notification)
+
+    _create_notifications()
+    logger.info(f"SLA run results for product {product.id}: Pre-breach: {pre_breach_count}, at-breach: {at_breach_count}, post-breach: {post_breach_count}, post-breach-no-notify: {post_breach_no_notify_count}, with-jira: {jira_count}, TOTAL: {total_count}")
 
 
 def get_words_for_field(model, fieldname):
@@ -2242,6 +2445,72 @@ def mass_model_updater(model_type, models, function, fields, page_size=1000, ord
     logger.info("%s%s out of %s models processed ...", log_prefix, i, total_count)
 
 
+def bulk_create_update_log_entries(old_instances, new_instances, actor=None, batch_size=1000):
+    """
+    bulk_update() doesn't send any signals, so django-auditlog doesn't record the changes it makes.
+    This creates the UPDATE log entries that saving each instance would have created, in bulk.
+    old_instances are copies of new_instances taken before they were changed.
+    """
+    if not new_instances or auditlog_disabled.get():
+        return
+    model = type(new_instances[0])
+    if not auditlog.contains(model):
+        return
+    content_type = ContentType.objects.get_for_model(model)
+    cid = get_cid()
+    log_entries = []
+    for old_instance, new_instance in zip(old_instances, new_instances, strict=True):
+        changes = model_instance_diff(old_instance, new_instance)
+        if changes:
+            log_entries.append(LogEntry(
+                content_type=content_type,
+                object_pk=str(new_instance.pk),
+                object_id=new_instance.pk,
+                object_repr=str(new_instance),
+                action=LogEntry.Action.UPDATE,
+                changes=changes,
+                actor=actor,
+                actor_email=getattr(actor, "email", None),
+                cid=cid,
+            ))
+    LogEntry.objects.bulk_create(log_entries, batch_size=batch_size)
+
+
+def update_search_index_entries(queryset):
+    """
+    bulk_update() doesn't send the post_save signal, so the search index isn't updated either.
+    This updates the search index entries of the objects in the queryset in bulk. The related objects
+    that are stored in the index should be selected or prefetched by the caller.
+    """
+    engine = watson.default_search_engine
+    adapter = engine.get_adapter(queryset.model)
+    objects = {obj.pk: obj for obj in queryset}
+    search_entries = list(SearchEntry.objects.filter(
+        engine_slug=engine._engine_slug,
+        content_type=ContentType.objects.get_for_model(queryset.model),
+        object_id_int__in=objects,
+    ))
+    for search_entry in search_entries:
+        obj = objects.pop(search_entry.object_id_int)
+        search_entry.title = adapter.get_title(obj)
+        search_entry.description = adapter.get_description(obj)
+        search_entry.content = adapter.get_content(obj)
+        search_entry.url = adapter.get_url(obj)
+        search_entry.meta_encoded = adapter.serialize_meta(obj)
+    SearchEntry.objects.bulk_update(search_entries, ["title", "description", "content", "url", "meta_encoded"], batch_size=1000)
+    # objects that were never indexed get their entry the usual way
+    for obj in objects.values():
+        engine.update_obj_index(obj)
+
+
+def update_finding_search_index_entries(finding_ids):
+    update_search_index_entries(
+        Finding.objects.filter(id__in=finding_ids)
+        .select_related("test__engagement__product", "jira_issue")
+        .prefetch_related("notes__author"),
+    )
+
+
 def to_str_typed(obj):
     """For code that handles multiple types of objects, print not only __str__ but prefix the type of the object"""
     return f"{type(obj)}: {obj}"
@@ -2329,22 +2598,27 @@ class async_delete:
     @dojo_async_task
     @app.task
     def delete_chunk(self, objects, **kwargs):
-        for obj in objects:
-            try:
-                obj.delete()
-            except AssertionError:
-                logger.debug("ASYNC_DELETE: object has already been deleted elsewhere. Skipping")
-                # The id must be None
-                # The object has already been deleted elsewhere
-            except LogEntry.MultipleObjectsReturned:
-                # Delete the log entrys first, then delete
-                LogEntry.objects.filter(
-                    content_type=ContentType.objects.get_for_model(obj.__class__),
-                    object_pk=str(obj.pk),
-                    action=LogEntry.Action.DELETE,
-                ).delete()
-                # Now delete the object again
-                obj.delete()
+        # the counters of the products are marked as stale once per chunk, instead of once per deleted object
+        product_ids = {self.get_product_id(obj) for obj in objects} - {None}
+        with product_counters_deferred():
+            for obj in objects:
+                try:
+                    obj.delete()
+                except AssertionError:
+                    logger.debug("ASYNC_DELETE: object has already been deleted elsewhere. Skipping")
+                    # The id must be None
+                    # The object has already been deleted elsewhere
+                except LogEntry.MultipleObjectsReturned:
+                    # Delete the log entrys first, then delete
+                    LogEntry.objects.filter(
+                        content_type=ContentType.objects.get_for_model(obj.__class__),
+                        object_pk=str(obj.pk),
+                        action=LogEntry.Action.DELETE,
+                    ).delete()
+                    # Now delete the object again
+                    obj.delete()
+        if product_ids:
+            mark_product_counters_stale(product_id__in=product_ids)
 
     @dojo_async_task
     @app.task
@@ -2383,6 +2657,19 @@ class async_delete:
         logger.debug("ASYNC_DELETE: Split " + self.get_object_name(model) + " into " + str(len(chunk_list)) + " chunks of " + str(chunk_size))
         return chunk_list
 
+    def get_product_id(self, obj):
+        try:
+            if isinstance(obj, Finding):
+                return obj.test.engagement.product_id
+            if isinstance(obj, Test):
+                return obj.engagement.product_id
+            if isinstance(obj, Engagement | Endpoint):
+                return obj.product_id
+        except (Test.DoesNotExist, Engagement.DoesNotExist):
+            # the parent has already been deleted elsewhere, together with the object
+            pass
+        return None
+
     def get_object_name(self, obj):
         if obj.__class__.__name__ == "ModelBase":
             return obj.__name__
@@ -2470,60 +2757,22 @@ def calculate_finding_age(f):
 
 
 def get_open_findings_burndown(product):
-    findings = Finding.objects.filter(test__engagement__product=product, duplicate=False)
-    f_list = list(findings)
-
-    curr_date = datetime.combine(datetime.now(), datetime.min.time())
+    """
+    Returns the number of open findings per severity for each of the last 91 days, read from
+    the daily severity snapshots of the product. Missing days, or all days when the findings of the
+    product changed since they were computed, are computed and stored first.
+    """
+    curr_date = timezone.localdate()
     start_date = curr_date - timedelta(days=90)
 
-    critical_count = 0
-    high_count = 0
-    medium_count = 0
-    low_count = 0
-    info_count = 0
-
-    # count all findings older than 90 days that are still active OR will be mitigated/risk-accepted in the next 90 days
-    for f in list(findings.filter(date__lt=start_date)):
-        if f.active:
-            if f.severity == "Critical":
-                critical_count += 1
-            if f.severity == "High":
-                high_count += 1
-            if f.severity == "Medium":
-                medium_count += 1
-            if f.severity == "Low":
-                low_count += 1
-            if f.severity == "Info":
-                info_count += 1
-        elif f.is_mitigated:
-            f_mitigated_date = f.mitigated.timestamp()
-            if f_mitigated_date >= start_date.timestamp():
-                if f.severity == "Critical":
-                    critical_count += 1
-                if f.severity == "High":
-                    high_count += 1
-                if f.severity == "Medium":
-                    medium_count += 1
-                if f.severity == "Low":
-                    low_count += 1
-                if f.severity == "Info":
-                    info_count += 1
-        elif f.risk_accepted:
-            # simple risk acceptance does not have a risk acceptance object, so we fall back to creation date.
-            f_risk_accepted_date = f.created.timestamp()
-            if f.risk_acceptance:
-                f_risk_accepted_date = f.risk_acceptance.created.timestamp()
-            if f_risk_accepted_date >= start_date.timestamp():
-                if f.severity == "Critical":
-                    critical_count += 1
-                if f.severity == "High":
-                    high_count += 1
-                if f.severity == "Medium":
-                    medium_count += 1
-                if f.severity == "Low":
-                    low_count += 1
-                if f.severity == "Info":
-                    info_count += 1
+    snapshots = Finding_Daily_Severity_Snapshot.objects.filter(
+        product=product, date__gte=start_date, date__lte=curr_date,
+    ).order_by("date")
+    if (
+        Product_Counters.objects.filter(product=product, snapshots_stale=True).exists()
+        or snapshots.count() != 91 * len(SEVERITIES)
+    ):
+        update_product_finding_daily_severity_snapshots(product.id, sync=True)
 
     running_min, running_max = float("inf"), float("-inf")
     past_90_days = {
@@ -2534,69 +2783,11 @@ def get_open_findings_burndown(product):
         "Info": [],
     }
 
-    # count the number of open findings for the 90-day window
-    for i in range(90, -1, -1):
-        start = (curr_date - timedelta(days=i))
-
-        d_start = start.timestamp()
-        d_end = (start + timedelta(days=1)).timestamp()
-
-        for f in f_list:
-            # If a finding was opened on this day we add it to the counter of that day
-            f_open_date = datetime.combine(f.date, datetime.min.time()).timestamp()
-            if f_open_date >= d_start and f_open_date < d_end:
-                if f.severity == "Critical":
-                    critical_count += 1
-                if f.severity == "High":
-                    high_count += 1
-                if f.severity == "Medium":
-                    medium_count += 1
-                if f.severity == "Low":
-                    low_count += 1
-                if f.severity == "Info":
-                    info_count += 1
-
-            # If a finding was mitigated on this day we subtract it
-            if f.is_mitigated:
-                f_mitigated_date = f.mitigated.timestamp()
-                if f_mitigated_date >= d_start and f_mitigated_date < d_end:
-                    if f.severity == "Critical":
-                        critical_count -= 1
-                    if f.severity == "High":
-                        high_count -= 1
-                    if f.severity == "Medium":
-                        medium_count -= 1
-                    if f.severity == "Low":
-                        low_count -= 1
-                    if f.severity == "Info":
-                        info_count -= 1
-
-            # If a finding was risk accepted on this day we subtract it
-            elif f.risk_accepted:
-                f_risk_accepted_date = f.created.timestamp()
-                if f.risk_acceptance:
-                    f_risk_accepted_date = f.risk_acceptance.created.timestamp()
-                if f_risk_accepted_date >= d_start and f_risk_accepted_date < d_end:
-                    if f.severity == "Critical":
-                        critical_count -= 1
-                    if f.severity == "High":
-                        high_count -= 1
-                    if f.severity == "Medium":
-                        medium_count -= 1
-                    if f.severity == "Low":
-                        low_count -= 1
-                    if f.severity == "Info":
-                        info_count -= 1
-
-        f_day = [critical_count, high_count, medium_count, low_count, info_count]
-        running_min = min(running_min, *f_day)
-        running_max = max(running_max, *f_day)
-
-        past_90_days["Critical"].append([d_start * 1000, critical_count])
-        past_90_days["High"].append([d_start * 1000, high_count])
-        past_90_days["Medium"].append([d_start * 1000, medium_count])
-        past_90_days["Low"].append([d_start * 1000, low_count])
-        past_90_days["Info"].append([d_start * 1000, info_count])
+    for snapshot in snapshots.values("date", "severity", "active"):
+        d_start = datetime.combine(snapshot["date"], datetime.min.time()).timestamp()
+        past_90_days[snapshot["severity"]].append([d_start * 1000, snapshot["active"]])
+        running_min = min(running_min, snapshot["active"])
+        running_max = max(running_max, snapshot["active"])
 
     past_90_days["y_max"] = running_max
     past_90_days["y_min"] = running_min
@@ -1,5 +1,6 @@
 from unittest.mock import patch
 
+from crum import impersonate
 from django.contrib.auth.models import User
 from django.core.exceptions import PermissionDenied
 
@@ -7,6 +8,7 @@ import dojo.authorization.authorization
 from dojo.authorization.authorization import (
     PermissionDoesNotExistError,
     RoleDoesNotExistError,
+    get_authorized_product_ids,
     get_roles_for_permission,
     role_has_permission,
     user_has_configuration_permission,
@@ -20,6 +22,7 @@ from dojo.models import (
     Dojo_Group,
     Dojo_Group_Member,
     Dojo_User,
+    DojoMeta,
     Endpoint,
     Engagement,
     Finding,
@@ -35,6 +38,7 @@ from dojo.models import (
     Stub_Finding,
     Test,
 )
+from dojo.product.queries import get_authorized_dojo_meta
 from unittests.dojo_test_case import DojoTestCase
 
 
@@ -643,3 +647,53 @@ class TestAuthorization(DojoTestCase):
         mock.return_value = False
         self.assertFalse(user_has_configuration_permission(self.user, "test"))
         mock.assert_called_with("test")
+
+
+class TestAuthorizedProductIds(DojoTestCase):
+
+    def setUp(self):
+        self.user = Dojo_User.objects.create(username="authorized_product_ids")
+        self.product_type = Product_Type.objects.create(name="authorized_product_ids")
+        self.product_type_product = Product.objects.create(name="product type member", prod_type=self.product_type)
+        self.member_product = Product.objects.create(name="product member", prod_type=Product_Type.objects.create(name="other"))
+        self.group_product = Product.objects.create(name="product group", prod_type=self.member_product.prod_type)
+        Product.objects.create(name="unauthorized", prod_type=self.member_product.prod_type)
+        reader = Role.objects.get(name="Reader")
+        Product_Type_Member.objects.create(user=self.user, product_type=self.product_type, role=reader)
+        Product_Member.objects.create(user=self.user, product=self.member_product, role=reader)
+        group = Dojo_Group.objects.create(name="authorized_product_ids")
+        Dojo_Group_Member.objects.create(user=self.user, group=group, role=reader)
+        Product_Group.objects.create(group=group, product=self.group_product, role=reader)
+
+    def test_authorized_product_ids(self):
+        self.assertEqual(
+            {self.product_type_product.id, self.member_product.id, self.group_product.id},
+            set(get_authorized_product_ids(Permissions.Product_View, self.user)),
+        )
+        self.assertEqual([], list(get_authorized_product_ids(Permissions.Product_Delete, self.user)))
+
+    def test_authorized_product_ids_cached(self):
+        with self.settings(AUTHORIZED_PRODUCT_IDS_CACHE_TIMEOUT=60):
+            product_ids = get_authorized_product_ids(Permissions.Product_View, self.user)
+            self.assertEqual({self.product_type_product.id, self.member_product.id, self.group_product.id}, set(product_ids))
+            with self.assertNumQueries(0):
+                self.assertEqual(product_ids, get_authorized_product_ids(Permissions.Product_View, self.user))
+
+            # new products of the product type and membership changes invalidate the cache
+            new_product = Product.objects.create(name="new product", prod_type=self.product_type)
+            self.assertIn(new_product.id, get_authorized_product_ids(Permissions.Product_View, self.user))
+            Product_Member.objects.filter(user=self.user).delete()
+            self.assertNotIn(self.member_product.id, get_authorized_product_ids(Permissions.Product_View, self.user))
+            self.member_product.prod_type = self.product_type
+            self.member_product.save()
+            self.assertIn(self.member_product.id, get_authorized_product_ids(Permissions.Product_View, self.user))
+
+    def test_authorized_dojo_meta_ordered_by_id(self):
+        dojo_meta_ids = [
+            DojoMeta.objects.create(product=self.group_product, name="group product", value="1").id,
+            DojoMeta.objects.create(product=self.member_product, name="member product", value="1").id,
+            DojoMeta.objects.create(product=self.product_type_product, name="product type product", value="1").id,
+        ]
+        with impersonate(self.user):
+            self.assertTrue(get_authorized_dojo_meta(Permissions.Product_View).ordered)
+            self.assertEqual(dojo_meta_ids, list(get_authorized_dojo_meta(Permissions.Product_View).values_list("id", flat=True)))
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+
+from dojo.models import Endpoint_Status, Finding, Test, User
+
+
+class CursorPaginationTest(APITestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def setUp(self):
+        token = Token.objects.get(user=User.objects.get(username="admin"))
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+    def get_all_pages(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(200, response.status_code, response.content[:1000])
+            self.assertNotIn("count", response.data)
+            ids.extend(result["id"] for result in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_findings(self):
+        ids = self.get_all_pages(reverse("finding-list") + "?pagination=cursor&limit=3")
+        self.assertEqual(list(Finding.objects.order_by("id").values_list("id", flat=True)), ids)
+
+    def test_findings_without_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("finding-list") + "?pagination=cursor&limit=3")
+        self.assertFalse([query["sql"] for query in queries if "COUNT(" in query["sql"]])
+        # limit/offset pagination is still the default
+        response = self.client.get(reverse("finding-list") + "?limit=3")
+        self.assertEqual(Finding.objects.count(), response.data["count"])
+
+    def test_endpoints_engagements_and_endpoint_statuses(self):
+        for view_name in ["endpoint-list", "engagement-list", "endpoint_status-list"]:
+            with self.subTest(view_name=view_name):
+                ids = self.get_all_pages(reverse(view_name) + "?pagination=cursor&limit=2")
+                self.assertEqual(sorted(ids), ids)
+                self.assertEqual(len(set(ids)), len(ids))
+
+    def test_incremental_sync(self):
+        since = timezone.now()
+        test = Test.objects.order_by("id").last()
+        test.save()
+        ids = self.get_all_pages(reverse("test-list") + "?" + urlencode({"pagination": "cursor", "updated_after": since.isoformat()}))
+        self.assertEqual([test.id], ids)
+
+        finding = Finding.objects.order_by("id").first()
+        Finding.objects.filter(id=finding.id).update(last_status_update=since + timedelta(seconds=1))
+        ids = self.get_all_pages(reverse("finding-list") + "?" + urlencode({"pagination": "cursor", "last_status_update_after": since.isoformat()}))
+        self.assertEqual([finding.id], ids)
+
+        endpoint_status = Endpoint_Status.objects.order_by("id").first()
+        Endpoint_Status.objects.filter(id=endpoint_status.id).update(last_modified=since + timedelta(seconds=1))
+        ids = self.get_all_pages(reverse("endpoint_status-list") + "?" + urlencode({"pagination": "cursor", "last_modified_after": since.isoformat()}))
+        self.assertEqual([endpoint_status.id], ids)
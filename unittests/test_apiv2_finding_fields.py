@@ -0,0 +1,50 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+
+from dojo.models import Finding, User
+
+
+class FindingFieldsTest(APITestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def setUp(self):
+        token = Token.objects.get(user=User.objects.get(username="admin"))
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+    def test_list_selected_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("finding-list") + "?fields=id,title,severity,hash_code")
+        self.assertEqual(200, response.status_code, response.content[:1000])
+        self.assertEqual(Finding.objects.count(), response.data["count"])
+        for result in response.data["results"]:
+            self.assertEqual(["id", "title", "severity", "hash_code"], list(result))
+        finding = Finding.objects.get(id=response.data["results"][0]["id"])
+        self.assertEqual(finding.title, response.data["results"][0]["title"])
+        # only the columns of the requested fields are selected, and no relations are prefetched
+        finding_query = next(query["sql"] for query in queries if 'FROM "dojo_finding"' in query["sql"] and "COUNT(" not in query["sql"])
+        self.assertNotIn('"dojo_finding"."description"', finding_query)
+        self.assertFalse([query["sql"] for query in queries if "dojo_finding_endpoints" in query["sql"] or "dojo_notes" in query["sql"]])
+
+    def test_selected_relations_and_computed_fields(self):
+        finding = Finding.objects.get(id=2)
+        response = self.client.get(reverse("finding-detail", args=(finding.id,)) + "?fields=id,tags,endpoints,age,display_status")
+        self.assertEqual(200, response.status_code, response.content[:1000])
+        # like all responses of single findings, the response has the prefetched objects as well
+        self.assertEqual({"id", "tags", "endpoints", "age", "display_status", "prefetch"}, set(response.data))
+        self.assertEqual(finding.status(), response.data["display_status"])
+        self.assertEqual(finding.age, response.data["age"])
+        self.assertEqual(sorted(endpoint.id for endpoint in finding.endpoints.all()), sorted(response.data["endpoints"]))
+
+    def test_unknown_field(self):
+        response = self.client.get(reverse("finding-list") + "?fields=id,unknown")
+        self.assertEqual(400, response.status_code, response.content[:1000])
+
+    def test_all_fields_by_default(self):
+        response = self.client.get(reverse("finding-list") + "?limit=1")
+        self.assertEqual(200, response.status_code, response.content[:1000])
+        self.assertIn("display_status", response.data["results"][0])
+        self.assertIn("description", response.data["results"][0])
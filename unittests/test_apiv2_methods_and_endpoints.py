@@ -12,6 +12,7 @@ from dojo.models import (
     Choice,
     Contact,
     FileAccessToken,
+    Finding_Daily_Severity_Snapshot,
     GITHUB_Clone,
     GITHUB_Conf,
     GITHUB_Details_Cache,
@@ -19,6 +20,7 @@ from dojo.models import (
     GITHUB_PKey,
     Objects_Product,
     Objects_Review,
+    Product_Counters,
     Product_Line,
     Report_Type,
     Testing_Guide,
@@ -45,7 +47,7 @@ class ApiEndpointMethods(DojoTestCase):
     def test_is_defined(self):
         exempt_list = [
             "import-scan", "reimport-scan", "notes", "system_settings", "roles",
-            "import-languages", "endpoint_meta_import", "test_types",
+            "import-jobs", "import-languages", "endpoint_meta_import", "test_types",
             "configuration_permissions", "questionnaire_questions",
             "questionnaire_answers", "questionnaire_answered_questionnaires",
             "questionnaire_engagement_questionnaires", "questionnaire_general_questionnaires",
@@ -110,6 +112,9 @@ class ApiEndpoints(DojoTestCase):
             Benchmark_Product,
             Benchmark_Product_Summary,
             Choice,
+            # derived from other models and kept up to date by DefectDojo itself
+            Finding_Daily_Severity_Snapshot,
+            Product_Counters,
         ]
 
     def test_is_defined(self):
@@ -0,0 +1,60 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+
+from dojo.models import Dojo_User, Finding, Product, Product_Type
+
+from .dojo_test_case import DojoTestCase
+
+
+class TestBenchmarkImportCommand(DojoTestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def test_benchmark_import(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "benchmark.json"
+            call_command("benchmark_import", "--sizes", "20", "--endpoints-per-finding", "2", "--output", str(output), stdout=StringIO())
+            results = json.loads(output.read_text(encoding="utf-8"))
+
+        self.assertFalse(results["async"])
+        # trivy reports have no endpoints, so it is only run without them
+        self.assertEqual(
+            [
+                ("Generic Findings Import", 0),
+                ("Generic Findings Import", 2),
+                ("Trivy Scan", 0),
+                ("ZAP Scan", 0),
+                ("ZAP Scan", 2),
+            ],
+            [(run["scan_type"], run["endpoints_per_finding"]) for run in results["runs"]],
+        )
+        for run in results["runs"]:
+            with self.subTest(scan_type=run["scan_type"], endpoints_per_finding=run["endpoints_per_finding"]):
+                import_step, reimport_unchanged_step, reimport_changed_step = run["steps"]
+                self.assertEqual(20, import_step["new_findings"])
+                self.assertEqual(20, reimport_unchanged_step["untouched_findings"])
+                self.assertEqual(0, reimport_unchanged_step["new_findings"])
+                self.assertEqual(2, reimport_changed_step["new_findings"])
+                self.assertEqual(2, reimport_changed_step["closed_findings"])
+                for step in run["steps"]:
+                    self.assertGreater(step["queries"], 0)
+                    self.assertGreater(step["wall_time_seconds"], 0)
+                    self.assertGreater(step["peak_rss_mb"], 0)
+        # the created products, product type and user are removed
+        self.assertFalse(Product.objects.filter(name__startswith="Import benchmark").exists())
+        self.assertFalse(Finding.objects.filter(title__startswith="Benchmark").exists())
+        self.assertFalse(Product_Type.objects.filter(name="Import benchmark").exists())
+        self.assertFalse(Dojo_User.objects.filter(username="import_benchmark").exists())
+
+    def test_benchmark_import_keep_data(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "benchmark.json"
+            call_command("benchmark_import", "--sizes", "5", "--scan-types", "Trivy Scan", "--keep-data", "--output", str(output), stdout=StringIO())
+            # the user and product type are still used by the kept products, so later runs leave them
+            call_command("benchmark_import", "--sizes", "5", "--scan-types", "Trivy Scan", "--output", str(output), stdout=StringIO())
+
+        self.assertEqual(1, Product.objects.filter(prod_type__name="Import benchmark").count())
+        self.assertTrue(Dojo_User.objects.filter(username="import_benchmark").exists())
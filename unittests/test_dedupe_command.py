@@ -0,0 +1,84 @@
+import logging
+from io import StringIO
+
+from auditlog.context import disable_auditlog
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from dojo.models import Alerts, Dojo_User, Engagement, Finding, Product, Product_Type, Test, Test_Type
+
+from .dojo_test_case import DojoTestCase
+
+logger = logging.getLogger(__name__)
+
+
+class TestDedupeCommand(DojoTestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def setUp(self):
+        # start from up to date hash codes
+        call_command("dedupe", "--hash_code_only", stdout=StringIO())
+        self.finding = Finding.objects.get(id=2)
+        Finding.objects.filter(id=self.finding.id).update(hash_code="outdated")
+
+    def test_dry_run(self):
+        out = StringIO()
+        call_command("dedupe", "--dry_run", "--chunk_size", "3", stdout=out)
+
+        self.assertEqual(f"1 hash codes would change\n{self.finding.test.test_type.name}: 1\n", out.getvalue())
+        self.assertEqual("outdated", Finding.objects.get(id=self.finding.id).hash_code)
+
+    def test_hash_code_only(self):
+        call_command("dedupe", "--hash_code_only", "--chunk_size", "3", stdout=StringIO())
+
+        self.assertEqual(self.finding.hash_code, Finding.objects.get(id=self.finding.id).hash_code)
+
+    def test_resume_from_id(self):
+        call_command("dedupe", "--hash_code_only", "--resume_from_id", str(self.finding.id + 1), stdout=StringIO())
+        self.assertEqual("outdated", Finding.objects.get(id=self.finding.id).hash_code)
+
+        call_command("dedupe", "--hash_code_only", "--resume_from_id", str(self.finding.id), stdout=StringIO())
+        self.assertEqual(self.finding.hash_code, Finding.objects.get(id=self.finding.id).hash_code)
+
+
+class TestDedupeCommandWorkers(SimpleTestCase):
+
+    # the worker processes have their own database connections, so they only see committed findings.
+    # the test is not run in a transaction, and removes the findings it created itself
+    databases = {"default"}
+
+    def setUp(self):
+        # the audit log entries and the alerts of the notifications would be left behind as well
+        self.enterContext(disable_auditlog())
+        self.addCleanup(Alerts.objects.filter(title__contains="dedupe workers").delete)
+        reporter = Dojo_User.objects.create(username="dedupe workers")
+        self.addCleanup(reporter.delete)
+        test_type = Test_Type.objects.create(name="dedupe workers")
+        self.addCleanup(test_type.delete)
+        product_type = Product_Type.objects.create(name="dedupe workers")
+        self.addCleanup(product_type.delete)
+        product = Product.objects.create(name="dedupe workers", description="dedupe workers", prod_type=product_type)
+        engagement = Engagement.objects.create(name="dedupe workers", product=product, target_start=timezone.now(), target_end=timezone.now())
+        test = Test.objects.create(
+            engagement=engagement,
+            test_type=test_type,
+            target_start=timezone.now(),
+            target_end=timezone.now(),
+        )
+        self.findings = [
+            Finding.objects.create(test=test, reporter=reporter, title=f"finding {i}", severity="High", description=f"finding {i}")
+            for i in range(5)
+        ]
+        Finding.objects.filter(test=test).update(hash_code="outdated")
+
+    def test_workers(self):
+        out = StringIO()
+        call_command("dedupe", "--dry_run", "--workers", "2", "--chunk_size", "3", stdout=out)
+        self.assertIn("dedupe workers: 5", out.getvalue())
+        self.assertEqual(5, Finding.objects.filter(hash_code="outdated").count())
+
+        call_command("dedupe", "--hash_code_only", "--workers", "2", "--chunk_size", "3", stdout=StringIO())
+        for finding in self.findings:
+            self.assertEqual(finding.compute_hash_code(), Finding.objects.get(id=finding.id).hash_code)
+        self.assertFalse(Finding.objects.filter(hash_code="outdated").exists())
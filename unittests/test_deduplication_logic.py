@@ -1,6 +1,7 @@
 import logging
 import unittest
 
+from auditlog.models import LogEntry
 from crum import impersonate
 from django.conf import settings
 
@@ -10,11 +11,13 @@ from dojo.models import (
     Engagement,
     Finding,
     Product,
+    Product_Counters,
     System_Settings,
     Test,
     User,
     _copy_model_util,
 )
+from dojo.utils import are_endpoints_duplicates, dedupe_batch
 
 from .dojo_test_case import DojoTestCase
 
@@ -614,6 +617,29 @@ class TestDuplicationLogic(DojoTestCase):
         # reset for further tests
         settings.DEDUPE_ALGO_ENDPOINT_FIELDS = dedupe_algo_endpoint_fields
 
+    def test_are_endpoints_duplicates_endpoint_keys_cache(self):
+        dedupe_algo_endpoint_fields = settings.DEDUPE_ALGO_ENDPOINT_FIELDS
+        settings.DEDUPE_ALGO_ENDPOINT_FIELDS = ["host", "port"]
+
+        finding_new, finding_2 = self.copy_and_reset_finding(find_id=2)  # finding_2 has host ftp://localhost
+        finding_new.save(dedupe_option=False)
+        ep = Endpoint(product=finding_new.test.engagement.product, finding=finding_new, host="localhost", protocol="ftp", path="local")
+        ep.save()
+        finding_new.endpoints.add(ep)
+
+        endpoint_keys_cache = {}
+        self.assertTrue(are_endpoints_duplicates(finding_new, finding_2, endpoint_keys_cache))
+        self.assertEqual({finding_new.id, finding_2.id}, set(endpoint_keys_cache))
+        # the endpoints are only loaded once per dedupe run
+        with self.assertNumQueries(0):
+            self.assertTrue(are_endpoints_duplicates(finding_new, finding_2, endpoint_keys_cache))
+
+        settings.DEDUPE_ALGO_ENDPOINT_FIELDS = ["path"]
+        self.assertFalse(are_endpoints_duplicates(finding_new, finding_2))
+
+        # reset for further tests
+        settings.DEDUPE_ALGO_ENDPOINT_FIELDS = dedupe_algo_endpoint_fields
+
     def test_identical_hash_code_with_intersect_endpoints(self):
         dedupe_algo_endpoint_fields = settings.DEDUPE_ALGO_ENDPOINT_FIELDS
         settings.DEDUPE_ALGO_ENDPOINT_FIELDS = ["host", "port"]
@@ -1135,6 +1161,57 @@ class TestDuplicationLogic(DojoTestCase):
 
     # # utility methods
 
+    def test_dedupe_batch_hash_code(self):
+        # two copies of 2 are deduplicated at once, both are marked as duplicate of 2
+        finding_new1, finding_2 = self.copy_with_endpoints_without_dedupe_and_reset_finding(find_id=2)
+        finding_new2, _ = self.copy_with_endpoints_without_dedupe_and_reset_finding(find_id=2)
+        # two copies of 2 with another title are deduplicated at once, the second is marked as duplicate of the first
+        finding_new3, _ = self.copy_with_endpoints_without_dedupe_and_reset_finding(find_id=2)
+        finding_new4, _ = self.copy_with_endpoints_without_dedupe_and_reset_finding(find_id=2)
+        for finding in [finding_new1, finding_new2, finding_new3, finding_new4]:
+            if finding in {finding_new3, finding_new4}:
+                finding.title = "new title for batch"
+            finding.set_hash_code(True)
+            finding.save(dedupe_option=False)
+
+        # the number of queries does not depend on the number of findings
+        with self.assertNumQueries(16):
+            dedupe_batch(finding_2.test.id, finding_ids=[finding_new1.id, finding_new2.id, finding_new3.id, finding_new4.id])
+
+        for finding in [finding_new1, finding_new2, finding_new3, finding_new4]:
+            finding.refresh_from_db()
+        self.assert_finding(finding_new1, not_pk=2, duplicate=True, duplicate_finding_id=finding_2.id, hash_code=finding_2.hash_code)
+        self.assert_finding(finding_new2, not_pk=2, duplicate=True, duplicate_finding_id=finding_2.id, hash_code=finding_2.hash_code)
+        self.assert_finding(finding_new3, duplicate=False, not_hash_code=finding_2.hash_code)
+        self.assert_finding(finding_new4, duplicate=True, duplicate_finding_id=finding_new3.id, hash_code=finding_new3.hash_code)
+        # like saving the duplicates, the changes are recorded in the auditlog
+        for finding in [finding_new1, finding_new2, finding_new4]:
+            log_entry = LogEntry.objects.get_for_object(finding).filter(action=LogEntry.Action.UPDATE).latest("id")
+            self.assertEqual(["False", "True"], log_entry.changes_dict["duplicate"])
+        self.assertFalse([log_entry for log_entry in LogEntry.objects.get_for_object(finding_new3).filter(action=LogEntry.Action.UPDATE) if "duplicate" in log_entry.changes_dict])
+
+    def test_dedupe_batch_marks_product_counters_stale(self):
+        finding_new, finding_2 = self.copy_with_endpoints_without_dedupe_and_reset_finding(find_id=2)
+        finding_new.set_hash_code(True)
+        finding_new.save(dedupe_option=False)
+        product = finding_2.test.engagement.product
+        Product_Counters.objects.update_or_create(product=product, defaults={"stale": False})
+
+        dedupe_batch(finding_2.test.id, finding_ids=[finding_new.id])
+
+        self.assertTrue(Product_Counters.objects.get(product=product).stale)
+
+    def test_dedupe_batch_disabled(self):
+        self.enable_dedupe(enable=False)
+        finding_new, finding_2 = self.copy_with_endpoints_without_dedupe_and_reset_finding(find_id=2)
+        finding_new.set_hash_code(True)
+        finding_new.save(dedupe_option=False)
+
+        dedupe_batch(finding_2.test.id, finding_ids=[finding_new.id])
+
+        finding_new.refresh_from_db()
+        self.assert_finding(finding_new, not_pk=2, duplicate=False, hash_code=finding_2.hash_code)
+
     def log_product(self, product):
         if isinstance(product, int):
             product = Product.objects.get(pk=product)
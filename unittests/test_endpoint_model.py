@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from dojo.endpoint.utils import endpoint_get_or_create, remove_broken_endpoint_statuses
+from dojo.importers.endpoint_manager import EndpointManager
 from dojo.models import Endpoint, Endpoint_Status, Engagement, Finding, Product, Product_Type, Test
 
 from .dojo_test_case import DojoTestCase
@@ -156,6 +157,35 @@ class TestEndpointModel(DojoTestCase):
         )
         self.assertTrue(created7)
 
+    def test_get_or_create_endpoints(self):
+        product_type = Product_Type.objects.create(name="get_or_create_endpoints")
+        product = Product.objects.create(name="get_or_create_endpoints", prod_type=product_type)
+        existing = Endpoint.objects.create(protocol="http", host="bar.foo", product=product)
+        existing_with_port = Endpoint.objects.create(protocol="http", host="BAR.foo", port=8080, product=product)
+        Endpoint.objects.create(protocol="http", host="bar.foo")
+
+        endpoint_manager = EndpointManager()
+        endpoints = [
+            Endpoint(protocol="HTTP", host="bar.foo", port=80),
+            Endpoint(protocol="http", host="Bar.Foo", port=8080),
+            Endpoint(protocol="https", host="bar.foo"),
+            Endpoint(protocol="https", host="bar.foo", port=443),
+            Endpoint(protocol="https", host="bar.foo", port=8443),
+        ]
+        saved_endpoints = endpoint_manager.get_or_create_endpoints(endpoints, product)
+
+        self.assertEqual(existing, saved_endpoints[0])
+        self.assertEqual(existing_with_port, saved_endpoints[1])
+        self.assertEqual(saved_endpoints[2].id, saved_endpoints[3].id)
+        self.assertEqual(5, Endpoint.objects.count())
+        # the same endpoints as with endpoint_get_or_create
+        for endpoint, saved_endpoint in zip(endpoints, saved_endpoints, strict=True):
+            self.assertEqual(saved_endpoint.id, endpoint_get_or_create(
+                protocol=endpoint.protocol, host=endpoint.host, port=endpoint.port, product=product,
+            )[0].id)
+        with self.assertNumQueries(0):
+            self.assertEqual(saved_endpoints, endpoint_manager.get_or_create_endpoints(endpoints, product))
+
     def test_equality_without_products(self):
         # Test with all the fields
         e1 = Endpoint(protocol="https", host="localhost", port=5439, path="test", query="param=value")
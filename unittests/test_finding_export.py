@@ -0,0 +1,91 @@
+import csv
+import io
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from dojo.models import Finding
+
+from .dojo_test_case import DojoTestCase
+
+User = get_user_model()
+
+
+class TestFindingExport(DojoTestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def setUp(self):
+        self.user = User.objects.get(username="admin")
+        # run the background exports in the test process, which has access to the test database
+        self.user.usercontactinfo.block_execution = True
+        self.user.usercontactinfo.save()
+        self.client.force_login(self.user)
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+    def export(self, name, url="/finding?o=id"):
+        return self.client.get(reverse(name), QUERY_STRING=f"url={url}")
+
+    def test_csv_export(self):
+        response = self.export("csv_export")
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        header = rows[0]
+        self.assertEqual(Finding.objects.count(), len(rows) - 1)
+        self.assertEqual(["test", "found_by", "engagement_id", "engagement", "product_id", "product", "endpoints", "vulnerability_ids", "tags"], header[-9:])
+        self.assertNotIn("jira_issue", header)
+        # the findings are ordered by severity only, so the row of a finding is looked up by its id
+        finding = Finding.objects.order_by("id").first()
+        row = next(dict(zip(header, row, strict=True)) for row in rows[1:] if row[header.index("id")] == str(finding.id))
+        self.assertEqual(finding.title, row["title"])
+        self.assertEqual(finding.test.test_type.name, row["found_by"])
+        self.assertEqual(finding.test.engagement.product.name, row["product"])
+
+    def test_csv_export_queries(self):
+        # the number of queries does not depend on the number of findings
+        with self.assertNumQueries(13):
+            b"".join(self.export("csv_export").streaming_content)
+
+    def test_excel_export(self):
+        response = self.export("excel_export")
+        worksheet = load_workbook(io.BytesIO(b"".join(response.streaming_content))).active
+        rows = [[cell.value for cell in row] for row in worksheet.iter_rows()]
+        header = rows[0]
+        self.assertEqual(Finding.objects.count(), len(rows) - 1)
+        self.assertEqual(["found_by", "engagement_id", "engagement", "product_id", "product", "endpoints", "vulnerability_ids", "tags"], header[-8:])
+        self.assertTrue(all(cell.font.b for cell in worksheet[1]))
+        finding = Finding.objects.order_by("id").first()
+        row = next(dict(zip(header, row, strict=True)) for row in rows[1:] if row[header.index("id")] == finding.id)
+        self.assertEqual(finding.title, row["title"])
+
+    @patch("dojo.tasks.create_notification")
+    def test_export_in_background(self, mock_create_notification):
+        with override_settings(FINDING_EXPORT_BACKGROUND_THRESHOLD=1, MEDIA_ROOT=self.media_root):
+            response = self.export("csv_export")
+            self.assertRedirects(response, "/finding?o=id", fetch_redirect_response=False)
+            self.assertEqual(["admin"], mock_create_notification.call_args.kwargs["recipients"])
+            download = self.client.get(mock_create_notification.call_args.kwargs["url"])
+            rows = list(csv.reader(io.StringIO(b"".join(download.streaming_content).decode())))
+        self.assertEqual(Finding.objects.count(), len(rows) - 1)
+        self.assertEqual('attachment; filename="findings.csv"', download["Content-Disposition"])
+
+    @patch("dojo.tasks.create_notification")
+    def test_export_in_background_redirects_to_this_site_only(self, mock_create_notification):
+        with override_settings(FINDING_EXPORT_BACKGROUND_THRESHOLD=1, MEDIA_ROOT=self.media_root):
+            for name in ["csv_export", "excel_export"]:
+                with self.subTest(name=name):
+                    response = self.export(name, url="//evil.example/finding/open")
+                    self.assertRedirects(response, reverse("all_findings"), fetch_redirect_response=False)
+
+    @patch("dojo.tasks.create_notification")
+    def test_export_download_of_other_user(self, mock_create_notification):
+        with override_settings(FINDING_EXPORT_BACKGROUND_THRESHOLD=1, MEDIA_ROOT=self.media_root):
+            self.export("excel_export")
+            url = mock_create_notification.call_args.kwargs["url"]
+            self.assertEqual(200, self.client.get(url).status_code)
+            self.client.force_login(User.objects.get(username="user2"))
+            self.assertEqual(404, self.client.get(url).status_code)
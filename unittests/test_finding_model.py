@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
 
 from crum import impersonate
+from django.test import override_settings
 
-from dojo.models import DojoMeta, Engagement, Finding, Test, User
+from dojo.models import DojoMeta, Engagement, Finding, Test, User, compute_hash_codes, get_hash_code_plan
 
 from .dojo_test_case import DojoTestCase
 
@@ -534,3 +535,32 @@ class TestFindingSLAExpiration(DojoTestCase):
         self.assertEqual(finding.sla_expiration_date, None)
         self.assertEqual(finding.sla_days_remaining(), None)
         self.assertEqual(finding.sla_deadline(), None)
+
+
+class TestFindingHashCode(DojoTestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def test_hash_code_plan(self):
+        test = Test.objects.get(id=3)
+        finding = Finding(test=test, title="Title", severity="High", description="Description", cwe=79)
+        with override_settings(HASHCODE_FIELDS_PER_SCANNER={test.test_type.name: ["title", "severity"]}):
+            plan = get_hash_code_plan(test)
+            self.assertEqual(("title", "severity"), plan.fields)
+            self.assertIs(plan, get_hash_code_plan(test))
+            self.assertEqual(finding.hash_fields("TitleHigh"), finding.compute_hash_code())
+        # the plan is compiled again when the settings change
+        with override_settings(HASHCODE_FIELDS_PER_SCANNER={test.test_type.name: ["title", "not_allowed"]}):
+            self.assertIsNone(get_hash_code_plan(test))
+            self.assertEqual(finding.compute_hash_code_legacy(), finding.compute_hash_code())
+
+    def test_compute_hash_codes(self):
+        test_types = Finding.objects.values_list("test__test_type__name", flat=True).distinct()
+        with override_settings(HASHCODE_FIELDS_PER_SCANNER={test_type: ["title", "endpoints", "vulnerability_ids"] for test_type in test_types}):
+            expected = [finding.compute_hash_code() for finding in Finding.objects.order_by("id")]
+            findings = list(Finding.objects.select_related("test__test_type").order_by("id"))
+            # endpoints and vulnerability ids are prefetched for all findings
+            with self.assertNumQueries(2):
+                self.assertEqual(expected, compute_hash_codes(findings))
+            unsaved_finding = Finding(test=findings[0].test, title="Title", cwe=79)
+            unsaved_finding.unsaved_vulnerability_ids = ["CVE-2", "CVE-1"]
+            self.assertEqual([unsaved_finding.hash_fields("titleCVE-1CVE-2")], compute_hash_codes([unsaved_finding]))
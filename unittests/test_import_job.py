@@ -0,0 +1,98 @@
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from dojo.celery import app
+from dojo.models import Test, Test_Import, User
+
+from .dojo_test_case import DojoAPITestCase, get_unit_tests_scans_path
+
+
+class TestImportJobAPI(DojoAPITestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def setUp(self):
+        self.user = User.objects.get(username="admin")
+        # process the import jobs in the test process, which has access to the test database
+        self.user.usercontactinfo.block_execution = True
+        self.user.usercontactinfo.save()
+        token = Token.objects.get(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_root_override = override_settings(MEDIA_ROOT=media_root)
+        media_root_override.enable()
+        self.addCleanup(media_root_override.disable)
+
+    def upload(self, view_name, filename, **params):
+        with (get_unit_tests_scans_path("zap") / filename).open(encoding="utf-8") as testfile:
+            payload = {
+                "scan_type": "ZAP Scan",
+                "minimum_severity": "Low",
+                "file": testfile,
+                "async_import": True,
+                **params,
+            }
+            response = self.client.post(reverse(view_name), payload)
+        self.assertEqual(202, response.status_code, response.content[:1000])
+        return response.json()["import_job_id"]
+
+    def get_import_job(self, import_job_id):
+        response = self.client.get(reverse("importjob-detail", args=(import_job_id,)))
+        self.assertEqual(200, response.status_code, response.content[:1000])
+        return response.json()
+
+    def test_async_import_and_reimport(self):
+        import_job = self.get_import_job(self.upload("importscan-list", "0_zap_sample.xml", engagement=1))
+        self.assertEqual("Completed", import_job["status"])
+        self.assertEqual("import", import_job["type"])
+        self.assertEqual({"parsed": 4, "created": 4, "closed": 0, "reactivated": 0, "untouched": 0}, import_job["progress"])
+        test = Test.objects.get(id=import_job["test"])
+        self.assertEqual(4, test.finding_set.count())
+        # the uploaded report is removed once it has been imported
+        self.assertFalse(Test_Import.objects.get(id=import_job["id"]).scan_file)
+
+        reimport_job = self.get_import_job(self.upload("reimportscan-list", "1_zap_sample_0_and_new_absent.xml", test=test.id))
+        self.assertEqual("Completed", reimport_job["status"])
+        self.assertEqual("reimport", reimport_job["type"])
+        self.assertEqual({"parsed": 4, "matched": 3, "created": 1, "closed": 1, "reactivated": 0, "untouched": 3}, reimport_job["progress"])
+        self.assertEqual(test.id, reimport_job["test"])
+        self.assertEqual(5, test.finding_set.count())
+
+    def test_async_import_failed(self):
+        test_count = Test.objects.count()
+        with patch("dojo.importers.default_importer.DefaultImporter.process_findings", side_effect=ValueError("broken report")):
+            import_job = self.get_import_job(self.upload("importscan-list", "0_zap_sample.xml", engagement=1))
+        self.assertEqual("Failed", import_job["status"])
+        self.assertEqual("broken report", import_job["error"])
+        # the test created for the findings is removed again
+        self.assertIsNone(import_job["test"])
+        self.assertEqual(test_count, Test.objects.count())
+
+    def test_async_import_failed_after_findings_were_imported(self):
+        with patch("dojo.importers.default_importer.DefaultImporter.close_old_findings", side_effect=ValueError("closing failed")):
+            import_job = self.get_import_job(self.upload("importscan-list", "0_zap_sample.xml", engagement=1))
+        self.assertEqual("Failed", import_job["status"])
+        self.assertEqual("closing failed", import_job["error"])
+        # the job points to the test holding the findings that were imported
+        self.assertEqual(4, Test.objects.get(id=import_job["test"]).finding_set.count())
+
+    def test_async_import_pending(self):
+        self.user.usercontactinfo.block_execution = False
+        self.user.usercontactinfo.save()
+        with patch.object(app.tasks["dojo.tasks.process_import_job"], "apply_async") as mock_apply_async:
+            import_job = self.get_import_job(self.upload("importscan-list", "0_zap_sample.xml", engagement=1))
+        import_job_id, options = mock_apply_async.call_args.kwargs["args"]
+        self.assertEqual(import_job["id"], import_job_id)
+        self.assertEqual(1, options["engagement"].id)
+        self.assertNotIn("file", options)
+        self.assertEqual("Pending", import_job["status"])
+        self.assertEqual(1, import_job["engagement"])
+        self.assertIsNone(import_job["test"])
+        self.assertTrue(Test_Import.objects.get(id=import_job["id"]).scan_file.name.startswith("import_jobs/0_zap_sample_"))
@@ -1,15 +1,31 @@
 import logging
 import uuid
-from unittest.mock import patch
+from itertools import islice
+from unittest.mock import Mock, patch
 
+from auditlog.models import LogEntry
+from django.core.exceptions import ValidationError
+from django.test import override_settings
 from django.utils import timezone
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
 from dojo.importers.default_importer import DefaultImporter
-from dojo.models import Development_Environment, Engagement, Finding, Product, Product_Type, Test, User
+from dojo.importers.default_reimporter import DefaultReImporter
+from dojo.models import (
+    Development_Environment,
+    Endpoint,
+    Endpoint_Status,
+    Engagement,
+    Finding,
+    Product,
+    Product_Type,
+    Test,
+    User,
+)
 from dojo.tools.gitlab_sast.parser import GitlabSastParser
 from dojo.tools.sarif.parser import SarifParser
+from dojo.tools.zap.parser import ZapParser
 from dojo.utils import get_object_or_none
 
 from .dojo_test_case import DojoAPITestCase, DojoTestCase, get_unit_tests_path, get_unit_tests_scans_path
@@ -148,6 +164,193 @@ class TestDojoDefaultImporter(DojoTestCase):
             self.assertEqual(1, len_new_findings)
             self.assertEqual(0, len_closed_findings)
 
+    def import_zap_sample(self, engagement_name):
+        with (get_unit_tests_scans_path("zap") / "0_zap_sample.xml").open(encoding="utf-8") as scan:
+            user, _ = User.objects.get_or_create(username="admin")
+            product_type, _ = Product_Type.objects.get_or_create(name="test3")
+            product, _ = Product.objects.get_or_create(
+                name="TestDojoDefaultImporter3",
+                prod_type=product_type,
+            )
+            engagement, _ = Engagement.objects.get_or_create(
+                name=engagement_name,
+                product=product,
+                target_start=timezone.now(),
+                target_end=timezone.now(),
+            )
+            environment, _ = Development_Environment.objects.get_or_create(name="Development")
+            import_options = {
+                "user": user,
+                "lead": user,
+                "scan_date": None,
+                "environment": environment,
+                "minimum_severity": "Info",
+                "active": True,
+                "verified": True,
+                "scan_type": "ZAP Scan",
+                "engagement": engagement,
+                "close_old_findings": False,
+                "tags": ["bulk"],
+            }
+            importer = DefaultImporter(**import_options)
+            test, _, len_new_findings, _, _, _, _ = importer.process_scan(scan)
+            return test, len_new_findings
+
+    def get_imported_findings(self, test):
+        return [
+            (
+                finding.title,
+                finding.severity,
+                finding.numerical_severity,
+                finding.hash_code,
+                finding.active,
+                finding.verified,
+                finding.sla_expiration_date,
+                sorted(str(endpoint) for endpoint in finding.endpoints.all()),
+                finding.burprawrequestresponse_set.count(),
+                list(finding.found_by.values_list("name", flat=True)),
+            )
+            for finding in Finding.objects.filter(test=test).order_by("title", "id")
+        ]
+
+    def test_import_scan_bulk_create(self):
+        test, len_new_findings = self.import_zap_sample("Test Create Engagement3")
+        with override_settings(IMPORT_BULK_CREATE=True, IMPORT_BULK_CREATE_BATCH_SIZE=2):
+            bulk_test, bulk_len_new_findings = self.import_zap_sample("Test Create Engagement4")
+        self.assertEqual(len_new_findings, bulk_len_new_findings)
+        self.assertEqual(self.get_imported_findings(test), self.get_imported_findings(bulk_test))
+
+    def test_import_scan_parser_returning_iterator(self):
+        # the zap parser yields its findings, so they are imported in chunks as the report is read
+        test, len_new_findings = self.import_zap_sample("Test Create Engagement3")
+        with override_settings(IMPORT_CHUNK_SIZE=2):
+            chunked_test, chunked_len_new_findings = self.import_zap_sample("Test Create Engagement4")
+        self.assertEqual(len_new_findings, chunked_len_new_findings)
+        self.assertEqual(self.get_imported_findings(test), self.get_imported_findings(chunked_test))
+
+    def test_import_scan_parser_failing_after_first_chunk(self):
+        get_findings = ZapParser.get_findings
+
+        def failing_get_findings(parser, file, test):
+            yield from islice(get_findings(parser, file, test), 3)
+            msg = "broken report"
+            raise ValueError(msg)
+
+        findings_count = Finding.objects.count()
+        with (
+            patch.object(ZapParser, "get_findings", failing_get_findings),
+            override_settings(IMPORT_CHUNK_SIZE=2),
+            self.assertRaises(ValidationError),
+        ):
+            self.import_zap_sample("Test Create Engagement5")
+        # the test and the findings of the first chunk are removed again
+        self.assertFalse(Test.objects.filter(engagement__name="Test Create Engagement5").exists())
+        self.assertEqual(findings_count, Finding.objects.count())
+
+
+class TestDojoDefaultReImporter(DojoTestCase):
+    def setUp(self):
+        self.user, _ = User.objects.get_or_create(username="admin")
+        product_type, _ = Product_Type.objects.get_or_create(name="test reimport matching")
+        product, _ = Product.objects.get_or_create(name="TestDojoDefaultReImporter", prod_type=product_type)
+        engagement = self.create_engagement("Test ReImport Matching", product=product)
+        self.test = self.create_test(engagement=engagement, scan_type=NPM_AUDIT_SCAN_TYPE)
+        self.reimporter = DefaultReImporter(
+            test=self.test,
+            user=self.user,
+            lead=self.user,
+            scan_date=None,
+            minimum_severity="Info",
+            active=True,
+            verified=True,
+            sync=True,
+            scan_type=NPM_AUDIT_SCAN_TYPE,
+        )
+
+    def create_finding(self, **kwargs):
+        finding = Finding(test=self.test, reporter=self.user, **kwargs)
+        finding.save(dedupe_option=False)
+        return finding
+
+    def test_match_new_finding_to_existing_finding_without_queries(self):
+        first = self.create_finding(title="Match Me", severity="High", hash_code="abc", unique_id_from_tool="1")
+        second = self.create_finding(title="Match Me", severity="High", hash_code="def", unique_id_from_tool="2")
+        self.reimporter.build_candidate_index(list(self.test.finding_set.all()))
+        with self.assertNumQueries(0):
+            self.reimporter.deduplication_algorithm = "hash_code"
+            self.assertEqual([first], self.reimporter.match_new_finding_to_existing_finding(Finding(hash_code="abc")))
+            self.assertEqual([], self.reimporter.match_new_finding_to_existing_finding(Finding(hash_code=None)))
+            self.reimporter.deduplication_algorithm = "unique_id_from_tool"
+            self.assertEqual([second], self.reimporter.match_new_finding_to_existing_finding(Finding(unique_id_from_tool=2)))
+            self.reimporter.deduplication_algorithm = "unique_id_from_tool_or_hash_code"
+            matches = self.reimporter.match_new_finding_to_existing_finding(Finding(hash_code="def", unique_id_from_tool="1"))
+            self.assertEqual([first, second], matches)
+            self.reimporter.deduplication_algorithm = "legacy"
+            # like the findings of a parser, the unsaved finding has no numerical severity yet
+            unsaved_finding = Finding(title="match me", severity="High")
+            self.assertEqual([first, second], self.reimporter.match_new_finding_to_existing_finding(unsaved_finding))
+            self.assertEqual([], self.reimporter.match_new_finding_to_existing_finding(Finding(title="match me", severity="Low")))
+
+    def test_match_new_finding_created_during_reimport(self):
+        self.reimporter.build_candidate_index(list(self.test.finding_set.all()))
+        self.reimporter.deduplication_algorithm = "hash_code"
+        self.assertEqual([], self.reimporter.match_new_finding_to_existing_finding(Finding(hash_code="abc")))
+        new_finding = self.create_finding(title="New", severity="Low", hash_code="abc")
+        self.reimporter.add_finding_to_candidate_index(new_finding)
+        self.assertEqual([new_finding], self.reimporter.match_new_finding_to_existing_finding(Finding(hash_code="abc")))
+
+    def test_close_old_findings_in_bulk(self):
+        product = self.test.engagement.product
+        open_finding = self.create_finding(title="Open", severity="High", active=True)
+        endpoint = Endpoint.objects.create(host="example.com", product=product)
+        Endpoint_Status.objects.create(finding=open_finding, endpoint=endpoint)
+        marked_finding = self.create_finding(title="Marked", severity="Low", active=True)
+        mitigated_finding = self.create_finding(title="Mitigated", severity="Low", active=False, is_mitigated=True)
+        # marked as false positive in the database while the reimport was running
+        Finding.objects.filter(id=marked_finding.id).update(false_p=True)
+
+        self.reimporter.close_old_findings_toggle = True
+        closed_findings = self.reimporter.close_old_findings([open_finding, marked_finding, mitigated_finding])
+
+        self.assertEqual([open_finding, marked_finding], closed_findings)
+        self.assertTrue(marked_finding.false_p)
+        for finding in Finding.objects.filter(id__in=[open_finding.id, marked_finding.id]):
+            self.assertFalse(finding.active)
+            self.assertTrue(finding.is_mitigated)
+            self.assertIsNotNone(finding.mitigated)
+            self.assertEqual(self.user, finding.mitigated_by)
+            self.assertEqual(["Mitigated by NPM Audit Scan re-upload."], [note.entry for note in finding.notes.all()])
+            self.assertTrue(LogEntry.objects.get_for_object(finding).filter(action=LogEntry.Action.UPDATE, actor=self.user).exists())
+        self.assertTrue(Finding.objects.get(id=marked_finding.id).false_p)
+        self.assertEqual(0, mitigated_finding.notes.count())
+        endpoint_status = Endpoint_Status.objects.get(finding=open_finding)
+        self.assertTrue(endpoint_status.mitigated)
+        self.assertEqual(self.user, endpoint_status.mitigated_by)
+
+    def test_chunk_findings(self):
+        def parsed_findings():
+            yield from (Finding(title=str(i)) for i in range(5))
+            msg = "broken report"
+            raise ValueError(msg)
+
+        chunks = self.reimporter.chunk_findings(parsed_findings(), 2)
+        self.assertEqual(["0", "1"], [finding.title for finding in next(chunks)])
+        self.assertEqual(["2", "3"], [finding.title for finding in next(chunks)])
+        with self.assertRaises(ValidationError):
+            next(chunks)
+        self.assertEqual([], list(self.reimporter.chunk_findings(None)))
+
+    def test_parse_findings_reads_the_whole_report(self):
+        def parsed_findings():
+            yield Finding(title="first")
+            msg = "broken report"
+            raise ValueError(msg)
+
+        parser = Mock(get_findings=Mock(return_value=parsed_findings()))
+        # the error is raised before the first finding is matched to the findings of the test
+        with self.assertRaises(ValidationError):
+            self.reimporter.parse_findings_static_test_type(None, parser)
+
 
 class FlexibleImportTestAPI(DojoAPITestCase):
     def __init__(self, *args, **kwargs):
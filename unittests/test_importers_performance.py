@@ -4,6 +4,8 @@ from unittest.mock import patch
 
 from crum import impersonate
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import override_settings
 from django.utils import timezone
 
 from dojo.decorators import dojo_async_task_counter
@@ -34,10 +36,15 @@ NPM_AUDIT_NO_VULN_FILENAME = get_unit_tests_scans_path("npm_audit") / "one_vuln.
 NPM_AUDIT_SCAN_TYPE = "NPM Audit Scan"
 
 
+# the product grade calculations are collapsed per product within this window, which changes the
+# number of celery tasks, so it is pinned here and the pending calculations are cleared from the cache
+@override_settings(PRODUCT_GRADE_DEBOUNCE_SECONDS=60)
 class TestDojoImporterPerformance(DojoTestCase):
 
     def setUp(self):
         super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
         self.system_settings(enable_webhooks_notifications=False)
         self.system_settings(enable_product_grade=False)
         self.system_settings(enable_github=False)
@@ -154,12 +161,12 @@ class TestDojoImporterPerformance(DojoTestCase):
 
     def test_import_reimport_reimport_performance(self):
         self.import_reimport_performance(
-            expected_num_queries1=603,
-            expected_num_async_tasks1=15,
-            expected_num_queries2=489,
-            expected_num_async_tasks2=23,
-            expected_num_queries3=347,
-            expected_num_async_tasks3=20,
+            expected_num_queries1=209,
+            expected_num_async_tasks1=12,
+            expected_num_queries2=149,
+            expected_num_async_tasks2=19,
+            expected_num_queries3=135,
+            expected_num_async_tasks3=17,
         )
 
     @patch("dojo.decorators.we_want_async", return_value=False)
@@ -172,12 +179,12 @@ class TestDojoImporterPerformance(DojoTestCase):
         so we patch the we_want_async decorator to always return False.
         """
         self.import_reimport_performance(
-            expected_num_queries1=673,
-            expected_num_async_tasks1=25,
-            expected_num_queries2=544,
-            expected_num_async_tasks2=30,
-            expected_num_queries3=387,
-            expected_num_async_tasks3=25,
+            expected_num_queries1=229,
+            expected_num_async_tasks1=13,
+            expected_num_queries2=159,
+            expected_num_async_tasks2=19,
+            expected_num_queries3=144,
+            expected_num_async_tasks3=17,
         )
 
     @patch("dojo.decorators.we_want_async", return_value=False)
@@ -191,10 +198,10 @@ class TestDojoImporterPerformance(DojoTestCase):
         """
         self.system_settings(enable_product_grade=True)
         self.import_reimport_performance(
-            expected_num_queries1=673,
-            expected_num_async_tasks1=25,
-            expected_num_queries2=544,
-            expected_num_async_tasks2=30,
-            expected_num_queries3=387,
-            expected_num_async_tasks3=25,
+            expected_num_queries1=229,
+            expected_num_async_tasks1=13,
+            expected_num_queries2=159,
+            expected_num_async_tasks2=19,
+            expected_num_queries3=144,
+            expected_num_async_tasks3=17,
         )
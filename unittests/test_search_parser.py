@@ -1,4 +1,10 @@
-from dojo.search.views import parse_search_query
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from watson.models import SearchEntry
+
+from dojo.models import Endpoint, Finding, User
+from dojo.search.views import apply_search_index_filter, parse_search_query
+from dojo.utils import update_finding_search_index_entries
 
 from .dojo_test_case import DojoTestCase
 
@@ -66,3 +72,27 @@ class TestSearch(DojoTestCase):
         self.assertEqual(operators["cve"][0], "CVE-2020-1234")
         self.assertEqual(len(keywords), 1)
         self.assertEqual(keywords[0], "jquery")
+
+
+class TestSearchIndexFilter(DojoTestCase):
+    fixtures = ["dojo_testdata.json"]
+
+    def test_apply_search_index_filter(self):
+        endpoint = Endpoint.objects.create(host="searchindex.example.com", product_id=1)
+        Endpoint.objects.create(host="other.example.com", product_id=1)
+        self.assertEqual([endpoint], list(apply_search_index_filter(Endpoint.objects.all(), "searchindex")))
+
+    def test_search_part_of_host(self):
+        endpoint = Endpoint.objects.create(host="www.searchpart.com", product_id=1)
+        Endpoint.objects.create(host="other.example.com", product_id=1)
+        self.client.force_login(User.objects.get(username="admin"))
+        response = self.client.get(reverse("simple_search"), {"query": "searchpart"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([endpoint], list(response.context["endpoints"]))
+
+    def test_update_search_index_entries(self):
+        finding = Finding.objects.get(id=2)
+        Finding.objects.filter(id=finding.id).update(active=False)
+        update_finding_search_index_entries([finding.id])
+        entry = SearchEntry.objects.get(content_type=ContentType.objects.get_for_model(Finding), object_id_int=finding.id)
+        self.assertIn("Inactive", entry.meta["status"])
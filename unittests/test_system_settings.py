@@ -1,3 +1,4 @@
+from dojo.middleware import System_Settings_Manager
 from dojo.models import System_Settings
 
 from .dojo_test_case import DojoTestCase
@@ -26,3 +27,27 @@ class TestSystemSettings(DojoTestCase):
         system_settings.save()
         system_settings = System_Settings.objects.get(no_cache=True)
         self.assertEqual(system_settings.enable_jira, True)
+
+    def test_system_settings_process_cache(self):
+        System_Settings_Manager._process_cache = None
+        self.addCleanup(setattr, System_Settings_Manager, "_process_cache", None)
+        with self.settings(SYSTEM_SETTINGS_CACHE_TIMEOUT=60):
+            system_settings = System_Settings.objects.get()
+            with self.assertNumQueries(0):
+                cached = System_Settings.objects.get()
+            self.assertEqual(system_settings.pk, cached.pk)
+
+            # every caller gets a copy, so changes that are not saved are not seen by the others
+            cached.enable_jira = not system_settings.enable_jira
+            self.assertEqual(system_settings.enable_jira, System_Settings.objects.get().enable_jira)
+
+            # saving the system settings invalidates the cache of every process
+            system_settings.enable_jira = not system_settings.enable_jira
+            system_settings.save()
+            reloaded = System_Settings.objects.get()
+            self.assertIsNot(system_settings, reloaded)
+            self.assertEqual(system_settings.enable_jira, reloaded.enable_jira)
+
+        # without SYSTEM_SETTINGS_CACHE_TIMEOUT, the system settings are loaded from the database
+        with self.assertNumQueries(1):
+            System_Settings.objects.get()
@@ -1,8 +1,12 @@
 import logging
 import random
+from unittest.mock import patch
 
-from dojo.models import Finding, Product, Test
-from dojo.product.helpers import propagate_tags_on_product_sync
+from django.db.models import signals
+from django.test import override_settings
+
+from dojo.models import Endpoint, Engagement, Finding, Product, Test
+from dojo.product.helpers import propagate_tags_on_product, propagate_tags_on_product_sync
 
 from .dojo_test_case import DojoAPITestCase, get_unit_tests_scans_path
 
@@ -416,3 +420,45 @@ class InheritedTagsTests(DojoAPITestCase):
         self.assertEqual(product_tags_post_addition, self._convert_instance_tags_to_list(objects.get("endpoint")))
         self.assertEqual(product_tags_post_addition, self._convert_instance_tags_to_list(objects.get("test")))
         self.assertEqual(product_tags_post_addition, self._convert_instance_tags_to_list(objects.get("finding")))
+
+    @override_settings(PRODUCT_TAG_PROPAGATION_CHUNK_SIZE=2)
+    def test_propagate_tags_on_product_without_saving_objects(self):
+        objects = self._import_and_return_objects()
+        objects.get("finding").tags.add("finding_only_tag")
+        saved = []
+
+        def record_save(sender, instance, **kwargs):
+            saved.append(instance)
+
+        signals.post_save.connect(record_save)
+        self.addCleanup(signals.post_save.disconnect, record_save)
+        self.product.tags.remove("inherit")
+        self.product.tags.add("more")
+        propagate_tags_on_product_sync(self.product)
+        self.assertFalse([instance for instance in saved if isinstance(instance, Engagement | Test | Finding | Endpoint)])
+
+        product_tags = self._convert_instance_tags_to_list(self.product)
+        for name in ["engagement", "endpoint", "test"]:
+            self.assertEqual(product_tags, self._convert_instance_tags_to_list(objects.get(name)))
+            self.assertEqual(product_tags, [tag.name for tag in objects.get(name).inherited_tags.all()])
+        for finding in Finding.objects.filter(test=objects.get("test")):
+            self.assertEqual(product_tags, [tag.name for tag in finding.inherited_tags.all()])
+        # the tags of the finding itself are kept
+        self.assertEqual(["finding_only_tag", *product_tags], self._convert_instance_tags_to_list(objects.get("finding")))
+        # the tag counts are kept up to date, and the tags that are no longer used are deleted
+        tag_model = Finding.tags.tag_model
+        self.assertFalse(tag_model.objects.filter(name="inherit").exists())
+        self.assertEqual(Finding.objects.filter(tags__name="more").count(), tag_model.objects.get(name="more").count)
+
+    def test_propagate_tags_on_product_creates_tags_before_the_chunks(self):
+        objects = self._import_and_return_objects()
+        with patch("dojo.product.helpers.propagate_tags_on_object_chunk") as propagate_tags_on_object_chunk:
+            self.product.tags.add("new_product_tag")
+            propagate_tags_on_product(self.product.id, sync=True)
+
+        # the chunks only add the tags to their objects, so they do not race to create the same tags
+        self.assertTrue(propagate_tags_on_object_chunk.called)
+        for model in [Engagement, Test, Finding, Endpoint]:
+            for field in [model.tags, model.inherited_tags]:
+                self.assertTrue(field.tag_model.objects.filter(name="new_product_tag").exists())
+        self.assertNotIn("new_product_tag", self._convert_instance_tags_to_list(objects.get("finding")))
@@ -1,6 +1,13 @@
+import calendar
 import logging
 from contextlib import contextmanager
-from unittest.mock import Mock, patch
+from datetime import datetime, timedelta
+from unittest.mock import Mock, call, patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from dojo.authorization.roles_permissions import Roles
 from dojo.models import (
@@ -13,16 +20,33 @@ from dojo.models import (
     Dojo_User,
     Endpoint,
     Engagement,
+    Finding,
+    Finding_Daily_Severity_Snapshot,
     Notifications,
     Product,
+    Product_Counters,
     Product_Type,
     Role,
     System_Settings,
     Test,
     Test_Import,
     Test_Import_Finding_Action,
+    Test_Type,
+)
+from dojo.product.helpers import update_product_counters
+from dojo.tasks import update_finding_daily_severity_snapshots_task
+from dojo.utils import (
+    Product_Tab,
+    async_delete,
+    calculate_grade,
+    dojo_crypto_encrypt,
+    get_open_findings_burndown,
+    get_period_counts,
+    grade_product,
+    prepare_for_view,
+    sla_compute_and_notify,
+    user_post_save,
 )
-from dojo.utils import dojo_crypto_encrypt, prepare_for_view, user_post_save
 
 from .dojo_test_case import DojoTestCase
 
@@ -177,6 +201,246 @@ class TestUtils(DojoTestCase):
         mock_member.assert_not_called()
         save_mock_member.save.assert_not_called()
 
+    def test_open_findings_burndown(self):
+        today = timezone.localdate()
+        product = self.create_product("burndown", prod_type=self.create_product_type("burndown"))
+        test = Test.objects.create(
+            engagement=self.create_engagement("burndown", product),
+            test_type=Test_Type.objects.get_or_create(name="ZAP Scan")[0],
+            target_start=timezone.now(),
+            target_end=timezone.now(),
+        )
+        reporter = Dojo_User.objects.create(username="burndown")
+        Finding.objects.bulk_create([
+            # open since 10 days
+            Finding(test=test, reporter=reporter, title="open", severity="High", date=today - timedelta(days=10)),
+            # open before the window, mitigated 5 days ago
+            Finding(test=test, reporter=reporter, title="mitigated", severity="High", date=today - timedelta(days=100),
+                    active=False, is_mitigated=True, mitigated=timezone.now() - timedelta(days=5)),
+            # simple risk acceptance is dated at the creation of the finding
+            Finding(test=test, reporter=reporter, title="accepted", severity="Critical", date=today - timedelta(days=3),
+                    active=False, risk_accepted=True),
+            # never counted
+            Finding(test=test, reporter=reporter, title="false positive", severity="Low", date=today - timedelta(days=20),
+                    active=False, false_p=True),
+            Finding(test=test, reporter=reporter, title="duplicate", severity="High", date=today - timedelta(days=20),
+                    duplicate=True),
+        ])
+
+        burndown = get_open_findings_burndown(product)
+
+        self.assertEqual(455, Finding_Daily_Severity_Snapshot.objects.filter(product=product).count())
+
+        def open_count(severity, days_ago):
+            day = datetime.combine(today - timedelta(days=days_ago), datetime.min.time()).timestamp() * 1000
+            return dict(burndown[severity])[day]
+
+        self.assertEqual(91, len(burndown["High"]))
+        self.assertEqual(1, open_count("High", 90))
+        self.assertEqual(2, open_count("High", 10))
+        self.assertEqual(2, open_count("High", 6))
+        self.assertEqual(1, open_count("High", 5))
+        self.assertEqual(1, open_count("High", 0))
+        self.assertEqual(0, open_count("Critical", 4))
+        self.assertEqual(1, open_count("Critical", 3))
+        self.assertEqual(0, open_count("Critical", 0))
+        self.assertEqual(0, open_count("Low", 20))
+        self.assertEqual(2, burndown["y_max"])
+        self.assertEqual(0, burndown["y_min"])
+
+        snapshot = Finding_Daily_Severity_Snapshot.objects.get(product=product, date=today - timedelta(days=5), severity="High")
+        self.assertEqual((0, 1, 0, 1), (snapshot.opened, snapshot.closed, snapshot.risk_accepted, snapshot.active))
+
+        # the snapshots are complete now, so they are read without being computed again
+        with self.assertNumQueries(3):
+            self.assertEqual(burndown, get_open_findings_burndown(product))
+
+        # changing a finding marks the snapshots of its product as stale, so all days are computed again
+        Product_Counters.objects.create(product=product, snapshots_stale=False)
+        finding = Finding.objects.get(test=test, title="open")
+        finding.severity = "Critical"
+        finding.save()
+        self.assertTrue(Product_Counters.objects.get(product=product).snapshots_stale)
+        burndown = get_open_findings_burndown(product)
+        self.assertFalse(Product_Counters.objects.get(product=product).snapshots_stale)
+        self.assertEqual(1, open_count("High", 10))
+        self.assertEqual(1, open_count("Critical", 10))
+
+        # or by the hourly task, when the product is not viewed in the meantime
+        finding.delete()
+        self.assertTrue(Product_Counters.objects.get(product=product).snapshots_stale)
+        update_finding_daily_severity_snapshots_task()
+        self.assertFalse(Product_Counters.objects.get(product=product).snapshots_stale)
+        snapshot = Finding_Daily_Severity_Snapshot.objects.get(product=product, date=today - timedelta(days=10), severity="Critical")
+        self.assertEqual(0, snapshot.active)
+
+    def test_get_period_counts(self):
+        tz = timezone.get_current_timezone()
+        product = self.create_product("period counts", prod_type=self.create_product_type("period counts"))
+        test = Test.objects.create(
+            engagement=self.create_engagement("period counts", product),
+            test_type=Test_Type.objects.get_or_create(name="ZAP Scan")[0],
+            target_start=timezone.now(),
+            target_end=timezone.now(),
+        )
+        reporter = Dojo_User.objects.create(username="period counts")
+        Finding.objects.bulk_create([
+            Finding(test=test, reporter=reporter, title="january", severity="High", date=datetime(2024, 1, 31).date()),
+            Finding(test=test, reporter=reporter, title="february", severity="Critical", date=datetime(2024, 2, 1).date(),
+                    active=False, is_mitigated=True, mitigated=datetime(2024, 3, 15, 12, tzinfo=tz)),
+            Finding(test=test, reporter=reporter, title="march", severity="Low", date=datetime(2024, 3, 31).date()),
+            Finding(test=test, reporter=reporter, title="info", severity="Info", date=datetime(2024, 3, 1).date()),
+        ])
+        findings = Finding.objects.filter(test=test)
+
+        with self.assertNumQueries(2):
+            counts = get_period_counts(findings, findings.filter(is_mitigated=True), None, 3, datetime(2024, 2, 10), relative_delta="months")
+
+        def period(date, *counts):
+            timestamp = calendar.timegm(date.timetuple()) * 1000
+            return [timestamp, datetime(date.year, date.month, date.day, tzinfo=tz), *counts]
+
+        self.assertEqual([
+            ["Timestamp", "Date", "S0", "S1", "S2", "S3", "Total", "Closed"],
+            period(datetime(2024, 1, 1), 0, 1, 0, 0, 1, 0),
+            period(datetime(2024, 2, 1), 1, 0, 0, 0, 1, 0),
+            period(datetime(2024, 3, 1), 0, 0, 0, 1, 1, 1),
+            period(datetime(2024, 4, 1), 0, 0, 0, 0, 0, 0),
+        ], counts["opened_per_period"])
+        self.assertEqual([
+            ["Timestamp", "Date", "S0", "S1", "S2", "S3", "Total", "Closed"],
+            period(datetime(2024, 1, 1), 0, 1, 0, 0, 1),
+            period(datetime(2024, 2, 1), 0, 1, 0, 0, 1),
+            period(datetime(2024, 3, 1), 0, 1, 0, 1, 2),
+            period(datetime(2024, 4, 1), 0, 1, 0, 1, 2),
+        ], counts["active_per_period"])
+        self.assertEqual([0, 0, 0, 0, 0], counts["accepted_per_period"][1][2:])
+
+    @patch("dojo.product.helpers.update_product_counters_task")
+    def test_product_tab_counters(self, mock_update_product_counters_task):
+        product = self.create_product("counters", prod_type=self.create_product_type("counters"))
+        pending_key = f"update_product_counters_pending_{product.id}"
+        cache.delete(pending_key)
+        # the pending recount would collapse the recounts of other tests using the same product id
+        self.addCleanup(cache.delete, pending_key)
+        test = Test.objects.create(
+            engagement=self.create_engagement("counters", product),
+            test_type=Test_Type.objects.get_or_create(name="ZAP Scan")[0],
+            target_start=timezone.now(),
+            target_end=timezone.now(),
+        )
+        reporter = Dojo_User.objects.create(username="counters")
+        Finding.objects.bulk_create([
+            Finding(test=test, reporter=reporter, title="open", severity="High"),
+            Finding(test=test, reporter=reporter, title="false positive", severity="High", active=False, false_p=True),
+        ])
+
+        product_tab = Product_Tab(product)
+        self.assertEqual((1, 1, 0, 0), (product_tab.engagements(), product_tab.findings(), product_tab.endpoints(), product_tab.endpoint_hosts()))
+        # the stored counters are read with a single query
+        with self.assertNumQueries(1):
+            self.assertEqual(1, Product_Tab(product).findings())
+
+        # saving a finding marks the counters as stale, so they are counted again in the background,
+        # once within the window
+        Finding.objects.create(test=test, reporter=reporter, title="another", severity="Low")
+        self.assertTrue(Product_Counters.objects.get(product=product).stale)
+        with self.settings(PRODUCT_COUNTERS_DEBOUNCE_SECONDS=60):
+            self.assertEqual(1, Product_Tab(product).findings())
+            self.assertEqual(1, Product_Tab(product).findings())
+        self.assertEqual([call(product.id, countdown=60)], mock_update_product_counters_task.call_args_list)
+        update_product_counters(product)
+        self.assertFalse(Product_Counters.objects.get(product=product).stale)
+        self.assertEqual(2, Product_Tab(product).findings())
+
+        # deleting a test marks the counters as stale once, not once for every deleted finding
+        with CaptureQueriesContext(connection) as queries:
+            test.delete()
+        self.assertEqual(1, len([query for query in queries if query["sql"].startswith('UPDATE "dojo_product_counters"')]))
+        self.assertTrue(Product_Counters.objects.get(product=product).stale)
+        update_product_counters(product)
+        self.assertEqual(0, Product_Tab(product).findings())
+
+        # so do the chunks of objects deleted in the background
+        test = Test.objects.create(engagement=Engagement.objects.get(product=product), test_type=test.test_type, target_start=timezone.now(), target_end=timezone.now())
+        findings = [Finding.objects.create(test=test, reporter=reporter, title=f"finding {i}", severity="Low") for i in range(3)]
+        update_product_counters(product)
+        self.assertEqual(3, Product_Tab(product).findings())
+        with CaptureQueriesContext(connection) as queries:
+            async_delete().delete_chunk(findings, sync=True)
+        self.assertEqual(1, len([query for query in queries if query["sql"].startswith('UPDATE "dojo_product_counters"')]))
+        update_product_counters(product)
+        self.assertEqual(0, Product_Tab(product).findings())
+
+    @patch("dojo.utils.create_notification")
+    def test_sla_compute_and_notify(self, mock_notification):
+        System_Settings.objects.update(enable_finding_sla=True, enable_notify_sla_active=True, enable_notify_sla_exponential_backoff=False)
+        today = timezone.now().date()
+        product = self.create_product("sla", prod_type=self.create_product_type("sla"))
+        test = Test.objects.create(
+            engagement=self.create_engagement("sla", product),
+            test_type=Test_Type.objects.get_or_create(name="ZAP Scan")[0],
+            target_start=timezone.now(),
+            target_end=timezone.now(),
+        )
+        reporter = Dojo_User.objects.create(username="sla")
+
+        def finding(title, days_left, severity="High"):
+            return Finding(test=test, reporter=reporter, title=title, severity=severity, date=today,
+                           sla_expiration_date=today + timedelta(days=days_left))
+
+        Finding.objects.bulk_create([
+            finding("prebreach", 2),
+            finding("breaching", 0),
+            finding("breached", -4),
+            # outside of the notification window
+            finding("breached long ago", -30),
+            finding("far from breach", 30),
+            finding("info", 0, severity="Info"),
+        ])
+
+        sla_compute_and_notify(sync=True)
+
+        titles = sorted(call.kwargs["title"] for call in mock_notification.call_args_list)
+        breached, breaching, prebreach = (Finding.objects.get(title=title).id for title in ["breached", "breaching", "prebreach"])
+        self.assertEqual(sorted([
+            f"Finding {breached} - SLA breached by 4 days! Overdue notice",
+            f"Finding {breaching} - SLA is breaching today",
+            f"Finding {prebreach} - SLA pre-breach warning - 2 day(s) left",
+            "SLA alert (breached): product type 'sla', product 'sla'",
+            "SLA alert (breaching): product type 'sla', product 'sla'",
+            "SLA alert (prebreach): product type 'sla', product 'sla'",
+        ]), titles)
+
+    @patch("dojo.utils.calculate_grade_task")
+    def test_calculate_grade_debounced(self, mock_calculate_grade_task):
+        product = self.create_product("grade", prod_type=self.create_product_type("grade"))
+        other_product = self.create_product("other grade", prod_type=product.prod_type)
+        pending_keys = [f"calculate_grade_pending_{product.id}", f"calculate_grade_pending_{other_product.id}"]
+        cache.delete_many(pending_keys)
+        # the pending calculations would collapse the calculations of other tests using the same product ids
+        self.addCleanup(cache.delete_many, pending_keys)
+
+        # without a user the grade is calculated in the background, once per product within the window
+        with self.settings(PRODUCT_GRADE_DEBOUNCE_SECONDS=60):
+            calculate_grade(product)
+            calculate_grade(product)
+            calculate_grade(other_product)
+        self.assertEqual([
+            call(product, countdown=60),
+            call(other_product, countdown=60),
+        ], mock_calculate_grade_task.call_args_list)
+
+        mock_calculate_grade_task.reset_mock()
+        calculate_grade(product, sync=True)
+        mock_calculate_grade_task.assert_called_once_with(product, sync=True)
+
+    def test_grade_product(self):
+        product_grade = "def grade_product(crit, high, med, low):\n    return 100 - crit * 10 - high * 5 - med * 2 - low"
+        self.assertEqual(70, grade_product(product_grade, 1, 2, 3, 4))
+        self.assertEqual(100, grade_product(product_grade, 0, 0, 0, 0))
+        self.assertIsNone(grade_product("", 1, 2, 3, 4))
+
 
 class assertNumOfModelsCreated:
     def __init__(self, test_case, queryset, num):
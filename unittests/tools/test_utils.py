@@ -0,0 +1,88 @@
+import json
+from io import BytesIO, StringIO
+
+from defusedxml import EntitiesForbidden
+
+from dojo.tools.utils import iterparse_json, iterparse_xml
+from unittests.dojo_test_case import DojoTestCase
+
+REPORT = b"""<?xml version="1.0"?>
+<report version="1">
+    <site name="a">
+        <alerts>
+            <alertitem><alert>one</alert></alertitem>
+            <alertitem><alert>two</alert></alertitem>
+        </alerts>
+        <other><alertitem><alert>ignored</alert></alertitem></other>
+    </site>
+    <site name="b">
+        <alerts>
+            <alertitem><alert>three</alert></alertitem>
+        </alerts>
+    </site>
+</report>
+"""
+
+
+class TestIterparseXml(DojoTestCase):
+    def test_yields_complete_matching_elements(self):
+        alerts = [item.findtext("alert") for item in iterparse_xml(BytesIO(REPORT), ["site/alerts/alertitem"])]
+        self.assertEqual(["one", "two", "three"], alerts)
+
+    def test_detaches_elements(self):
+        elements = iterparse_xml(BytesIO(REPORT), ["site/alerts/alertitem"], yield_root=True)
+        root = next(elements)
+        self.assertEqual("report", root.tag)
+        self.assertEqual("1", root.attrib["version"])
+        self.assertEqual(3, len(list(elements)))
+        # the elements that were parsed completely are not kept in the tree
+        self.assertEqual(0, len(root))
+
+    def test_forbids_entities(self):
+        report = b"""<?xml version="1.0"?>
+<!DOCTYPE report [<!ENTITY xxe SYSTEM "file:///etc/passwd">]>
+<report><issue>&xxe;</issue></report>
+"""
+        with self.assertRaises(EntitiesForbidden):
+            list(iterparse_xml(BytesIO(report), ["issue"]))
+
+
+JSON_REPORT = """{
+    "SchemaVersion": 2,
+    "Metadata": {"Comment": "braces { and [ and escaped \\" quotes ] } are skipped", "Numbers": [1, 2.5e3, -3]},
+    "Results": [
+        {"Target": "a", "Vulnerabilities": [{"ID": "CVE-1", "Score": 7.5}, {"ID": "CVE-\\u00e9"}]},
+        {"Target": "b", "Vulnerabilities": []},
+        {"Target": "c", "Vulnerabilities": [{"ID": "CVE-3", "Fixed": null, "Tags": ["\\\\"]}]}
+    ],
+    "ArtifactName": "image"
+}"""
+
+
+class TestIterparseJson(DojoTestCase):
+    def test_yields_matching_values_with_their_path(self):
+        for chunk_size in (1, 3, 65536):
+            with self.subTest(chunk_size=chunk_size):
+                values = list(iterparse_json(StringIO(JSON_REPORT), ["SchemaVersion", "Results[].Vulnerabilities[]", "ArtifactName"], chunk_size=chunk_size))
+                self.assertEqual([
+                    (("SchemaVersion",), 2),
+                    (("Results", 0, "Vulnerabilities", 0), {"ID": "CVE-1", "Score": 7.5}),
+                    (("Results", 0, "Vulnerabilities", 1), {"ID": "CVE-\u00e9"}),
+                    (("Results", 2, "Vulnerabilities", 0), {"ID": "CVE-3", "Fixed": None, "Tags": ["\\"]}),
+                    (("ArtifactName",), "image"),
+                ], values)
+
+    def test_binary_file(self):
+        report = json.dumps([{"Target": "\u00e9"}, {"Target": "b"}]).encode("utf-8-sig")
+        values = list(iterparse_json(BytesIO(report), ["[].Target"], chunk_size=1))
+        self.assertEqual([((0, "Target"), "\u00e9"), ((1, "Target"), "b")], values)
+
+    def test_same_values_as_json_load(self):
+        data = json.loads(JSON_REPORT)
+        self.assertEqual(data["Results"], [value for _, value in iterparse_json(StringIO(JSON_REPORT), ["Results[]"])])
+        self.assertEqual([], list(iterparse_json(StringIO(JSON_REPORT), ["Results[].Missing[]", "Metadata[]"])))
+
+    def test_invalid_json(self):
+        for report in ("", "{", '{"Results": [{"Target": "a"} {}]}', '{"Results": [{"Target": "a"}'):
+            with self.subTest(report=report), self.assertRaises(ValueError):
+                list(iterparse_json(StringIO(report), ["Results[]"], chunk_size=4))
@@ -7,14 +7,14 @@ class TestZapParser(DojoTestCase):
     def test_parse_no_findings(self):
         with (get_unit_tests_scans_path("zap") / "empty_2.9.0.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(0, len(findings))
 
     def test_parse_some_findings(self):
         with (get_unit_tests_scans_path("zap") / "some_2.9.0.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(7, len(findings))
             for finding in findings:
@@ -25,7 +25,7 @@ class TestZapParser(DojoTestCase):
     def test_parse_some_findings_0(self):
         with (get_unit_tests_scans_path("zap") / "0_zap_sample.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(4, len(findings))
             for finding in findings:
@@ -36,7 +36,7 @@ class TestZapParser(DojoTestCase):
     def test_parse_some_findings_1(self):
         with (get_unit_tests_scans_path("zap") / "1_zap_sample_0_and_new_absent.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(4, len(findings))
             for finding in findings:
@@ -47,7 +47,7 @@ class TestZapParser(DojoTestCase):
     def test_parse_some_findings_2(self):
         with (get_unit_tests_scans_path("zap") / "2_zap_sample_0_and_new_endpoint.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(4, len(findings))
             for finding in findings:
@@ -58,7 +58,7 @@ class TestZapParser(DojoTestCase):
     def test_parse_some_findings_3(self):
         with (get_unit_tests_scans_path("zap") / "3_zap_sampl_0_and_different_severities.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(4, len(findings))
             for finding in findings:
@@ -69,7 +69,7 @@ class TestZapParser(DojoTestCase):
     def test_parse_some_findings_5(self):
         with (get_unit_tests_scans_path("zap") / "5_zap_sample_one.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(2, len(findings))
             for finding in findings:
@@ -84,7 +84,7 @@ class TestZapParser(DojoTestCase):
         """
         with (get_unit_tests_scans_path("zap") / "dvwa_baseline_dojo.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             self.assertIsInstance(findings, list)
             self.assertEqual(19, len(findings))
             for finding in findings:
@@ -119,7 +119,7 @@ class TestZapParser(DojoTestCase):
         """
         with (get_unit_tests_scans_path("zap") / "zap-results-first-scan.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             for finding in findings:
                 for endpoint in finding.unsaved_endpoints:
                     endpoint.clean()
@@ -160,7 +160,7 @@ class TestZapParser(DojoTestCase):
         """Generated with OWASP Juicy shop"""
         with (get_unit_tests_scans_path("zap") / "juicy2.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             for finding in findings:
                 for endpoint in finding.unsaved_endpoints:
                     endpoint.clean()
@@ -200,7 +200,7 @@ class TestZapParser(DojoTestCase):
     def test_parse_xml_plus_format(self):
         with (get_unit_tests_scans_path("zap") / "zap-xml-plus-format.xml").open(encoding="utf-8") as testfile:
             parser = ZapParser()
-            findings = parser.get_findings(testfile, Test())
+            findings = list(parser.get_findings(testfile, Test()))
             for finding in findings:
                 for endpoint in finding.unsaved_endpoints:
                     endpoint.clean()